@@ -0,0 +1 @@
+"""Performance benchmarks for tinyops operations (development tooling, not shipped)."""
@@ -0,0 +1,59 @@
+"""Shared timing helpers for the benchmark scripts.
+
+Benchmarks are development tooling: like tests, they may import reference
+libraries, and they are run directly (``python -m benchmarks.<name>``)
+rather than collected by pytest.
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+
+from tinygrad import Device, Tensor
+
+
+def graph_node_count(result: Tensor | tuple[Tensor, ...]) -> int:
+    """Number of distinct lazy-graph nodes reachable from *result* before scheduling."""
+    outputs = result if isinstance(result, tuple) else (result,)
+    nodes: set = set()
+    for output in outputs:
+        nodes.update(output.uop.toposort())
+    return len(nodes)
+
+
+def _synchronize() -> None:
+    Device[Device.DEFAULT].synchronize()
+
+
+def time_realized(build: Callable[[], Tensor | tuple[Tensor, ...]], repeats: int = 3) -> tuple[float, int]:
+    """Median wall time (seconds) to build and realize a graph, plus its node count.
+
+    The first call is a warm-up that also pays kernel compilation, so the
+    reported time measures steady-state scheduling plus execution.
+    """
+    warm_up = build()
+    node_count = graph_node_count(warm_up)
+    Tensor.realize(*(warm_up if isinstance(warm_up, tuple) else (warm_up,)))
+    _synchronize()
+
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = build()
+        Tensor.realize(*(result if isinstance(result, tuple) else (result,)))
+        _synchronize()
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations), node_count
+
+
+_COLUMN_WIDTH = 18
+
+
+def print_row(cells: tuple) -> None:
+    """Print one fixed-width table row immediately, so long sweeps report progressively."""
+    print("".join(str(cell).rjust(_COLUMN_WIDTH) for cell in cells), flush=True)
+
+
+def format_seconds(duration: float | None) -> str:
+    """Render *duration* in milliseconds, or ``-`` when the case was skipped."""
+    return "-" if duration is None else f"{duration * 1e3:.2f} ms"
@@ -0,0 +1,89 @@
+"""Batched Cholesky factorization and solve versus the previous one-matrix-at-a-time factorization.
+
+Factors ``(batch, n, n)`` stacks of random symmetric positive-definite
+matrices and solves one right-hand side per matrix, reporting steady-state
+milliseconds per call. The previous implementation accepted a single 2D
+matrix and realized every column, so it is timed as a Python loop over
+the batch (up to ``--reference-limit`` matrices).
+
+Usage::
+
+    python -m benchmarks.cholesky_benchmark --batches 1 100 1000 --sizes 4 8 32 --reference-limit 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+from tinygrad import Tensor
+
+from benchmarks._harness import format_seconds, print_row, time_realized
+from tinyops.ops.linear_algebra.cholesky_decomposition import cholesky_decomposition
+from tinyops.ops.linear_algebra.cholesky_solve import cholesky_solve
+
+
+def _column_by_column_cholesky(matrix: Tensor) -> Tensor:
+    """The previous factorization: one realized column at a time, concatenating all earlier columns."""
+    size = matrix.shape[0]
+    columns = []
+    for column_index in range(size):
+        previous_columns = Tensor.cat(*columns, dim=1) if columns else Tensor.zeros(size, 0)
+        squared_sum = (previous_columns[column_index, :] * previous_columns[column_index, :]).sum()
+        diagonal_element = (matrix[column_index, column_index] - squared_sum).sqrt()
+        if column_index < size - 1:
+            cross_product = previous_columns[column_index + 1 :, :] @ previous_columns[column_index, :]
+            below_diagonal = (matrix[column_index + 1 :, column_index] - cross_product) / diagonal_element
+        else:
+            below_diagonal = Tensor.zeros(0)
+        new_column = Tensor.cat(Tensor.zeros(column_index), diagonal_element.reshape(1), below_diagonal).realize()
+        columns.append(new_column.unsqueeze(1))
+    return Tensor.cat(*columns, dim=1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 8, 32])
+    parser.add_argument("--reference-limit", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    print_row(("batch", "n", "factor", "factor + solve", "previous factor"))
+    for size in arguments.sizes:
+        for batch in arguments.batches:
+            noise = np.random.randn(batch, size, size).astype(np.float32)
+            values = noise @ noise.transpose(0, 2, 1) + size * np.eye(size, dtype=np.float32)
+            matrices = Tensor(values).realize()
+            constants = Tensor(np.random.randn(batch, size).astype(np.float32)).realize()
+            factor_duration, _ = time_realized(
+                lambda matrices=matrices: cholesky_decomposition(matrices), arguments.repeats
+            )
+            solve_duration, _ = time_realized(
+                lambda matrices=matrices, constants=constants: cholesky_solve(
+                    cholesky_decomposition(matrices), constants
+                ),
+                arguments.repeats,
+            )
+
+            reference_duration = None
+            if batch <= arguments.reference_limit:
+                single_matrices = [Tensor(matrix).realize() for matrix in values]
+                _column_by_column_cholesky(single_matrices[0]).realize()
+                start = time.perf_counter()
+                for matrix in single_matrices:
+                    _column_by_column_cholesky(matrix).realize()
+                reference_duration = time.perf_counter() - start
+
+            print_row(
+                (
+                    batch,
+                    size,
+                    format_seconds(factor_duration),
+                    format_seconds(solve_duration),
+                    format_seconds(reference_duration),
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Multichannel FIR filtering: one batched convolution_1d versus a per-channel loop.
+
+Reports lazy-graph node count and steady-state wall time for a shared FIR
+kernel applied to every channel of a ``(1, channels, samples)`` buffer.
+
+Usage::
+
+    python -m benchmarks.convolution_1d_benchmark --channels 8 64 512 --samples 4096 --taps 31
+"""
+
+import argparse
+
+from tinygrad import Tensor
+
+from benchmarks._harness import format_seconds, print_row, time_realized
+from tinyops.ops.signal.convolution_1d import ConvolutionMode, convolution_1d
+
+
+def _channel_loop(signal: Tensor, kernel: Tensor) -> Tensor:
+    """One call per channel followed by a stack, the pre-batched usage."""
+    channels = [
+        convolution_1d(signal[0, channel], kernel, mode=ConvolutionMode.SAME) for channel in range(signal.shape[1])
+    ]
+    return Tensor.stack(*channels).unsqueeze(0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--channels", type=int, nargs="+", default=[8, 64, 512])
+    parser.add_argument("--samples", type=int, default=4096)
+    parser.add_argument("--taps", type=int, default=31)
+    parser.add_argument("--loop-max-channels", type=int, default=64)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    kernel = Tensor.randn(arguments.taps).realize()
+    print_row(("channels", "batched nodes", "batched time", "loop nodes", "loop time"))
+    for channel_count in arguments.channels:
+        signal = Tensor.randn(1, channel_count, arguments.samples).realize()
+        batched_time, batched_nodes = time_realized(
+            lambda signal=signal: convolution_1d(signal, kernel, mode=ConvolutionMode.SAME), arguments.repeats
+        )
+
+        loop_time, loop_nodes = None, "-"
+        if channel_count <= arguments.loop_max_channels:
+            loop_time, loop_nodes = time_realized(
+                lambda signal=signal: _channel_loop(signal, kernel), arguments.repeats
+            )
+
+        print_row((channel_count, batched_nodes, format_seconds(batched_time), loop_nodes, format_seconds(loop_time)))
+
+
+if __name__ == "__main__":
+    main()
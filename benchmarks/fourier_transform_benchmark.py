@@ -0,0 +1,76 @@
+"""Iterative radix-2 FFT versus the former recursive Cooley-Tukey path.
+
+Reports lazy-graph node count and steady-state wall time for power-of-two
+lengths. The recursive baseline compiles one kernel family per recursion
+level and becomes impractical quickly, so it is capped separately.
+
+Usage::
+
+    python -m benchmarks.fourier_transform_benchmark --max-exponent 20 --recursive-max-exponent 8
+"""
+
+import argparse
+import math
+
+from tinygrad import Tensor, dtypes
+
+from benchmarks._harness import format_seconds, print_row, time_realized
+from tinyops.ops.signal.discrete_fourier_transform import discrete_fourier_transform
+
+
+def _recursive_cooley_tukey(complex_signal: Tensor) -> Tensor:
+    """The pre-iterative implementation, kept here only as a baseline."""
+    sample_count = complex_signal.shape[0]
+    if sample_count <= 1:
+        return complex_signal
+
+    even = _recursive_cooley_tukey(complex_signal[0::2])
+    odd = _recursive_cooley_tukey(complex_signal[1::2])
+
+    angle = -2 * math.pi * Tensor.arange(sample_count // 2, dtype=dtypes.float32) / sample_count
+    cosine = angle.cos()
+    sine = angle.sin()
+
+    real_part = odd[:, 0] * cosine - odd[:, 1] * sine
+    imaginary_part = odd[:, 0] * sine + odd[:, 1] * cosine
+    twiddle_product = Tensor.stack([real_part, imaginary_part], dim=1)
+    return Tensor.cat(even + twiddle_product, even - twiddle_product, dim=0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--min-exponent", type=int, default=6)
+    parser.add_argument("--max-exponent", type=int, default=20)
+    parser.add_argument("--recursive-max-exponent", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=1, help="leading batch size for the iterative path")
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    print_row(("N", "iterative nodes", "iterative time", "recursive nodes", "recursive time"))
+    for exponent in range(arguments.min_exponent, arguments.max_exponent + 1):
+        length = 2**exponent
+        signal = Tensor.randn(arguments.batch, length, 2).realize()
+        iterative_time, iterative_nodes = time_realized(
+            lambda signal=signal: discrete_fourier_transform(signal), arguments.repeats
+        )
+
+        recursive_time, recursive_nodes = None, "-"
+        if exponent <= arguments.recursive_max_exponent:
+            single = signal[0].contiguous().realize()
+            recursive_time, recursive_nodes = time_realized(
+                lambda single=single: _recursive_cooley_tukey(single), arguments.repeats
+            )
+
+        print_row(
+            (
+                f"2^{exponent}",
+                iterative_nodes,
+                format_seconds(iterative_time),
+                recursive_nodes,
+                format_seconds(recursive_time),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
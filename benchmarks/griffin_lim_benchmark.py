@@ -0,0 +1,78 @@
+"""Griffin-Lim iterations per second: JIT-captured iteration body versus an eager loop.
+
+Reconstructs ``--clips`` clips of ``--seconds`` seconds from their power
+spectrogram. The eager baseline rebuilds and schedules the STFT/ISTFT graph
+on every iteration; the JIT path replays the captured kernels after the
+first two iterations. torchaudio is reported for reference.
+
+Usage::
+
+    python -m benchmarks.griffin_lim_benchmark --frame-length 1024 --seconds 10 --iterations 16
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+import torchaudio.transforms
+from tinygrad import Device, Tensor
+
+from benchmarks._harness import print_row
+from tinyops.ops.audio.griffin_lim import GriffinLim
+from tinyops.ops.audio.spectrogram import spectrogram
+
+
+def _iterations_per_second(run, iteration_count: int) -> float:
+    start = time.perf_counter()
+    run()
+    Device[Device.DEFAULT].synchronize()
+    return iteration_count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frame-length", type=int, default=1024)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--sample-rate", type=int, default=16000)
+    parser.add_argument("--clips", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=16)
+    arguments = parser.parse_args()
+
+    sample_count = int(arguments.seconds * arguments.sample_rate)
+    waveform = np.random.randn(arguments.clips, sample_count).astype(np.float32)
+    griffin_lim = GriffinLim(arguments.frame_length, arguments.iterations)
+    power_spectrogram = spectrogram(
+        Tensor(waveform), arguments.frame_length, griffin_lim.hop_length, griffin_lim.window
+    ).realize()
+
+    # Warm-up compiles the kernels and captures the JIT for this shape.
+    griffin_lim(power_spectrogram).realize()
+    jit_rate = _iterations_per_second(lambda: griffin_lim(power_spectrogram).realize(), arguments.iterations)
+
+    magnitude = power_spectrogram.sqrt().contiguous().realize()
+    angles = Tensor.ones(*magnitude.shape, 1).pad((None,) * magnitude.ndim + ((0, 1),)).contiguous().realize()
+    previous = Tensor.zeros(*magnitude.shape, 2).contiguous().realize()
+
+    def eager_loop() -> None:
+        for _ in range(arguments.iterations):
+            griffin_lim._iterate(magnitude, angles, previous)
+
+    eager_rate = _iterations_per_second(eager_loop, arguments.iterations)
+
+    reference = torchaudio.transforms.GriffinLim(
+        n_fft=arguments.frame_length, n_iter=arguments.iterations, rand_init=False
+    )
+    reference_spectrogram = torch.from_numpy(power_spectrogram.numpy())
+    start = time.perf_counter()
+    reference(reference_spectrogram)
+    torch_rate = arguments.iterations / (time.perf_counter() - start)
+
+    print_row(("clips x seconds", "tinyops jit it/s", "eager loop it/s", "torchaudio it/s"))
+    print_row(
+        (f"{arguments.clips} x {arguments.seconds:g}", f"{jit_rate:.1f}", f"{eager_rate:.1f}", f"{torch_rate:.1f}")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""IIR filtering throughput: scan-based second-order sections versus SciPy's sequential sosfilt.
+
+Filters ``(channels, samples)`` white noise through a Butterworth low-pass
+factored into biquads and reports steady-state samples per second, along
+with the lazy-graph node count, which grows with ``log2(samples)`` rather
+than with the signal length.
+
+Usage::
+
+    python -m benchmarks.iir_filter_benchmark --samples 100000 1000000 10000000 --order 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+import scipy.signal
+from tinygrad import Tensor
+
+from benchmarks._harness import print_row, time_realized
+from tinyops.ops.signal.second_order_sections_filter import second_order_sections_filter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--channels", type=int, default=1)
+    parser.add_argument("--order", type=int, default=4)
+    parser.add_argument("--cutoff", type=float, default=0.1)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    sections = scipy.signal.butter(arguments.order, arguments.cutoff, output="sos")
+    section_tensor = Tensor(sections.astype(np.float32)).realize()
+    print_row(("samples", "graph nodes", "tinyops Msamp/s", "scipy Msamp/s"))
+    for sample_count in arguments.samples:
+        noise = np.random.randn(arguments.channels, sample_count).astype(np.float32)
+        signal = Tensor(noise).realize()
+        duration, node_count = time_realized(
+            lambda signal=signal: second_order_sections_filter(signal, section_tensor), arguments.repeats
+        )
+
+        start = time.perf_counter()
+        scipy.signal.sosfilt(sections, noise)
+        scipy_duration = time.perf_counter() - start
+
+        total_samples = arguments.channels * sample_count
+        print_row(
+            (
+                sample_count,
+                node_count,
+                f"{total_samples / duration / 1e6:.1f}",
+                f"{total_samples / scipy_duration / 1e6:.1f}",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""LU-based determinant, solve and inverse versus the implementations they replaced.
+
+For each size ``n`` the determinant, a single right-hand-side solve and the
+inverse are computed from the pivoted LU factorization and compared with
+the previous Laplace-expansion determinant (``O(n!)``, so only run up to
+``--laplace-limit``) and the 20-step Newton-Schulz (NS) inverse that
+``solve`` and ``inverse`` used before. The test matrices are random with
+singular values spread geometrically over ``--condition`` and a
+determinant of ``+-1``. Each row reports the steady-state time, the
+lazy-graph node count and the error against NumPy in float64 (relative
+for the determinant, the max residual ``|A @ x - b|`` otherwise).
+
+Usage::
+
+    python -m benchmarks.lu_decomposition_benchmark --sizes 8 64 256 1024 --laplace-limit 7 --condition 1000
+"""
+
+import argparse
+
+import numpy as np
+from tinygrad import Tensor
+
+from benchmarks._harness import format_seconds, print_row, time_realized
+from tinyops.ops.linear_algebra.determinant import determinant
+from tinyops.ops.linear_algebra.inverse import inverse
+from tinyops.ops.linear_algebra.solve_linear_system import solve_linear_system
+
+_NEWTON_SCHULZ_ITERATIONS = 20
+
+
+def _laplace_determinant(matrix: Tensor) -> Tensor:
+    """The previous determinant: cofactor expansion along the first row."""
+    size = matrix.shape[0]
+    if size == 1:
+        return matrix[0, 0]
+    if size == 2:
+        return matrix[0, 0] * matrix[1, 1] - matrix[0, 1] * matrix[1, 0]
+    total = Tensor(0.0)
+    for column in range(size):
+        minor = matrix[1:, :column].cat(matrix[1:, column + 1 :], dim=1)
+        total = total + (-1) ** column * matrix[0, column] * _laplace_determinant(minor)
+    return total
+
+
+def _newton_schulz_inverse(matrix: Tensor) -> Tensor:
+    """The previous inverse: Newton-Schulz iteration from a scaled transpose."""
+    absolute_values = matrix.abs()
+    approximation = matrix.T / (absolute_values.sum(axis=0).max() * absolute_values.sum(axis=1).max())
+    identity = Tensor.eye(matrix.shape[-1])
+    for _ in range(_NEWTON_SCHULZ_ITERATIONS):
+        approximation = approximation.matmul((2 * identity) - matrix.matmul(approximation))
+    return approximation
+
+
+def _report(size: int, name: str, build, error, repeats: int) -> None:
+    duration, node_count = time_realized(build, repeats)
+    print_row((size, name, node_count, format_seconds(duration), f"{error(build().numpy()):.2e}"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 64, 256, 1024])
+    parser.add_argument("--laplace-limit", type=int, default=7)
+    parser.add_argument("--condition", type=float, default=1e3)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    print_row(("n", "operation", "graph nodes", "time", "error"))
+    for size in arguments.sizes:
+        left, _ = np.linalg.qr(np.random.randn(size, size))
+        right, _ = np.linalg.qr(np.random.randn(size, size))
+        singular_values = np.geomspace(np.sqrt(arguments.condition), 1 / np.sqrt(arguments.condition), size)
+        values = left * singular_values @ right.T
+        right_hand_side = np.random.randn(size)
+        matrix = Tensor(values.astype(np.float32)).realize()
+        constants = Tensor(right_hand_side.astype(np.float32)).realize()
+        expected_determinant = np.linalg.det(values)
+
+        def determinant_error(result, expected=expected_determinant):
+            return abs(float(result) / expected - 1)
+
+        def solve_error(result, values=values, right_hand_side=right_hand_side):
+            return np.abs(values @ result - right_hand_side).max()
+
+        def inverse_error(result, values=values):
+            return np.abs(values @ result - np.eye(len(values))).max()
+
+        _report(size, "det LU", lambda matrix=matrix: determinant(matrix), determinant_error, arguments.repeats)
+        if size <= arguments.laplace_limit:
+            _report(
+                size,
+                "det Laplace",
+                lambda matrix=matrix: _laplace_determinant(matrix),
+                determinant_error,
+                arguments.repeats,
+            )
+        _report(
+            size,
+            "solve LU",
+            lambda matrix=matrix, constants=constants: solve_linear_system(matrix, constants),
+            solve_error,
+            arguments.repeats,
+        )
+        _report(
+            size,
+            "solve NS",
+            lambda matrix=matrix, constants=constants: _newton_schulz_inverse(matrix) @ constants,
+            solve_error,
+            arguments.repeats,
+        )
+        _report(size, "inv LU", lambda matrix=matrix: inverse(matrix), inverse_error, arguments.repeats)
+        _report(
+            size,
+            "inv NS",
+            lambda matrix=matrix: _newton_schulz_inverse(matrix),
+            inverse_error,
+            arguments.repeats,
+        )
+
+
+if __name__ == "__main__":
+    main()
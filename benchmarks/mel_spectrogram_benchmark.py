@@ -0,0 +1,74 @@
+"""MelSpectrogram and MFCC versus torchaudio on CPU.
+
+Reports steady-state wall time per batch of clips at 16 kHz. Both sides
+reuse one transform object, so filterbank and DCT construction is outside
+the timed region.
+
+Usage::
+
+    python -m benchmarks.mel_spectrogram_benchmark --seconds 1 10 60 --batch 8
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+import torch
+import torchaudio.transforms as reference_transforms
+from tinygrad import Tensor
+
+from benchmarks._harness import format_seconds, print_row, time_realized
+from tinyops.ops.audio.mel_frequency_cepstral_coefficients import MelFrequencyCepstralCoefficients
+from tinyops.ops.audio.mel_spectrogram import MelSpectrogram
+
+_SAMPLE_RATE = 16000
+
+
+def _time_reference(transform, waveform: torch.Tensor, repeats: int) -> float:
+    transform(waveform)
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        transform(waveform)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1.0, 10.0, 60.0])
+    parser.add_argument("--batch", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    mel_spectrogram = MelSpectrogram(_SAMPLE_RATE)
+    mfcc = MelFrequencyCepstralCoefficients(_SAMPLE_RATE, mel_spectrogram=mel_spectrogram)
+    reference_mel_spectrogram = reference_transforms.MelSpectrogram(_SAMPLE_RATE)
+    reference_mfcc = reference_transforms.MFCC(_SAMPLE_RATE)
+
+    print_row(("clip", "mel tinyops", "mel torchaudio", "mfcc tinyops", "mfcc torchaudio"))
+    for seconds in arguments.seconds:
+        samples = np.random.randn(arguments.batch, int(seconds * _SAMPLE_RATE)).astype(np.float32)
+        waveform = Tensor(samples).realize()
+        reference_waveform = torch.from_numpy(samples)
+
+        mel_time, _ = time_realized(lambda waveform=waveform: mel_spectrogram(waveform), arguments.repeats)
+        mfcc_time, _ = time_realized(lambda waveform=waveform: mfcc(waveform), arguments.repeats)
+        with torch.inference_mode():
+            reference_mel_time = _time_reference(reference_mel_spectrogram, reference_waveform, arguments.repeats)
+            reference_mfcc_time = _time_reference(reference_mfcc, reference_waveform, arguments.repeats)
+
+        print_row(
+            (
+                f"{arguments.batch}x{seconds:g}s",
+                format_seconds(mel_time),
+                format_seconds(reference_mel_time),
+                format_seconds(mfcc_time),
+                format_seconds(reference_mfcc_time),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
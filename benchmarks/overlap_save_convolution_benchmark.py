@@ -0,0 +1,88 @@
+"""Streaming FIR filtering: per-block latency and real-time factor of jitted overlap-save.
+
+Each block of ``--block-ms`` milliseconds goes through one TinyJit-captured
+call of ``overlap_save_convolution`` with the carry held in a caller-owned
+tensor, as a live audio callback would. The FFT rows pass the kernel
+spectrum precomputed once for the stream. The real-time factor is the
+block duration divided by the median per-block latency (above 1 keeps up).
+
+Usage::
+
+    python -m benchmarks.overlap_save_convolution_benchmark --taps 31 255 1023 --channels 2
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+from tinygrad import Device, Tensor, TinyJit
+
+from benchmarks._harness import print_row
+from tinyops.ops.signal.convolution_method import ConvolutionMethod
+from tinyops.ops.signal.overlap_save_convolution import overlap_save_convolution, overlap_save_kernel_spectrum
+
+# Calls before timing starts: TinyJit captures on the second call and replays from the third.
+_WARM_UP_BLOCKS = 3
+
+
+def _block_latencies(
+    channel_count: int, block_length: int, kernel: Tensor, method: ConvolutionMethod, block_count: int
+) -> list[float]:
+    carry = Tensor.zeros(channel_count, kernel.shape[-1] - 1).contiguous().realize()
+    kernel_spectrum = overlap_save_kernel_spectrum(kernel, block_length) if method == ConvolutionMethod.FFT else None
+
+    @TinyJit
+    def step(block: Tensor) -> Tensor:
+        output, new_carry = overlap_save_convolution(block, kernel, carry, method, kernel_spectrum)
+        output, new_carry = output.contiguous(), new_carry.contiguous()
+        # Both results read the old carry, so they are realized before it is overwritten.
+        Tensor.realize(output, new_carry)
+        carry.assign(new_carry).realize()
+        return output
+
+    blocks = [
+        Tensor(np.random.randn(channel_count, block_length).astype(np.float32)).realize()
+        for _ in range(_WARM_UP_BLOCKS + block_count)
+    ]
+    latencies = []
+    for index, block in enumerate(blocks):
+        start = time.perf_counter()
+        step(block)
+        Device[Device.DEFAULT].synchronize()
+        if index >= _WARM_UP_BLOCKS:
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--taps", type=int, nargs="+", default=[31, 255, 1023])
+    parser.add_argument("--channels", type=int, default=2)
+    parser.add_argument("--sample-rate", type=int, default=48000)
+    parser.add_argument("--block-ms", type=float, default=10.0)
+    parser.add_argument("--blocks", type=int, default=200)
+    arguments = parser.parse_args()
+
+    block_length = int(arguments.sample_rate * arguments.block_ms / 1000)
+    block_seconds = block_length / arguments.sample_rate
+    print_row(("taps", "method", "median latency", "p99 latency", "real-time factor"))
+    for tap_count in arguments.taps:
+        kernel = Tensor(np.random.randn(tap_count).astype(np.float32)).realize()
+        for method in (ConvolutionMethod.DIRECT, ConvolutionMethod.FFT):
+            latencies = _block_latencies(arguments.channels, block_length, kernel, method, arguments.blocks)
+            median = statistics.median(latencies)
+            tail = statistics.quantiles(latencies, n=100)[98]
+            print_row(
+                (
+                    tap_count,
+                    method.value,
+                    f"{median * 1e3:.3f} ms",
+                    f"{tail * 1e3:.3f} ms",
+                    f"{block_seconds / median:.1f}x",
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""One-sided Jacobi SVD and the SVD-based pseudo-inverse versus the Newton-Schulz pseudo-inverse it replaced.
+
+Covers tall-skinny, square and batched small-matrix shapes. Each test
+matrix has rank ``k / 2`` (``k = min(m, n)``), with its nonzero singular
+values spread geometrically over ``--condition``. The SVD row reports
+the largest singular value error against NumPy in float64, relative to
+the largest singular value. The pseudo-inverse rows report the Penrose
+residual ``max |A X A - A| / max |A|``, which the previous 20-step
+Newton-Schulz iteration fails to drive down on rank-deficient input.
+Times are steady-state, after the Jacobi step has been captured.
+
+Usage::
+
+    python -m benchmarks.singular_value_decomposition_benchmark --shapes 1024x16 64x64 256x256 1000x4x4 100x8x8
+"""
+
+import argparse
+
+import numpy as np
+from tinygrad import Tensor
+
+from benchmarks._harness import format_seconds, print_row, time_realized
+from tinyops.ops.linear_algebra.pseudo_inverse import pseudo_inverse
+from tinyops.ops.linear_algebra.singular_value_decomposition import singular_value_decomposition
+
+_NEWTON_SCHULZ_ITERATIONS = 20
+_NEWTON_SCHULZ_EPSILON = 1e-12
+
+
+def _newton_schulz_pseudo_inverse(matrix: Tensor) -> Tensor:
+    """The previous pseudo-inverse: Newton-Schulz iteration from a scaled transpose."""
+    absolute_values = matrix.abs()
+    column_norm = absolute_values.sum(axis=-2).max(axis=-1, keepdim=True).unsqueeze(-1)
+    row_norm = absolute_values.sum(axis=-1).max(axis=-1, keepdim=True).unsqueeze(-1)
+    approximation = matrix.transpose(-1, -2) / (column_norm * row_norm + _NEWTON_SCHULZ_EPSILON)
+    identity = Tensor.eye(matrix.shape[-1])
+    for _ in range(_NEWTON_SCHULZ_ITERATIONS):
+        approximation = ((2 * identity) - approximation.matmul(matrix)).matmul(approximation)
+    return approximation
+
+
+def _rank_deficient_matrices(shape: tuple[int, ...], condition: float) -> np.ndarray:
+    *batch_shape, rows, columns = shape
+    size = min(rows, columns)
+    left, _ = np.linalg.qr(np.random.randn(*batch_shape, rows, size))
+    right, _ = np.linalg.qr(np.random.randn(*batch_shape, columns, size))
+    singular_values = np.zeros(size)
+    singular_values[: max(size // 2, 1)] = np.geomspace(1, 1 / condition, max(size // 2, 1))
+    return left * singular_values @ np.swapaxes(right, -1, -2)
+
+
+def _penrose_error(values: np.ndarray, inverse: np.ndarray) -> float:
+    return np.abs(values @ inverse @ values - values).max() / np.abs(values).max()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shapes", nargs="+", default=["1024x16", "64x64", "256x256", "1000x4x4", "100x8x8"])
+    parser.add_argument("--condition", type=float, default=1e3)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    print_row(("shape", "method", "time", "error"))
+    for shape_name in arguments.shapes:
+        shape = tuple(int(extent) for extent in shape_name.split("x"))
+        # Only rows >= columns, which is the orientation the old Newton-Schulz loop below handles.
+        values = _rank_deficient_matrices(shape, arguments.condition)
+        matrix = Tensor(values.astype(np.float32)).realize()
+
+        duration, _ = time_realized(lambda matrix=matrix: singular_value_decomposition(matrix), arguments.repeats)
+        _, singular_values, _ = singular_value_decomposition(matrix)
+        expected = np.linalg.svd(values, compute_uv=False)
+        error = (np.abs(singular_values.numpy() - expected) / expected[..., :1]).max()
+        print_row((shape_name, "svd Jacobi", format_seconds(duration), f"{error:.2e}"))
+
+        for name, build in (
+            ("pinv SVD", lambda matrix=matrix: pseudo_inverse(matrix)),
+            ("pinv NS", lambda matrix=matrix: _newton_schulz_pseudo_inverse(matrix)),
+        ):
+            duration, _ = time_realized(build, arguments.repeats)
+            error = _penrose_error(values, build().numpy().astype(np.float64))
+            print_row((shape_name, name, format_seconds(duration), f"{error:.2e}"))
+
+
+if __name__ == "__main__":
+    main()
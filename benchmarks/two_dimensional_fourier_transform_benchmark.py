@@ -0,0 +1,56 @@
+"""Batched separable 2D FFT versus the former per-row/per-column loop.
+
+Reports lazy-graph node count and steady-state wall time for square grids.
+The loop baseline builds one 1D transform per row and per column, so its
+graph grows linearly with the grid side and it is capped separately.
+
+Usage::
+
+    python -m benchmarks.two_dimensional_fourier_transform_benchmark --sizes 256 1024 4096 --loop-max-size 64
+"""
+
+import argparse
+
+from tinygrad import Tensor
+
+from benchmarks._harness import format_seconds, print_row, time_realized
+from tinyops.ops.signal.discrete_fourier_transform import discrete_fourier_transform
+from tinyops.ops.signal.two_dimensional_discrete_fourier_transform import (
+    two_dimensional_discrete_fourier_transform,
+)
+
+
+def _row_column_loop(complex_grid: Tensor) -> Tensor:
+    """The pre-batched implementation, kept here only as a baseline."""
+    height, width, _ = complex_grid.shape
+    after_width = Tensor.stack([discrete_fourier_transform(complex_grid[row]) for row in range(height)], dim=0)
+    return Tensor.stack([discrete_fourier_transform(after_width[:, column, :]) for column in range(width)], dim=1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 1024, 4096])
+    parser.add_argument("--loop-max-size", type=int, default=64)
+    parser.add_argument("--batch", type=int, default=1, help="leading batch size for the batched path")
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    print_row(("H x W", "batched nodes", "batched time", "loop nodes", "loop time"))
+    for size in arguments.sizes:
+        grid = Tensor.randn(arguments.batch, size, size, 2).realize()
+        batched_time, batched_nodes = time_realized(
+            lambda grid=grid: two_dimensional_discrete_fourier_transform(grid), arguments.repeats
+        )
+
+        loop_time, loop_nodes = None, "-"
+        if size <= arguments.loop_max_size:
+            single = grid[0].contiguous().realize()
+            loop_time, loop_nodes = time_realized(lambda single=single: _row_column_loop(single), arguments.repeats)
+
+        print_row(
+            (f"{size}x{size}", batched_nodes, format_seconds(batched_time), loop_nodes, format_seconds(loop_time))
+        )
+
+
+if __name__ == "__main__":
+    main()
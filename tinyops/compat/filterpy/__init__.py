@@ -3,10 +3,22 @@
 Provides filterpy-compatible function signatures that delegate to tinyops.ops.
 """
 
-from tinygrad import Tensor
+import math
+import sys
 
+from tinygrad import Tensor, dtypes
+
+from tinyops.ops.linear_algebra.inverse import inverse as _inverse
 from tinyops.ops.signal.discrete_white_noise_matrix import discrete_white_noise_matrix as _q_discrete
+from tinyops.ops.signal.extended_kalman_predict import extended_kalman_predict as _extended_kalman_predict
+from tinyops.ops.signal.extended_kalman_update import extended_kalman_update as _extended_kalman_update
+from tinyops.ops.signal.innovation_likelihood import innovation_likelihood as _innovation_likelihood
+from tinyops.ops.signal.kalman_predict import kalman_predict as _kalman_predict
+from tinyops.ops.signal.kalman_update import kalman_update as _kalman_update
 from tinyops.ops.signal.merwe_scaled_sigma_points import merwe_scaled_sigma_points as _merwe_sigma
+from tinyops.ops.signal.rauch_tung_striebel_smoother import (
+    rauch_tung_striebel_smoother as _rauch_tung_striebel_smoother,
+)
 
 
 class _Common:
@@ -67,9 +79,317 @@ class MerweScaledSigmaPoints:
         return mean_weights, cov_weights
 
 
+def _as_matrix(value: Tensor | float, size: int) -> Tensor:
+    """filterpy accepts a scalar wherever a noise covariance is expected and scales the identity by it."""
+    return value if isinstance(value, Tensor) else Tensor.eye(size) * value
+
+
+def _as_vector(value, column: Tensor) -> Tensor:
+    """Turn a filterpy column (or scalar, list or array) into the ``(..., size)`` vector the ops take."""
+    value = value if isinstance(value, Tensor) else Tensor(value, dtype=column.dtype)
+    if value.ndim == 0:
+        return value.reshape(1)
+    return value.squeeze(-1) if value.ndim == column.ndim else value
+
+
+class _ResidualScores:
+    """filterpy's likelihood properties, scored from the residual ``y`` and innovation covariance ``S`` on demand."""
+
+    def _reset_residual_scores(self, initial: bool = False) -> None:
+        if initial:
+            # filterpy reports the smallest positive likelihood, and a zero distance, before the first update.
+            self._log_likelihood = Tensor(math.log(sys.float_info.min))
+            self._likelihood = Tensor(sys.float_info.min, dtype=dtypes.float64)
+            self._mahalanobis = Tensor(0.0)
+        else:
+            self._log_likelihood = self._likelihood = self._mahalanobis = None
+
+    def _residual_scores(self) -> tuple[Tensor, Tensor, Tensor]:
+        if self._log_likelihood is None:
+            self._log_likelihood, self._likelihood, self._mahalanobis = _innovation_likelihood(
+                self.y.squeeze(-1), self.S
+            )
+        return self._log_likelihood, self._likelihood, self._mahalanobis
+
+    @property
+    def log_likelihood(self) -> Tensor:
+        """Log-likelihood of the last measurement residual under ``N(0, S)``."""
+        return self._residual_scores()[0]
+
+    @property
+    def likelihood(self) -> Tensor:
+        """Likelihood of the last measurement residual, never exactly zero."""
+        return self._residual_scores()[1]
+
+    @property
+    def mahalanobis(self) -> Tensor:
+        """Mahalanobis distance of the last measurement residual."""
+        return self._residual_scores()[2]
+
+
+class KalmanFilter(_ResidualScores):
+    """filterpy-compatible KalmanFilter class.
+
+    Keeps filterpy's attribute API with ``x`` as a ``(dim_x, 1)`` column;
+    predict and update delegate to tinyops.ops.signal.kalman_predict and
+    kalman_update. Leading batch axes on ``x`` and ``P`` (``(tracks, dim_x, 1)``
+    and ``(tracks, dim_x, dim_x)``) filter every track at once. After an
+    update, ``K``, ``y``, ``S``, ``SI`` and ``z`` hold the gain, residual,
+    innovation covariance, its inverse and the measurement; ``z`` is
+    ``None`` after an update without a measurement. The likelihood
+    properties are tensors with the batch shape, computed on first access.
+    """
+
+    def __init__(self, dim_x: int, dim_z: int, dim_u: int = 0):
+        self.dim_x = dim_x
+        self.dim_z = dim_z
+        self.dim_u = dim_u
+        self.x = Tensor.zeros(dim_x, 1)
+        self.P = Tensor.eye(dim_x)
+        self.Q = Tensor.eye(dim_x)
+        self.B = None
+        self.F = Tensor.eye(dim_x)
+        self.H = Tensor.zeros(dim_z, dim_x)
+        self.R = Tensor.eye(dim_z)
+        self._alpha_sq = 1.0
+        self.z = None
+        self.K = Tensor.zeros(dim_x, dim_z)
+        self.y = Tensor.zeros(dim_z, 1)
+        self.S = Tensor.zeros(dim_z, dim_z)
+        self.SI = Tensor.zeros(dim_z, dim_z)
+        self.x_prior, self.P_prior = self.x, self.P
+        self.x_post, self.P_post = self.x, self.P
+        self._reset_residual_scores(initial=True)
+
+    @property
+    def alpha(self) -> float:
+        """Fading memory setting; the predicted covariance is scaled by ``alpha ** 2``."""
+        return math.sqrt(self._alpha_sq)
+
+    @alpha.setter
+    def alpha(self, value: float) -> None:
+        if not isinstance(value, int | float) or value < 1:
+            raise ValueError("alpha must be a float greater than 1")
+        self._alpha_sq = value**2
+
+    def _prediction(self, u, B: Tensor | None, F: Tensor | None, Q) -> tuple[Tensor, Tensor]:
+        B = self.B if B is None else B
+        F = self.F if F is None else F
+        Q = _as_matrix(self.Q if Q is None else Q, self.dim_x)
+        control_input = None
+        if B is None or u is None:
+            B = None
+        else:
+            # filterpy passes u as a (dim_u, 1) column.
+            control_input = _as_vector(u, self.x)
+        state, covariance = _kalman_predict(
+            self.x.squeeze(-1), self.P, F, Q, B, control_input, fading_memory=self.alpha
+        )
+        return state.unsqueeze(-1), covariance
+
+    def predict(self, u=None, B: Tensor | None = None, F: Tensor | None = None, Q=None) -> None:
+        """Predict next state (prior) using the Kalman filter state propagation equations."""
+        self.x, self.P = self._prediction(u, B, F, Q)
+        self.x_prior, self.P_prior = self.x, self.P
+
+    def get_prediction(self, u=0) -> tuple[Tensor, Tensor]:
+        """Return the ``(x, P)`` prediction without changing the filter."""
+        return self._prediction(u, None, None, None)
+
+    def _correction(self, z, R, H: Tensor | None) -> tuple[Tensor, ...]:
+        R = _as_matrix(self.R if R is None else R, self.dim_z)
+        H = self.H if H is None else H
+        return _kalman_update(self.x.squeeze(-1), self.P, _as_vector(z, self.x), H, R)
+
+    def update(self, z, R=None, H: Tensor | None = None) -> None:
+        """Add a new measurement (z) to the Kalman filter; ``None`` skips the correction."""
+        self._reset_residual_scores()
+        if z is None:
+            self.z = None
+            self.y = self.y.zeros_like()
+            self.x_post, self.P_post = self.x, self.P
+            return
+        state, self.P, self.K, self.S, residual = self._correction(z, R, H)
+        self.SI = _inverse(self.S)
+        self.x, self.y = state.unsqueeze(-1), residual.unsqueeze(-1)
+        self.z = _as_vector(z, self.x).unsqueeze(-1)
+        self.x_post, self.P_post = self.x, self.P
+
+    def get_update(self, z=None) -> tuple[Tensor, Tensor]:
+        """Return the ``(x, P)`` posterior for *z* without changing the filter; ``None`` returns the prior."""
+        if z is None:
+            return self.x, self.P
+        state, covariance, *_ = self._correction(z, None, None)
+        return state.unsqueeze(-1), covariance
+
+    def batch_filter(
+        self,
+        zs,
+        Fs=None,
+        Qs=None,
+        Hs=None,
+        Rs=None,
+        Bs=None,
+        us=None,
+        update_first: bool = False,
+        saver=None,
+    ) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+        """Run the filter over a sequence of measurements.
+
+        Returns the posterior means and covariances and the prior means and
+        covariances of every step, stacked on a leading time axis. Entries
+        of *zs* may be ``None`` for steps without a measurement.
+        """
+        step_count = len(zs)
+        Fs = [self.F] * step_count if Fs is None else Fs
+        Qs = [self.Q] * step_count if Qs is None else Qs
+        Hs = [self.H] * step_count if Hs is None else Hs
+        Rs = [self.R] * step_count if Rs is None else Rs
+        Bs = [self.B] * step_count if Bs is None else Bs
+        us = [0] * step_count if us is None else us
+        means, covariances, prior_means, prior_covariances = [], [], [], []
+        for step in range(step_count):
+            if update_first:
+                self.update(zs[step], R=Rs[step], H=Hs[step])
+                means.append(self.x)
+                covariances.append(self.P)
+            self.predict(u=us[step], B=Bs[step], F=Fs[step], Q=Qs[step])
+            prior_means.append(self.x)
+            prior_covariances.append(self.P)
+            if not update_first:
+                self.update(zs[step], R=Rs[step], H=Hs[step])
+                means.append(self.x)
+                covariances.append(self.P)
+            Tensor.realize(self.x, self.P)
+            if saver is not None:
+                saver.save()
+        return (
+            Tensor.stack(*means),
+            Tensor.stack(*covariances),
+            Tensor.stack(*prior_means),
+            Tensor.stack(*prior_covariances),
+        )
+
+    def rts_smoother(self, Xs: Tensor, Ps: Tensor, Fs=None, Qs=None, inv=None) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+        """Rauch-Tung-Striebel smoothing of the output of :meth:`batch_filter`.
+
+        Returns the smoothed means and covariances, the smoother gains and
+        the predicted covariances. *inv* is accepted for signature
+        compatibility and unused: the gain comes from a Cholesky solve.
+        """
+        if len(Xs) != len(Ps):
+            raise ValueError("length of Xs and Ps must be the same")
+        step_count = len(Xs)
+        Fs = [self.F] * step_count if Fs is None else Fs
+        Qs = [self.Q] * step_count if Qs is None else Qs
+        states, covariances, gains, predicted_covariances = _rauch_tung_striebel_smoother(
+            Xs.squeeze(-1),
+            Ps,
+            Tensor.stack(*Fs),
+            Tensor.stack(*[_as_matrix(Q, self.dim_x) for Q in Qs]),
+        )
+        return states.unsqueeze(-1), covariances, gains, predicted_covariances
+
+
+class ExtendedKalmanFilter(_ResidualScores):
+    """filterpy-compatible ExtendedKalmanFilter class.
+
+    Keeps filterpy's attribute API with ``x`` as a ``(dim_x, 1)`` column.
+    ``predict`` propagates the state linearly through ``F`` (override
+    ``predict_x`` for a nonlinear motion model, with ``F`` set to its
+    Jacobian); ``update`` evaluates the measurement model and its Jacobian
+    on tensors and delegates to tinyops.ops.signal.extended_kalman_update.
+    Leading batch axes on ``x`` and ``P`` filter every object at once.
+    ``K``, ``y``, ``S``, ``SI``, ``z`` and the likelihood properties behave
+    as in :class:`KalmanFilter`.
+    """
+
+    def __init__(self, dim_x: int, dim_z: int, dim_u: int = 0):
+        self.dim_x = dim_x
+        self.dim_z = dim_z
+        self.dim_u = dim_u
+        self.x = Tensor.zeros(dim_x, 1)
+        self.P = Tensor.eye(dim_x)
+        self.B = 0
+        self.F = Tensor.eye(dim_x)
+        self.R = Tensor.eye(dim_z)
+        self.Q = Tensor.eye(dim_x)
+        self.z = None
+        self.K = Tensor.zeros(dim_x, dim_z)
+        self.y = Tensor.zeros(dim_z, 1)
+        self.S = Tensor.zeros(dim_z, dim_z)
+        self.SI = Tensor.zeros(dim_z, dim_z)
+        self.x_prior, self.P_prior = self.x, self.P
+        self.x_post, self.P_post = self.x, self.P
+        self._reset_residual_scores(initial=True)
+
+    def _linear_motion(self, u) -> Tensor:
+        """``F x + B u`` as filterpy computes it: ``B`` may be a matrix or a scalar, and ``B = 0`` skips ``u``."""
+        state = self.F @ self.x
+        if not isinstance(self.B, Tensor) and self.B == 0:
+            return state
+        control = _as_vector(u, self.x).unsqueeze(-1)
+        return state + (self.B @ control if isinstance(self.B, Tensor) else self.B * control)
+
+    def predict_x(self, u=0) -> None:
+        """Predict the state with the linear model ``F x + B u``; override for a nonlinear motion model."""
+        self.x = self._linear_motion(u)
+
+    def predict(self, u=0) -> None:
+        """Predict next state (prior) using the Kalman filter state propagation equations."""
+        self.predict_x(u)
+        state, self.P = _extended_kalman_predict(self.x.squeeze(-1), self.P, self.F, _as_matrix(self.Q, self.dim_x))
+        self.x = state.unsqueeze(-1)
+        self.x_prior, self.P_prior = self.x, self.P
+
+    def _correct(self, z: Tensor, jacobian: Tensor, residual: Tensor, R) -> None:
+        residual = _as_vector(residual, self.x)
+        state, self.P, self.K, self.S = _extended_kalman_update(
+            self.x.squeeze(-1), self.P, residual, jacobian, _as_matrix(R, self.dim_z)
+        )
+        self.SI = _inverse(self.S)
+        self.x, self.y, self.z = state.unsqueeze(-1), residual.unsqueeze(-1), z
+        self.x_post, self.P_post = self.x, self.P
+        self._reset_residual_scores()
+
+    def update(self, z, HJacobian, Hx, R=None, args=(), hx_args=(), residual=None) -> None:
+        """Update with measurement z; HJacobian(x, *args) and Hx(x, *hx_args) take and return tensors."""
+        if z is None:
+            self.z = None
+            self.x_post, self.P_post = self.x, self.P
+            return
+        args = args if isinstance(args, tuple) else (args,)
+        hx_args = hx_args if isinstance(hx_args, tuple) else (hx_args,)
+        z = z if isinstance(z, Tensor) else _as_vector(z, self.x).unsqueeze(-1)
+        jacobian = HJacobian(self.x, *args)
+        predicted_measurement = Hx(self.x, *hx_args)
+        innovation = z - predicted_measurement if residual is None else residual(z, predicted_measurement)
+        self._correct(z, jacobian, innovation, self.R if R is None else R)
+
+    def predict_update(self, z, HJacobian, Hx, args=(), hx_args=(), u=0) -> None:
+        """Predict and update in one step, linearizing the measurement model at the state before the prediction.
+
+        As in filterpy, the motion is always ``F x + B u`` (``predict_x`` is
+        not called) and ``x_prior`` and ``P_prior`` keep the estimate from
+        before the prediction.
+        """
+        args = args if isinstance(args, tuple) else (args,)
+        hx_args = hx_args if isinstance(hx_args, tuple) else (hx_args,)
+        z = z if isinstance(z, Tensor) else _as_vector(z, self.x).unsqueeze(-1)
+        jacobian = HJacobian(self.x, *args)
+        self.x_prior, self.P_prior = self.x, self.P
+        state, self.P = _extended_kalman_predict(
+            self._linear_motion(u).squeeze(-1), self.P, self.F, _as_matrix(self.Q, self.dim_x)
+        )
+        self.x = state.unsqueeze(-1)
+        self._correct(z, jacobian, z - Hx(self.x, *hx_args), self.R)
+
+
 class _Kalman:
     """Namespace mimicking filterpy.kalman."""
 
+    ExtendedKalmanFilter = ExtendedKalmanFilter
+    KalmanFilter = KalmanFilter
     MerweScaledSigmaPoints = MerweScaledSigmaPoints
 
 
@@ -4,7 +4,10 @@ Compares tinyops.compat.filterpy against actual filterpy.
 """
 
 import numpy as np
+import pytest
 from filterpy.common import Q_discrete_white_noise as fp_Q_discrete_white_noise
+from filterpy.kalman import ExtendedKalmanFilter as FPExtendedKalmanFilter
+from filterpy.kalman import KalmanFilter as FPKalmanFilter
 from filterpy.kalman import MerweScaledSigmaPoints as FPMerweScaledSigmaPoints
 from tinygrad import Tensor
 
@@ -70,3 +73,288 @@ class TestMerweScaledSigmaPoints:
 
         assert_close(wm_ours, np.array(wm_ref, dtype=np.float32), atol=1e-4)
         assert_close(wc_ours, np.array(wc_ref, dtype=np.float32), atol=1e-4)
+
+    def test_batched_sigma_points(self):
+        n, batch_size = 3, 4
+        means = np.random.randn(batch_size, n).astype(np.float32)
+        factors = np.random.randn(batch_size, n, n).astype(np.float32)
+        covariances = factors @ factors.transpose(0, 2, 1) + np.eye(n, dtype=np.float32)
+
+        sp_ours = tfp.kalman.MerweScaledSigmaPoints(n=n, alpha=0.3, beta=2.0, kappa=0.0)
+        points_ours = sp_ours.sigma_points(Tensor(means), Tensor(covariances))
+
+        sp_ref = FPMerweScaledSigmaPoints(n=n, alpha=0.3, beta=2.0, kappa=0.0)
+        points_ref = np.stack([sp_ref.sigma_points(m, c) for m, c in zip(means, covariances, strict=True)])
+        assert_close(points_ours, points_ref.astype(np.float32), atol=1e-4, rtol=1e-4)
+
+
+def _constant_velocity_model(time_step: float = 0.5) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Transition, measurement and process noise of a 2D constant-velocity tracker ``[x, y, vx, vy]``."""
+    transition = np.eye(4)
+    transition[0, 2] = transition[1, 3] = time_step
+    measurement_matrix = np.eye(2, 4)
+    process_noise = fp_Q_discrete_white_noise(dim=2, dt=time_step, var=0.1, block_size=2, order_by_dim=False)
+    return transition, measurement_matrix, process_noise
+
+
+class _CallCounter:
+    """Stands in for filterpy's Saver, which batch_filter calls once per step."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def save(self):
+        self.calls += 1
+
+
+def _configured_filters() -> tuple:
+    transition, measurement_matrix, process_noise = _constant_velocity_model()
+    reference = FPKalmanFilter(dim_x=4, dim_z=2)
+    reference.F, reference.H, reference.Q = transition, measurement_matrix, process_noise
+    ours = tfp.kalman.KalmanFilter(dim_x=4, dim_z=2)
+    ours.F = Tensor(transition.astype(np.float32))
+    ours.H = Tensor(measurement_matrix.astype(np.float32))
+    ours.Q = Tensor(process_noise.astype(np.float32))
+    return reference, ours
+
+
+class TestKalmanFilter:
+    def test_tracking_sequence(self):
+        reference, ours = _configured_filters()
+        reference.P *= 10.0
+        reference.R *= 0.5
+        ours.P = ours.P * 10.0
+        ours.R = ours.R * 0.5
+
+        measurements = np.cumsum(np.random.randn(8, 2, 1), axis=0)
+        for measurement in measurements:
+            reference.predict()
+            reference.update(measurement)
+            ours.predict()
+            ours.update(Tensor(measurement.astype(np.float32)))
+        assert_close(ours.x, reference.x.astype(np.float32), atol=1e-4, rtol=1e-4)
+        assert_close(ours.P, reference.P.astype(np.float32), atol=1e-4, rtol=1e-4)
+
+    def test_batched_tracks_match_individual_filters(self):
+        track_count = 5
+        initial_states = np.random.randn(track_count, 4, 1)
+        measurements = np.random.randn(track_count, 2, 1)
+        _, ours = _configured_filters()
+        ours.x = Tensor(initial_states.astype(np.float32))
+        ours.P = Tensor.eye(4).expand(track_count, 4, 4)
+        ours.predict()
+        ours.update(Tensor(measurements.astype(np.float32)))
+
+        for track in range(track_count):
+            reference, _ = _configured_filters()
+            reference.x = initial_states[track]
+            reference.predict()
+            reference.update(measurements[track])
+            assert_close(ours.x[track], reference.x.astype(np.float32), atol=1e-4, rtol=1e-4)
+            assert_close(ours.P[track], reference.P.astype(np.float32), atol=1e-4, rtol=1e-4)
+
+    def test_control_input(self):
+        reference = FPKalmanFilter(dim_x=2, dim_z=1, dim_u=1)
+        reference.B = np.array([[0.5], [1.0]])
+        reference.predict(u=np.array([[2.0]]))
+        ours = tfp.kalman.KalmanFilter(dim_x=2, dim_z=1, dim_u=1)
+        ours.B = Tensor([[0.5], [1.0]])
+        ours.predict(u=Tensor([[2.0]]))
+        assert_close(ours.x, reference.x.astype(np.float32), atol=1e-6)
+
+    def test_update_attributes_and_likelihood(self):
+        reference, ours = _configured_filters()
+        reference.R *= 0.5
+        ours.R = ours.R * 0.5
+        measurement = np.array([[1.0], [-0.5]])
+        reference.predict()
+        reference.update(measurement)
+        ours.predict()
+        ours.update(Tensor(measurement.astype(np.float32)))
+        for name in ("K", "y", "S", "SI", "z"):
+            assert_close(getattr(ours, name), getattr(reference, name).astype(np.float32), atol=1e-5, rtol=1e-5)
+        assert_close(ours.log_likelihood, np.float32(reference.log_likelihood), atol=1e-5, rtol=1e-5)
+        assert_close(ours.likelihood, np.float32(reference.likelihood), atol=1e-5, rtol=1e-5)
+        # filterpy's own mahalanobis calls float() on a 1x1 array, which numpy 2 rejects.
+        expected_mahalanobis = np.sqrt(reference.y.T @ reference.SI @ reference.y)[0, 0]
+        assert_close(ours.mahalanobis, np.float32(expected_mahalanobis), atol=1e-5, rtol=1e-5)
+
+    def test_update_without_measurement(self):
+        reference, ours = _configured_filters()
+        reference.predict()
+        reference.update(None)
+        ours.predict()
+        ours.update(None)
+        assert ours.z is None
+        assert_close(ours.y, reference.y.astype(np.float32), atol=0)
+        assert_close(ours.x_post, reference.x_post.astype(np.float32), atol=1e-6)
+
+    def test_fading_memory(self):
+        reference, ours = _configured_filters()
+        reference.alpha = ours.alpha = 1.02
+        reference.predict()
+        ours.predict()
+        assert ours.alpha == reference.alpha
+        assert_close(ours.P, reference.P.astype(np.float32), atol=1e-5, rtol=1e-5)
+        with pytest.raises(ValueError):
+            ours.alpha = 0.5
+
+    def test_get_prediction_and_update_leave_state(self):
+        reference, ours = _configured_filters()
+        reference.B = np.array([[0.0], [0.0], [0.5], [1.0]])
+        ours.B = Tensor(reference.B.astype(np.float32))
+        measurement = np.array([[0.4], [0.2]])
+        expected_prediction = reference.get_prediction(np.array([[2.0]]))
+        expected_update = reference.get_update(measurement)
+        prediction = ours.get_prediction(Tensor([[2.0]]))
+        update = ours.get_update(Tensor(measurement.astype(np.float32)))
+        for result, expected in zip((*prediction, *update), (*expected_prediction, *expected_update), strict=True):
+            assert_close(result, expected.astype(np.float32), atol=1e-5, rtol=1e-5)
+        assert_close(ours.x, reference.x.astype(np.float32), atol=0)
+        assert_close(ours.get_update()[1], reference.get_update()[1].astype(np.float32), atol=0)
+
+    @pytest.mark.parametrize("update_first", [False, True])
+    def test_batch_filter_and_rts_smoother(self, update_first):
+        reference, ours = _configured_filters()
+        reference.P *= 10.0
+        ours.P = ours.P * 10.0
+        measurements = np.cumsum(np.random.randn(6, 2, 1), axis=0)
+        saver = _CallCounter()
+
+        results = ours.batch_filter(Tensor(measurements.astype(np.float32)), update_first=update_first, saver=saver)
+        expected = reference.batch_filter(measurements, update_first=update_first)
+        assert saver.calls == len(measurements)
+        for result, expected_values in zip(results, expected, strict=True):
+            assert_close(result, expected_values.astype(np.float32), atol=1e-4, rtol=1e-4)
+
+        smoothed = ours.rts_smoother(results[0], results[1])
+        expected_smoothed = reference.rts_smoother(expected[0], expected[1])
+        for result, expected_values in zip(smoothed, expected_smoothed, strict=True):
+            assert_close(result, expected_values.astype(np.float32), atol=1e-4, rtol=1e-4)
+
+    def test_rts_smoother_length_mismatch(self):
+        _, ours = _configured_filters()
+        with pytest.raises(ValueError):
+            ours.rts_smoother(Tensor.zeros(3, 4, 1), Tensor.zeros(2, 4, 4))
+
+    def test_scalar_measurement_and_control(self):
+        reference = FPKalmanFilter(dim_x=2, dim_z=1, dim_u=1)
+        reference.F = np.array([[1.0, 0.1], [0.0, 1.0]])
+        reference.H = np.array([[1.0, 0.0]])
+        reference.B = np.array([[0.005], [0.1]])
+        reference.predict(u=2.0)
+        reference.update(0.3)
+        ours = tfp.kalman.KalmanFilter(dim_x=2, dim_z=1, dim_u=1)
+        ours.F = Tensor([[1.0, 0.1], [0.0, 1.0]])
+        ours.H = Tensor([[1.0, 0.0]])
+        ours.B = Tensor([[0.005], [0.1]])
+        ours.predict(u=2.0)
+        ours.update(0.3)
+        assert_close(ours.x, reference.x.astype(np.float32), atol=1e-6)
+        assert_close(ours.P, reference.P.astype(np.float32), atol=1e-6)
+
+
+def _radar_range(x):
+    """Slant range to an aircraft with state ``[downrange, velocity, altitude]`` (works on arrays and tensors)."""
+    return (x[0:1] ** 2 + x[2:3] ** 2) ** 0.5
+
+
+def _radar_range_jacobian(x):
+    slant_range = _radar_range(x)
+    if isinstance(x, Tensor):
+        return (x[0:1] / slant_range).cat(Tensor.zeros(1, 1), x[2:3] / slant_range, dim=1)
+    return np.array([[x[0, 0], 0.0, x[2, 0]]]) / slant_range
+
+
+class TestExtendedKalmanFilter:
+    def test_radar_tracking_sequence(self):
+        time_step = 0.05
+        transition = np.eye(3) + np.array([[0.0, 1.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]) * time_step
+        process_noise = np.diag([0.1, 0.1, 0.5])
+        initial_state = np.array([[-100.0], [100.0], [1000.0]])
+
+        reference = FPExtendedKalmanFilter(dim_x=3, dim_z=1)
+        reference.x, reference.F, reference.Q = initial_state, transition, process_noise
+        reference.R *= 25.0
+        reference.P *= 50.0
+        ours = tfp.kalman.ExtendedKalmanFilter(dim_x=3, dim_z=1)
+        ours.x, ours.F = Tensor(initial_state.astype(np.float32)), Tensor(transition.astype(np.float32))
+        ours.Q = Tensor(process_noise.astype(np.float32))
+        ours.R = ours.R * 25.0
+        ours.P = ours.P * 50.0
+
+        for step in range(6):
+            measurement = np.array([[1005.0 + 3.0 * step + np.random.randn()]])
+            reference.predict()
+            reference.update(measurement, _radar_range_jacobian, _radar_range)
+            ours.predict()
+            ours.update(Tensor(measurement.astype(np.float32)), _radar_range_jacobian, _radar_range)
+        assert_close(ours.x, reference.x.astype(np.float32), atol=1e-2, rtol=1e-4)
+        assert_close(ours.P, reference.P.astype(np.float32), atol=1e-3, rtol=1e-3)
+
+    def test_control_input(self):
+        reference = FPExtendedKalmanFilter(dim_x=2, dim_z=1, dim_u=1)
+        reference.F = np.array([[1.0, 0.1], [0.0, 1.0]])
+        reference.B = np.array([[0.005], [0.1]])
+        reference.predict(u=np.array([[3.0]]))
+        ours = tfp.kalman.ExtendedKalmanFilter(dim_x=2, dim_z=1, dim_u=1)
+        ours.F = Tensor([[1.0, 0.1], [0.0, 1.0]])
+        ours.B = Tensor([[0.005], [0.1]])
+        ours.predict(u=Tensor([[3.0]]))
+        assert_close(ours.x, reference.x.astype(np.float32), atol=1e-6)
+        assert_close(ours.P, reference.P.astype(np.float32), atol=1e-6)
+
+    def test_update_without_measurement_keeps_prior(self):
+        reference = FPExtendedKalmanFilter(dim_x=3, dim_z=1)
+        reference.x = np.array([[-100.0], [100.0], [1000.0]])
+        reference.predict()
+        reference.update(None, _radar_range_jacobian, _radar_range)
+        ours = tfp.kalman.ExtendedKalmanFilter(dim_x=3, dim_z=1)
+        ours.x = Tensor([[-100.0], [100.0], [1000.0]])
+        ours.predict()
+        ours.update(None, _radar_range_jacobian, _radar_range)
+        assert ours.z is None
+        assert_close(ours.x_post, reference.x_post.astype(np.float32), atol=1e-4)
+        assert_close(ours.P_post, reference.P_post.astype(np.float32), atol=1e-6)
+
+    def test_update_attributes_and_likelihood(self):
+        reference = FPExtendedKalmanFilter(dim_x=3, dim_z=1)
+        reference.x, reference.P = np.array([[-100.0], [100.0], [1000.0]]), np.eye(3) * 50.0
+        reference.update(np.array([[1010.0]]), _radar_range_jacobian, _radar_range, R=25.0)
+        ours = tfp.kalman.ExtendedKalmanFilter(dim_x=3, dim_z=1)
+        ours.x, ours.P = Tensor([[-100.0], [100.0], [1000.0]]), ours.P * 50.0
+        ours.update(1010.0, _radar_range_jacobian, _radar_range, R=25.0)
+        for name in ("K", "y", "S", "z"):
+            assert_close(getattr(ours, name), getattr(reference, name).astype(np.float32), atol=1e-4, rtol=1e-5)
+        # filterpy's update leaves SI stale; it is the inverse of S here.
+        assert_close(ours.SI, np.linalg.inv(reference.S).astype(np.float32), atol=1e-6, rtol=1e-5)
+        assert_close(ours.log_likelihood, np.float32(reference.log_likelihood), atol=1e-5, rtol=1e-5)
+        assert_close(ours.likelihood, np.float32(reference.likelihood), atol=1e-5, rtol=1e-5)
+        expected_mahalanobis = np.sqrt(reference.y.T @ np.linalg.inv(reference.S) @ reference.y)[0, 0]
+        assert_close(ours.mahalanobis, np.float32(expected_mahalanobis), atol=1e-5, rtol=1e-5)
+
+    def test_predict_update(self):
+        transition = np.array([[1.0, 0.05, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        reference = FPExtendedKalmanFilter(dim_x=3, dim_z=1, dim_u=1)
+        reference.x, reference.F = np.array([[-100.0], [100.0], [1000.0]]), transition
+        reference.B = np.array([[0.0], [0.1], [0.0]])
+        reference.P *= 50.0
+        ours = tfp.kalman.ExtendedKalmanFilter(dim_x=3, dim_z=1, dim_u=1)
+        ours.x, ours.F = Tensor([[-100.0], [100.0], [1000.0]]), Tensor(transition.astype(np.float32))
+        ours.B = Tensor([[0.0], [0.1], [0.0]])
+        ours.P = ours.P * 50.0
+        for step in range(3):
+            measurement = 1005.0 + 3.0 * step
+            reference.predict_update(measurement, _radar_range_jacobian, _radar_range, u=2.0)
+            ours.predict_update(measurement, _radar_range_jacobian, _radar_range, u=2.0)
+        for name in ("x", "P", "K", "S", "SI", "y", "x_prior", "P_prior"):
+            assert_close(getattr(ours, name), getattr(reference, name).astype(np.float32), atol=1e-3, rtol=1e-4)
+
+    def test_scalar_control_matrix(self):
+        reference = FPExtendedKalmanFilter(dim_x=2, dim_z=1, dim_u=1)
+        reference.x, reference.B = np.array([[1.0], [2.0]]), 0.5
+        reference.predict(u=np.array([[3.0]]))
+        ours = tfp.kalman.ExtendedKalmanFilter(dim_x=2, dim_z=1, dim_u=1)
+        ours.x, ours.B = Tensor([[1.0], [2.0]]), 0.5
+        ours.predict(u=[[3.0]])
+        assert_close(ours.x, reference.x.astype(np.float32), atol=1e-6)
@@ -21,8 +21,16 @@ from tinyops.ops.linear_algebra.matrix_rank import matrix_rank as _matrix_rank
 from tinyops.ops.linear_algebra.norm import norm as _norm
 from tinyops.ops.linear_algebra.outer_product import outer_product as _outer_product
 from tinyops.ops.linear_algebra.pseudo_inverse import pseudo_inverse as _pseudo_inverse
+from tinyops.ops.linear_algebra.qr_decomposition import QrMode
 from tinyops.ops.linear_algebra.qr_decomposition import qr_decomposition as _qr_decomposition
+from tinyops.ops.linear_algebra.singular_value_decomposition import (
+    singular_value_decomposition as _singular_value_decomposition,
+)
+from tinyops.ops.linear_algebra.singular_values import singular_values as _singular_values
 from tinyops.ops.linear_algebra.solve_linear_system import solve_linear_system as _solve
+from tinyops.ops.linear_algebra.symmetric_eigendecomposition import (
+    symmetric_eigendecomposition as _symmetric_eigendecomposition,
+)
 from tinyops.ops.linear_algebra.tensor_dot_product import tensor_dot_product as _tensor_dot_product
 from tinyops.ops.linear_algebra.trace import trace as _trace
 from tinyops.ops.linear_algebra.vector_dot_product import vector_dot_product as _vector_dot_product
@@ -336,8 +344,8 @@ class _LinAlg:
         return _inverse(a)
 
     @staticmethod
-    def pinv(a: Tensor) -> Tensor:
-        return _pseudo_inverse(a)
+    def pinv(a: Tensor, rcond=None, hermitian: bool = False, *, rtol=None) -> Tensor:
+        return _pseudo_inverse(a, relative_tolerance=rtol if rtol is not None else rcond, hermitian=hermitian)
 
     @staticmethod
     def solve(a: Tensor, b: Tensor) -> Tensor:
@@ -352,16 +360,32 @@ class _LinAlg:
         return _condition_number(x, order=p)
 
     @staticmethod
-    def matrix_rank(a: Tensor) -> Tensor:
-        return _matrix_rank(a)
+    def matrix_rank(A: Tensor, tol=None, hermitian: bool = False, *, rtol=None) -> Tensor:
+        return _matrix_rank(A, tolerance=tol, hermitian=hermitian, relative_tolerance=rtol)
 
     @staticmethod
     def cholesky(a: Tensor) -> Tensor:
         return _cholesky(a)
 
     @staticmethod
-    def qr(a: Tensor):
-        return _qr_decomposition(a)
+    def qr(a: Tensor, mode: str = "reduced"):
+        mode_map = {"reduced": QrMode.REDUCED, "complete": QrMode.COMPLETE}
+        return _qr_decomposition(a, mode=mode_map[mode])
+
+    @staticmethod
+    def eigh(a: Tensor, UPLO: str = "L"):
+        # The upper triangle of a is the lower triangle of its transpose.
+        return _symmetric_eigendecomposition(a if UPLO == "L" else a.transpose(-1, -2))
+
+    @staticmethod
+    def eigvalsh(a: Tensor, UPLO: str = "L") -> Tensor:
+        return _LinAlg.eigh(a, UPLO)[0]
+
+    @staticmethod
+    def svd(a: Tensor, full_matrices: bool = True, compute_uv: bool = True, hermitian: bool = False):
+        if not compute_uv:
+            return _singular_values(a, hermitian=hermitian)
+        return _singular_value_decomposition(a, full_matrices=full_matrices, hermitian=hermitian)
 
     @staticmethod
     def matrix_power(a: Tensor, n: int) -> Tensor:
@@ -4,10 +4,12 @@ Compares tinyops.compat.numpy2 against actual numpy.
 """
 
 import numpy as np
-from tinygrad import Tensor
+import pytest
+from tinygrad import Tensor, dtypes
 
 from tinyops._core import assert_close
 from tinyops.compat import numpy2 as tnp
+from tinyops.ops.signal import fourier_plan_cache_info
 
 # ============================================================================
 # Statistics
@@ -377,6 +379,23 @@ class TestCorrelate:
         v = np.array([1, 2], dtype=np.float32)
         assert_close(tnp.correlate(Tensor(a), Tensor(v), mode="full"), np.correlate(a, v, mode="full"))
 
+    def test_same_even_kernel(self):
+        a = np.arange(10, dtype=np.float32)
+        v = np.array([1, 2, 3, 4], dtype=np.float32)
+        assert_close(tnp.correlate(Tensor(a), Tensor(v), mode="same"), np.correlate(a, v, mode="same"))
+
+    @pytest.mark.parametrize("mode", ["valid", "full"])
+    def test_long_kernel_uses_fft(self, mode):
+        a = np.random.randn(2000).astype(np.float32)
+        v = np.random.randn(200).astype(np.float32)
+        assert_close(tnp.correlate(Tensor(a), Tensor(v), mode=mode), np.correlate(a, v, mode=mode), atol=1e-3)
+
+    def test_float64_above_crossover(self):
+        a, v = np.random.randn(300), np.random.randn(200)
+        result = tnp.correlate(Tensor(a), Tensor(v), mode="full")
+        assert result.dtype == dtypes.float64
+        np.testing.assert_allclose(result.numpy(), np.correlate(a, v, mode="full"), atol=1e-10)
+
 
 class TestCov:
     def test_basic(self):
@@ -576,6 +595,16 @@ class TestLinalgNorm:
         data = np.random.randn(3, 3).astype(np.float32)
         assert_close(tnp.linalg.norm(Tensor(data), ord=float("inf")), np.linalg.norm(data, ord=np.inf), atol=1e-4)
 
+    def test_spectral(self):
+        data = np.random.randn(5, 3).astype(np.float32)
+        assert_close(tnp.linalg.norm(Tensor(data), ord=2), np.linalg.norm(data, ord=2), atol=1e-4)
+        assert_close(tnp.linalg.norm(Tensor(data), ord=-2), np.linalg.norm(data, ord=-2), atol=1e-4)
+
+    def test_spectral_over_leading_axes(self):
+        data = np.random.randn(4, 3, 2).astype(np.float32)
+        result = tnp.linalg.norm(Tensor(data), ord=2, axis=(0, 1), keepdims=True)
+        assert_close(result, np.linalg.norm(data, ord=2, axis=(0, 1), keepdims=True), atol=1e-4)
+
 
 class TestLinalgDet:
     def test_basic(self):
@@ -586,6 +615,25 @@ class TestLinalgDet:
         a = np.eye(4, dtype=np.float32)
         assert_close(tnp.linalg.det(Tensor(a)), np.linalg.det(a), atol=1e-5)
 
+    def test_batched(self):
+        a = np.random.randn(2, 3, 5, 5).astype(np.float32)
+        assert_close(tnp.linalg.det(Tensor(a)), np.linalg.det(a), atol=1e-3, rtol=1e-4)
+
+    def test_larger(self):
+        a = np.random.randn(24, 24).astype(np.float32)
+        expected = np.linalg.det(a.astype(np.float64))
+        assert_close(tnp.linalg.det(Tensor(a)) / expected, 1.0, atol=1e-3)
+
+    def test_singular(self):
+        a = np.array([[1, 2, 3], [2, 4, 6], [1, 0, 1]], dtype=np.float32)
+        assert_close(tnp.linalg.det(Tensor(a)), 0.0, atol=1e-6)
+
+    def test_float64_keeps_dtype_and_accuracy(self):
+        a = np.random.randn(2, 10, 10)
+        result = tnp.linalg.det(Tensor(a))
+        assert result.dtype == dtypes.float64
+        np.testing.assert_allclose(result.numpy(), np.linalg.det(a), rtol=1e-10)
+
 
 class TestLinalgInv:
     def test_basic(self):
@@ -596,6 +644,11 @@ class TestLinalgInv:
         a = np.eye(3, dtype=np.float32)
         assert_close(tnp.linalg.inv(Tensor(a)), np.linalg.inv(a), atol=1e-5)
 
+    def test_batched_needs_pivoting(self):
+        a = np.random.randn(4, 6, 6).astype(np.float32)
+        a[:, 0, 0] = 0.0
+        assert_close(tnp.linalg.inv(Tensor(a)), np.linalg.inv(a), atol=1e-3, rtol=1e-3)
+
 
 class TestLinalgSolve:
     def test_basic(self):
@@ -603,12 +656,28 @@ class TestLinalgSolve:
         b = np.array([9, 8], dtype=np.float32)
         assert_close(tnp.linalg.solve(Tensor(a), Tensor(b)), np.linalg.solve(a, b), atol=1e-4)
 
+    def test_batched_matrix_right_hand_side(self):
+        a = np.random.randn(3, 8, 8).astype(np.float32) + 8 * np.eye(8, dtype=np.float32)
+        b = np.random.randn(3, 8, 2).astype(np.float32)
+        assert_close(tnp.linalg.solve(Tensor(a), Tensor(b)), np.linalg.solve(a, b), atol=1e-4, rtol=1e-4)
+
+    def test_float64_keeps_dtype_and_accuracy(self):
+        a, b = np.random.randn(12, 12), np.random.randn(12)
+        result = tnp.linalg.solve(Tensor(a), Tensor(b))
+        assert result.dtype == dtypes.float64
+        np.testing.assert_allclose(result.numpy(), np.linalg.solve(a, b), rtol=1e-9, atol=1e-12)
+
 
 class TestLinalgCholesky:
     def test_basic(self):
         a = np.array([[4, 2], [2, 3]], dtype=np.float32)
         assert_close(tnp.linalg.cholesky(Tensor(a)), np.linalg.cholesky(a), atol=1e-4)
 
+    def test_batched(self):
+        x = np.random.randn(3, 50, 8, 8).astype(np.float32)
+        a = x @ np.swapaxes(x, -1, -2) + 8 * np.eye(8, dtype=np.float32)
+        assert_close(tnp.linalg.cholesky(Tensor(a)), np.linalg.cholesky(a), atol=1e-4, rtol=1e-4)
+
 
 class TestLinalgQr:
     def test_basic(self):
@@ -618,6 +687,70 @@ class TestLinalgQr:
         # QR can differ by sign; check Q @ R = A
         assert_close(q_tn.matmul(r_tn), Tensor(a), atol=1e-4)
 
+    def test_batched_matches_numpy(self):
+        a = np.random.randn(3, 5, 4).astype(np.float32)
+        q_tn, r_tn = tnp.linalg.qr(Tensor(a))
+        q_np, r_np = np.linalg.qr(a)
+        # Both factors are unique once the diagonal of R is made non-negative.
+        signs = np.sign(np.diagonal(r_np, axis1=-2, axis2=-1))
+        assert_close(q_tn, q_np * signs[:, None, :], atol=1e-4)
+        assert_close(r_tn, r_np * signs[:, :, None], atol=1e-4)
+
+    def test_complete(self):
+        a = np.random.randn(5, 3).astype(np.float32)
+        q_tn, r_tn = tnp.linalg.qr(Tensor(a), mode="complete")
+        assert q_tn.shape == (5, 5) and r_tn.shape == (5, 3)
+        assert_close(q_tn.matmul(r_tn), a, atol=1e-4)
+        assert_close(q_tn.transpose().matmul(q_tn), np.eye(5, dtype=np.float32), atol=1e-5)
+
+    def test_orthogonal_for_ill_conditioned_input(self):
+        left, _ = np.linalg.qr(np.random.randn(20, 20))
+        right, _ = np.linalg.qr(np.random.randn(20, 20))
+        a = (left * np.geomspace(1, 1e-6, 20) @ right.T).astype(np.float32)
+        q_tn, _ = tnp.linalg.qr(Tensor(a))
+        assert_close(q_tn.transpose().matmul(q_tn), np.eye(20, dtype=np.float32), atol=1e-5)
+
+    def test_float64_keeps_dtype_and_accuracy(self):
+        a = np.random.randn(2, 6, 4)
+        q_tn, r_tn = tnp.linalg.qr(Tensor(a))
+        assert q_tn.dtype == r_tn.dtype == dtypes.float64
+        q_np, r_np = np.linalg.qr(a)
+        signs = np.sign(np.diagonal(r_np, axis1=-2, axis2=-1))
+        np.testing.assert_allclose(q_tn.numpy(), q_np * signs[:, None, :], atol=1e-12)
+        np.testing.assert_allclose(r_tn.numpy(), r_np * signs[:, :, None], atol=1e-12)
+
+
+class TestLinalgEigh:
+    def test_batched_matches_numpy(self):
+        a = np.random.randn(4, 6, 6).astype(np.float32)
+        a = a + a.transpose(0, 2, 1)
+        w_tn, v_tn = tnp.linalg.eigh(Tensor(a))
+        w_np, v_np = np.linalg.eigh(a)
+        assert_close(w_tn, w_np, atol=1e-4)
+        # Eigenvectors are unique up to sign, so compare A V = V diag(w) and V^T V = I instead.
+        assert_close(Tensor(a).matmul(v_tn), v_tn * w_tn.unsqueeze(-2), atol=1e-4)
+        assert_close(v_tn.transpose(-1, -2).matmul(v_tn), np.broadcast_to(np.eye(6), a.shape), atol=1e-5)
+
+    def test_odd_size_reads_one_triangle(self):
+        a = np.random.randn(7, 7).astype(np.float32)
+        a = a + a.T
+        assert_close(tnp.linalg.eigvalsh(Tensor(np.tril(a))), np.linalg.eigvalsh(a), atol=1e-4)
+
+    def test_float64_keeps_dtype_and_accuracy(self):
+        a = np.random.randn(2, 8, 8)
+        a = a + a.transpose(0, 2, 1)
+        w_tn, v_tn = tnp.linalg.eigh(Tensor(a))
+        assert w_tn.dtype == v_tn.dtype == dtypes.float64
+        np.testing.assert_allclose(w_tn.numpy(), np.linalg.eigvalsh(a), atol=1e-10)
+        np.testing.assert_allclose(a @ v_tn.numpy(), v_tn.numpy() * w_tn.numpy()[:, None, :], atol=1e-10)
+        assert_close(tnp.linalg.eigvalsh(Tensor(np.triu(a)), UPLO="U"), np.linalg.eigvalsh(a), atol=1e-4)
+
+    def test_repeated_eigenvalues(self):
+        a = np.diag(np.array([2, 1, 2, 1], dtype=np.float32))
+        w_tn, v_tn = tnp.linalg.eigh(Tensor(a))
+        assert_close(w_tn, np.linalg.eigvalsh(a), atol=1e-6)
+        assert_close(v_tn.transpose().matmul(v_tn), np.eye(4, dtype=np.float32), atol=1e-6)
+
 
 class TestLinalgMatrixPower:
     def test_square(self):
@@ -630,12 +763,112 @@ class TestLinalgPinv:
         a = np.random.randn(4, 3).astype(np.float32)
         assert_close(tnp.linalg.pinv(Tensor(a)), np.linalg.pinv(a), atol=1e-3)
 
+    def test_rank_deficient(self):
+        a = (np.random.randn(6, 2) @ np.random.randn(2, 4)).astype(np.float32)
+        # In float32 numpy's default cutoff keeps rounding-noise singular values, so compare in float64.
+        assert_close(tnp.linalg.pinv(Tensor(a)), np.linalg.pinv(a.astype(np.float64), rcond=1e-6), atol=1e-3)
+
+    def test_badly_scaled_batch(self):
+        a = np.random.randn(3, 5, 4).astype(np.float32) * np.array([1e2, 1, 1e-2, 1], dtype=np.float32)
+        expected = np.linalg.pinv(a.astype(np.float64))
+        assert_close(tnp.linalg.pinv(Tensor(a)), expected, atol=1e-3, rtol=1e-3)
+
+    def test_hermitian_positional(self):
+        b = np.random.randn(5, 5)
+        a = (b + b.T).astype(np.float32)
+        assert_close(tnp.linalg.pinv(Tensor(a), 1e-6, True), np.linalg.pinv(a, 1e-6, True), atol=1e-3, rtol=1e-3)
+
+
+class TestLinalgSvd:
+    def test_batched_matches_numpy(self):
+        a = np.random.randn(3, 6, 4).astype(np.float32)
+        u, s, vh = tnp.linalg.svd(Tensor(a), full_matrices=False)
+        assert u.shape == (3, 6, 4) and s.shape == (3, 4) and vh.shape == (3, 4, 4)
+        assert_close(s, np.linalg.svd(a, compute_uv=False), atol=1e-4)
+        assert_close((u * s.unsqueeze(-2)).matmul(vh), a, atol=1e-4)
+
+    def test_full_matrices_rank_deficient(self):
+        a = (np.random.randn(3, 2) @ np.random.randn(2, 5)).astype(np.float32)
+        u, s, vh = tnp.linalg.svd(Tensor(a))
+        assert u.shape == (3, 3) and s.shape == (3,) and vh.shape == (5, 5)
+        assert_close(u.transpose().matmul(u), np.eye(3, dtype=np.float32), atol=1e-5)
+        assert_close(vh.matmul(vh.transpose()), np.eye(5, dtype=np.float32), atol=1e-5)
+        assert_close(u.matmul(s.unsqueeze(-1) * vh[:3]), a, atol=1e-4)
+
+    def test_reduced_rank_deficient_is_orthonormal(self):
+        a = (np.random.randn(2, 4, 2) @ np.random.randn(2, 2, 3)).astype(np.float32)
+        u, s, vh = tnp.linalg.svd(Tensor(a), full_matrices=False)
+        assert u.shape == (2, 4, 3) and vh.shape == (2, 3, 3)
+        assert_close(u.transpose(-1, -2).matmul(u), np.broadcast_to(np.eye(3, dtype=np.float32), (2, 3, 3)), atol=1e-5)
+        assert_close(s, np.linalg.svd(a, compute_uv=False), atol=1e-4)
+        assert_close((u * s.unsqueeze(-2)).matmul(vh), a, atol=1e-4)
+
+    def test_hermitian(self):
+        b = np.random.randn(3, 5, 5)
+        a = (b + b.transpose(0, 2, 1)).astype(np.float32)
+        u, s, vh = tnp.linalg.svd(Tensor(a), hermitian=True)
+        expected_u, expected_s, _ = np.linalg.svd(a, hermitian=True)
+        assert_close(s, expected_s, atol=1e-4)
+        # Eigenvectors are unique up to sign.
+        assert_close(u.abs(), np.abs(expected_u), atol=1e-4)
+        assert_close((u * s.unsqueeze(-2)).matmul(vh), a, atol=1e-4)
+        assert_close(tnp.linalg.svd(Tensor(a), compute_uv=False, hermitian=True), expected_s, atol=1e-4)
+
+    def test_float64_keeps_dtype_and_accuracy(self):
+        a = np.random.randn(2, 7, 5)
+        u, s, vh = tnp.linalg.svd(Tensor(a), full_matrices=False)
+        assert u.dtype == s.dtype == vh.dtype == dtypes.float64
+        np.testing.assert_allclose(s.numpy(), np.linalg.svd(a, compute_uv=False), atol=1e-10)
+        np.testing.assert_allclose((u.numpy() * s.numpy()[:, None, :]) @ vh.numpy(), a, atol=1e-10)
+
+    def test_values_only(self):
+        a = np.random.randn(7, 9).astype(np.float32)
+        assert_close(tnp.linalg.svd(Tensor(a), compute_uv=False), np.linalg.svd(a, compute_uv=False), atol=1e-4)
+
+    def test_repeated_calls_leave_input_untouched(self):
+        a = np.random.randn(6, 6).astype(np.float32)
+        matrix = Tensor(a).realize()
+        # Later calls replay the captured Jacobi step, which must not write into the input.
+        for _ in range(3):
+            u, s, vh = tnp.linalg.svd(matrix)
+            assert_close((u * s.unsqueeze(-2)).matmul(vh), a, atol=1e-4)
+        assert_close(matrix, a, atol=0)
+
+
+class TestLinalgCond:
+    def test_default(self):
+        a = np.random.randn(5, 5).astype(np.float32)
+        assert_close(tnp.linalg.cond(Tensor(a)), np.linalg.cond(a), rtol=1e-3)
+
+    def test_batched_non_square(self):
+        a = np.random.randn(2, 6, 3).astype(np.float32)
+        assert_close(tnp.linalg.cond(Tensor(a), p=2), np.linalg.cond(a, p=2), rtol=1e-3)
+        assert_close(tnp.linalg.cond(Tensor(a), p=-2), np.linalg.cond(a, p=-2), rtol=1e-3)
+
 
 class TestLinalgMatrixRank:
     def test_full_rank(self):
         a = np.eye(3, dtype=np.float32)
         assert_close(tnp.linalg.matrix_rank(Tensor(a)), np.linalg.matrix_rank(a))
 
+    def test_batched_rank_deficient(self):
+        low_rank = np.random.randn(6, 2) @ np.random.randn(2, 5)
+        a = np.stack([low_rank, np.eye(6, 5)]).astype(np.float32)
+        assert_close(tnp.linalg.matrix_rank(Tensor(a)), np.linalg.matrix_rank(a))
+
+    def test_absolute_tolerance(self):
+        a = np.diag(np.array([3, 1e-2, 1e-4], dtype=np.float32))
+        assert_close(tnp.linalg.matrix_rank(Tensor(a), tol=1e-3), np.linalg.matrix_rank(a, tol=1e-3))
+
+    def test_relative_tolerance(self):
+        a = np.diag(np.array([3, 1e-2, 1e-4], dtype=np.float32))
+        assert_close(tnp.linalg.matrix_rank(Tensor(a), rtol=1e-3), np.linalg.matrix_rank(a, rtol=1e-3))
+
+    def test_hermitian(self):
+        low_rank = np.random.randn(5, 2)
+        a = (low_rank @ np.diag([2.0, -1.0]) @ low_rank.T).astype(np.float32)
+        assert_close(tnp.linalg.matrix_rank(Tensor(a), None, True), np.linalg.matrix_rank(a, None, True))
+
 
 class TestLinalgLstsq:
     def test_basic(self):
@@ -667,6 +900,26 @@ class TestConvolve:
         v = np.array([1, 1, 1], dtype=np.float32)
         assert_close(tnp.convolve(Tensor(a), Tensor(v), mode="same"), np.convolve(a, v, mode="same"), atol=1e-5)
 
+    @pytest.mark.parametrize("mode", ["full", "same", "valid"])
+    def test_long_kernel_uses_fft(self, mode):
+        a = np.random.randn(2000).astype(np.float32)
+        v = np.random.randn(200).astype(np.float32)
+        assert_close(tnp.convolve(Tensor(a), Tensor(v), mode=mode), np.convolve(a, v, mode=mode), atol=1e-3)
+
+    @pytest.mark.parametrize("mode", ["full", "same", "valid"])
+    def test_comparable_lengths_use_fft(self, mode):
+        a = np.random.randn(300).astype(np.float32)
+        v = np.random.randn(200).astype(np.float32)
+        assert_close(tnp.convolve(Tensor(a), Tensor(v), mode=mode), np.convolve(a, v, mode=mode), atol=1e-3)
+
+    @pytest.mark.parametrize("length", [300, 2000])
+    def test_float64_above_crossover(self, length):
+        # 2000 samples are at least twice the kernel, so they take the overlap-save route.
+        a, v = np.random.randn(length), np.random.randn(200)
+        result = tnp.convolve(Tensor(a), Tensor(v), mode="full")
+        assert result.dtype == dtypes.float64
+        np.testing.assert_allclose(result.numpy(), np.convolve(a, v, mode="full"), atol=1e-10)
+
 
 class TestHanning:
     def test_basic(self):
@@ -730,6 +983,49 @@ class TestFFT:
         assert_close(result[:, 0], expected.real.astype(np.float32), atol=1e-3)
         assert_close(result[:, 1], expected.imag.astype(np.float32), atol=1e-3)
 
+    def test_long_power_of_two(self):
+        data = np.random.randn(1024).astype(np.float32)
+        complex_input = Tensor(np.stack([data, np.zeros_like(data)], axis=1))
+        result = tnp.fft.fft(complex_input)
+        expected = np.fft.fft(data)
+        assert_close(result[:, 0], expected.real.astype(np.float32), atol=1e-3, rtol=1e-4)
+        assert_close(result[:, 1], expected.imag.astype(np.float32), atol=1e-3, rtol=1e-4)
+
+    def test_batched_rows(self):
+        data = np.random.randn(5, 32).astype(np.float32) + 1j * np.random.randn(5, 32).astype(np.float32)
+        packed = Tensor(np.stack([data.real, data.imag], axis=-1).astype(np.float32))
+        result = tnp.fft.fft(packed)
+        expected = np.fft.fft(data, axis=-1)
+        assert result.shape == (5, 32, 2)
+        assert_close(result[..., 0], expected.real.astype(np.float32), atol=1e-3)
+        assert_close(result[..., 1], expected.imag.astype(np.float32), atol=1e-3)
+
+    def test_mixed_radix_length(self):
+        data = np.random.randn(3, 210).astype(np.float32)
+        packed = Tensor(np.stack([data, np.zeros_like(data)], axis=-1))
+        result = tnp.fft.fft(packed)
+        expected = np.fft.fft(data, axis=-1)
+        assert_close(result[..., 0], expected.real.astype(np.float32), atol=1e-3, rtol=1e-4)
+        assert_close(result[..., 1], expected.imag.astype(np.float32), atol=1e-3, rtol=1e-4)
+
+    def test_prime_length(self):
+        data = np.random.randn(11).astype(np.float32) + 1j * np.random.randn(11).astype(np.float32)
+        packed = Tensor(np.stack([data.real, data.imag], axis=-1).astype(np.float32))
+        result = tnp.fft.fft(packed)
+        expected = np.fft.fft(data)
+        assert_close(result[:, 0], expected.real.astype(np.float32), atol=1e-4)
+        assert_close(result[:, 1], expected.imag.astype(np.float32), atol=1e-4)
+
+    def test_repeated_length_reuses_cached_plan(self):
+        data = np.random.randn(12, 2).astype(np.float32)
+        tnp.fft.fft(Tensor(data))
+        hits_before = fourier_plan_cache_info().hits
+        result = tnp.fft.fft(Tensor(data))
+        expected = np.fft.fft(data[:, 0] + 1j * data[:, 1])
+        assert fourier_plan_cache_info().hits > hits_before
+        assert_close(result[:, 0], expected.real.astype(np.float32), atol=1e-4)
+        assert_close(result[:, 1], expected.imag.astype(np.float32), atol=1e-4)
+
 
 class TestIFFT:
     def test_roundtrip(self):
@@ -759,6 +1055,15 @@ class TestFFT2:
         assert_close(result[:, :, 0], expected.real.astype(np.float32), atol=1e-3)
         assert_close(result[:, :, 1], expected.imag.astype(np.float32), atol=1e-3)
 
+    def test_batched_images(self):
+        data = np.random.randn(3, 4, 6).astype(np.float32) + 1j * np.random.randn(3, 4, 6).astype(np.float32)
+        packed = Tensor(np.stack([data.real.astype(np.float32), data.imag.astype(np.float32)], axis=-1))
+        result = tnp.fft.fft2(packed)
+        expected = np.fft.fft2(data)
+        assert result.shape == (3, 4, 6, 2)
+        assert_close(result[..., 0], expected.real.astype(np.float32), atol=1e-3)
+        assert_close(result[..., 1], expected.imag.astype(np.float32), atol=1e-3)
+
 
 class TestIFFT2:
     def test_roundtrip(self):
@@ -822,6 +1127,14 @@ class TestRFFT:
             assert_close(result[:, 0], expected.real.astype(np.float32), atol=1e-4)
             assert_close(result[:, 1], expected.imag.astype(np.float32), atol=1e-4)
 
+    def test_batched_frames(self):
+        data = np.random.randn(2, 3, 16).astype(np.float32)
+        result = tnp.fft.rfft(Tensor(data))
+        expected = np.fft.rfft(data)
+        assert result.shape == (2, 3, 9, 2)
+        assert_close(result[..., 0], expected.real.astype(np.float32), atol=1e-3)
+        assert_close(result[..., 1], expected.imag.astype(np.float32), atol=1e-3)
+
 
 class TestIRFFT:
     def test_roundtrip_even(self):
@@ -851,3 +1164,11 @@ class TestIRFFT:
         expected = np.fft.irfft(spectrum).astype(np.float32)
         assert result.shape == (4,)
         assert_close(result, expected, atol=1e-3)
+
+    def test_batched_ignores_edge_imaginary_parts(self):
+        spectrum = np.fft.rfft(np.random.randn(3, 8)) + 0.5j
+        packed = Tensor(np.stack([spectrum.real, spectrum.imag], axis=-1).astype(np.float32))
+        result = tnp.fft.irfft(packed)
+        expected = np.fft.irfft(spectrum).astype(np.float32)
+        assert result.shape == (3, 8)
+        assert_close(result, expected, atol=1e-3)
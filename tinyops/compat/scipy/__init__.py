@@ -21,4 +21,38 @@ class _Spatial:
     distance = _SpatialDistance()
 
 
+class _Signal:
+    """Namespace mimicking scipy.signal."""
+
+    @staticmethod
+    def lfilter(b, a, x, axis=-1, zi=None):
+        """Filter data along one dimension with an IIR or FIR filter."""
+        from tinygrad import Tensor
+
+        from tinyops.ops.signal.linear_filter import linear_filter
+
+        b = b if isinstance(b, Tensor) else Tensor(b)
+        a = a if isinstance(a, Tensor) else Tensor(a)
+        y, zf = linear_filter(x.transpose(axis, -1), b, a, None if zi is None else zi.transpose(axis, -1))
+        y = y.transpose(axis, -1)
+        return y if zi is None else (y, zf.transpose(axis, -1))
+
+    @staticmethod
+    def sosfilt(sos, x, axis=-1, zi=None):
+        """Filter data along one dimension using cascaded second-order sections."""
+        from tinygrad import Tensor
+
+        from tinyops.ops.signal.second_order_sections_filter import second_order_sections_filter
+
+        sos = sos if isinstance(sos, Tensor) else Tensor(sos)
+        # zi is (sections, ...) with x's shape after it, so x's axis is one further along.
+        state_axis = axis + 1 if axis >= 0 else axis
+        y, zf = second_order_sections_filter(
+            x.transpose(axis, -1), sos, None if zi is None else zi.transpose(state_axis, -1)
+        )
+        y = y.transpose(axis, -1)
+        return y if zi is None else (y, zf.transpose(state_axis, -1))
+
+
 spatial = _Spatial()
+signal = _Signal()
@@ -4,8 +4,9 @@ Compares tinyops.compat.scipy against actual scipy.
 """
 
 import numpy as np
+import scipy.signal
 from scipy.spatial.distance import hamming as scipy_hamming
-from tinygrad import Tensor
+from tinygrad import Tensor, dtypes
 
 from tinyops._core import assert_close
 from tinyops.compat import scipy as tsp
@@ -46,3 +47,70 @@ class TestHammingDistance:
         result = tsp.spatial.distance.hamming(Tensor(a), Tensor(b))
         expected = scipy_hamming(a, b)
         assert_close(result, np.float32(expected), atol=1e-5)
+
+
+class TestLfilter:
+    def test_butterworth(self):
+        x = np.random.randn(4000).astype(np.float32)
+        b, a = scipy.signal.butter(2, 0.2)
+        result = tsp.signal.lfilter(Tensor(b.astype(np.float32)), Tensor(a.astype(np.float32)), Tensor(x))
+        assert_close(result, scipy.signal.lfilter(b, a, x), atol=1e-4, rtol=1e-4)
+
+    def test_fir_with_unnormalized_denominator(self):
+        x = np.random.randn(3, 500).astype(np.float32)
+        b, a = [1.0, -2.0, 0.5, 0.25], [2.0]
+        result = tsp.signal.lfilter(b, a, Tensor(x))
+        assert_close(result, scipy.signal.lfilter(b, a, x), atol=1e-5, rtol=1e-5)
+
+    def test_initial_conditions_along_axis_0(self):
+        x = np.random.randn(300, 3).astype(np.float32)
+        b, a = [0.3, 0.2], [1.0, -0.6, 0.1]
+        zi = np.random.randn(2, 3).astype(np.float32)
+        result, final_state = tsp.signal.lfilter(b, a, Tensor(x), axis=0, zi=Tensor(zi))
+        expected, expected_state = scipy.signal.lfilter(b, a, x, axis=0, zi=zi)
+        assert_close(result, expected, atol=1e-5, rtol=1e-5)
+        assert_close(final_state, expected_state, atol=1e-5, rtol=1e-5)
+
+    def test_empty_signal(self):
+        b, a = [1.0, 0.5], [1.0, -0.3]
+        assert tsp.signal.lfilter(Tensor(b), Tensor(a), Tensor(np.zeros(0))).numpy().shape == (0,)
+        zi = np.array([0.7])
+        result, final_state = tsp.signal.lfilter(Tensor(b), Tensor(a), Tensor(np.zeros(0)), zi=Tensor(zi))
+        expected, _ = scipy.signal.lfilter(b, a, np.zeros(0), zi=zi)
+        assert result.numpy().shape == expected.shape
+        # scipy's final state for empty input is uninitialized memory; nothing was filtered, so zi is kept.
+        np.testing.assert_allclose(final_state.numpy(), zi)
+
+    def test_float64_keeps_dtype_and_accuracy(self):
+        x = np.random.randn(2, 3000)
+        b, a = scipy.signal.butter(4, 0.05)
+        zi = np.random.randn(2, 4)
+        result, final_state = tsp.signal.lfilter(Tensor(b), Tensor(a), Tensor(x), zi=Tensor(zi))
+        expected, expected_state = scipy.signal.lfilter(b, a, x, zi=zi)
+        assert result.dtype == final_state.dtype == dtypes.float64
+        np.testing.assert_allclose(result.numpy(), expected, atol=1e-6)
+        np.testing.assert_allclose(final_state.numpy(), expected_state, atol=1e-6)
+
+
+class TestSosfilt:
+    def test_high_order_butterworth(self):
+        x = np.random.randn(2, 10000).astype(np.float32)
+        sos = scipy.signal.butter(8, 0.1, output="sos")
+        result = tsp.signal.sosfilt(Tensor(sos.astype(np.float32)), Tensor(x))
+        assert_close(result, scipy.signal.sosfilt(sos, x), atol=1e-4, rtol=1e-4)
+
+    def test_bandpass_with_initial_conditions(self):
+        x = np.random.randn(2, 3000).astype(np.float32)
+        sos = scipy.signal.ellip(4, 1, 60, [0.2, 0.3], btype="band", output="sos")
+        zi = np.random.randn(sos.shape[0], 2, 2).astype(np.float32)
+        result, final_state = tsp.signal.sosfilt(sos.astype(np.float32).tolist(), Tensor(x), zi=Tensor(zi))
+        expected, expected_state = scipy.signal.sosfilt(sos, x, zi=zi)
+        assert_close(result, expected, atol=1e-3, rtol=1e-4)
+        assert_close(final_state, expected_state, atol=1e-4, rtol=1e-4)
+
+    def test_float64_keeps_dtype_and_accuracy(self):
+        x = np.random.randn(3, 4000)
+        sos = scipy.signal.butter(8, 0.05, output="sos")
+        result = tsp.signal.sosfilt(Tensor(sos), Tensor(x))
+        assert result.dtype == dtypes.float64
+        np.testing.assert_allclose(result.numpy(), scipy.signal.sosfilt(sos, x), atol=1e-9)
@@ -3,6 +3,9 @@
 Provides torchaudio.transforms-compatible class signatures that delegate to tinyops.ops.
 """
 
+import warnings
+from collections.abc import Callable
+
 from tinygrad import Tensor
 
 from tinyops.ops.audio.amplitude_to_decibels import SpectrogramScale
@@ -10,9 +13,67 @@ from tinyops.ops.audio.amplitude_to_decibels import amplitude_to_decibels as _am
 from tinyops.ops.audio.fade import FadeShape
 from tinyops.ops.audio.fade import fade as _fade
 from tinyops.ops.audio.frequency_mask import frequency_mask as _freq_mask
+from tinyops.ops.audio.griffin_lim import GriffinLim as _GriffinLim
+from tinyops.ops.audio.mel_filterbank import MelFilterNormalization, MelScaleFormula
+from tinyops.ops.audio.mel_frequency_cepstral_coefficients import (
+    MelFrequencyCepstralCoefficients as _MelFrequencyCepstralCoefficients,
+)
+from tinyops.ops.audio.mel_scale import MelScale as _MelScale
+from tinyops.ops.audio.mel_spectrogram import MelSpectrogram as _MelSpectrogram
 from tinyops.ops.audio.mu_law_decode import mu_law_decode as _mu_law_decode
 from tinyops.ops.audio.mu_law_encode import mu_law_encode as _mu_law_encode
+from tinyops.ops.audio.phase_vocoder import phase_vocoder as _phase_vocoder
+from tinyops.ops.audio.resample import Resample as _Resample
+from tinyops.ops.audio.resampling_filter_bank import DEFAULT_RESAMPLING_KAISER_BETA, ResamplingWindow
+from tinyops.ops.audio.spectrogram import SpectrogramNormalization
+from tinyops.ops.audio.spectrogram import spectrogram as _spectrogram
 from tinyops.ops.audio.time_mask import time_mask as _time_mask
+from tinyops.ops.signal.discrete_cosine_transform_matrix import CosineTransformNormalization
+from tinyops.ops.signal.short_time_fourier_transform import FramePaddingMode
+from tinyops.ops.signal.window_cache import WindowKind, realized_window
+
+_PAD_MODE_MAP = {
+    "reflect": FramePaddingMode.REFLECT,
+    "constant": FramePaddingMode.CONSTANT,
+}
+_MEL_NORM_MAP = {
+    None: MelFilterNormalization.NONE,
+    "slaney": MelFilterNormalization.SLANEY,
+}
+_MEL_SCALE_MAP = {
+    "htk": MelScaleFormula.HTK,
+    "slaney": MelScaleFormula.SLANEY,
+}
+_RESAMPLING_METHOD_MAP = {
+    "sinc_interp_hann": ResamplingWindow.HANN,
+    "sinc_interp_kaiser": ResamplingWindow.KAISER,
+}
+_SPECTROGRAM_NORM_MAP = {
+    "window": SpectrogramNormalization.WINDOW,
+    "frame_length": SpectrogramNormalization.FRAME_LENGTH,
+}
+_DCT_NORM_MAP = {
+    None: CosineTransformNormalization.NONE,
+    "ortho": CosineTransformNormalization.ORTHONORMAL,
+}
+
+
+def _hann_window(window_length: int, periodic: bool = True) -> Tensor:
+    return realized_window(WindowKind.HANN, window_length, symmetric=not periodic)
+
+
+def _spectrogram_normalization(normalized: bool | str) -> SpectrogramNormalization:
+    if isinstance(normalized, str):
+        if normalized not in _SPECTROGRAM_NORM_MAP:
+            raise ValueError(f"Invalid normalized parameter: {normalized}")
+        return _SPECTROGRAM_NORM_MAP[normalized]
+    return SpectrogramNormalization.WINDOW if normalized else SpectrogramNormalization.NONE
+
+
+def _pad_time(waveform: Tensor, pad: int) -> Tensor:
+    if pad <= 0:
+        return waveform
+    return waveform.pad((*((None,) * (waveform.ndim - 1)), (pad, pad)))
 
 
 class _Transforms:
@@ -90,5 +151,230 @@ class _Transforms:
         def __call__(self, spectrogram: Tensor) -> Tensor:
             return _time_mask(spectrogram, maximum_mask_length=self.time_mask_param)
 
+    class Spectrogram:
+        """Create a spectrogram from an audio signal.
+
+        *window_fn* is called as ``window_fn(win_length, **wkwargs)`` and must
+        return a tinygrad ``Tensor``; the default is a periodic Hann window,
+        like ``torch.hann_window``. *return_complex* is deprecated in
+        torchaudio and has no effect: ``power=None`` always gives the complex
+        STFT, as ``(real, imaginary)`` pairs on a trailing axis.
+        """
+
+        def __init__(
+            self,
+            n_fft: int = 400,
+            win_length: int | None = None,
+            hop_length: int | None = None,
+            pad: int = 0,
+            window_fn: Callable[..., Tensor] = _hann_window,
+            power: float | None = 2.0,
+            normalized: bool | str = False,
+            wkwargs: dict | None = None,
+            center: bool = True,
+            pad_mode: str = "reflect",
+            onesided: bool = True,
+            return_complex: bool | None = None,
+        ):
+            self.n_fft = n_fft
+            self.win_length = win_length if win_length is not None else n_fft
+            self.hop_length = hop_length if hop_length is not None else self.win_length // 2
+            self.pad = pad
+            self.power = power
+            self.normalization = _spectrogram_normalization(normalized)
+            self.center = center
+            self.pad_mode = pad_mode
+            self.onesided = onesided
+            self.window = window_fn(self.win_length, **(wkwargs or {}))
+
+        def __call__(self, waveform: Tensor) -> Tensor:
+            return _spectrogram(
+                _pad_time(waveform, self.pad),
+                frame_length=self.n_fft,
+                hop_length=self.hop_length,
+                window=self.window,
+                power=self.power,
+                normalization=self.normalization,
+                center=self.center,
+                padding_mode=_PAD_MODE_MAP[self.pad_mode],
+                onesided=self.onesided,
+            )
+
+    class MelScale:
+        """Turn a normal STFT into a mel frequency STFT."""
+
+        def __init__(
+            self,
+            n_mels: int = 128,
+            sample_rate: int = 16000,
+            f_min: float = 0.0,
+            f_max: float | None = None,
+            n_stft: int = 201,
+            norm: str | None = None,
+            mel_scale: str = "htk",
+        ):
+            self._mel_scale = _MelScale(
+                n_mels, sample_rate, n_stft, f_min, f_max, _MEL_NORM_MAP[norm], _MEL_SCALE_MAP[mel_scale]
+            )
+
+        def __call__(self, specgram: Tensor) -> Tensor:
+            return self._mel_scale(specgram)
+
+    class MelSpectrogram:
+        """Create a mel spectrogram for a raw audio signal.
+
+        *window_fn* and *wkwargs* behave as in :class:`Spectrogram`.
+        *onesided* is deprecated in torchaudio and has no effect; passing it
+        warns, as torchaudio does.
+        """
+
+        def __init__(
+            self,
+            sample_rate: int = 16000,
+            n_fft: int = 400,
+            win_length: int | None = None,
+            hop_length: int | None = None,
+            f_min: float = 0.0,
+            f_max: float | None = None,
+            pad: int = 0,
+            n_mels: int = 128,
+            window_fn: Callable[..., Tensor] = _hann_window,
+            power: float = 2.0,
+            normalized: bool | str = False,
+            wkwargs: dict | None = None,
+            center: bool = True,
+            pad_mode: str = "reflect",
+            onesided: bool | None = None,
+            norm: str | None = None,
+            mel_scale: str = "htk",
+        ):
+            if onesided is not None:
+                warnings.warn(
+                    "Argument 'onesided' has been deprecated and has no influence on the behavior of this module.",
+                    stacklevel=2,
+                )
+            self.pad = pad
+            window_length = win_length if win_length is not None else n_fft
+            self._mel_spectrogram = _MelSpectrogram(
+                sample_rate=sample_rate,
+                frame_length=n_fft,
+                window_length=window_length,
+                hop_length=hop_length,
+                window=window_fn(window_length, **(wkwargs or {})),
+                minimum_frequency=f_min,
+                maximum_frequency=f_max,
+                mel_band_count=n_mels,
+                power=power,
+                normalization=_spectrogram_normalization(normalized),
+                center=center,
+                padding_mode=_PAD_MODE_MAP[pad_mode],
+                filter_normalization=_MEL_NORM_MAP[norm],
+                formula=_MEL_SCALE_MAP[mel_scale],
+            )
+
+        def __call__(self, waveform: Tensor) -> Tensor:
+            return self._mel_spectrogram(_pad_time(waveform, self.pad))
+
+    class MFCC:
+        """Create the mel-frequency cepstrum coefficients from an audio signal."""
+
+        def __init__(
+            self,
+            sample_rate: int = 16000,
+            n_mfcc: int = 40,
+            dct_type: int = 2,
+            norm: str | None = "ortho",
+            log_mels: bool = False,
+            melkwargs: dict | None = None,
+        ):
+            if dct_type != 2:
+                raise ValueError(f"DCT type not supported: {dct_type}")
+            mel_spectrogram = _Transforms.MelSpectrogram(sample_rate=sample_rate, **(melkwargs or {}))
+            self.pad = mel_spectrogram.pad
+            self._mfcc = _MelFrequencyCepstralCoefficients(
+                sample_rate=sample_rate,
+                coefficient_count=n_mfcc,
+                normalization=_DCT_NORM_MAP[norm],
+                log_mels=log_mels,
+                mel_spectrogram=mel_spectrogram._mel_spectrogram,
+            )
+
+        def __call__(self, waveform: Tensor) -> Tensor:
+            return self._mfcc(_pad_time(waveform, self.pad))
+
+    class GriffinLim:
+        """Compute a waveform from a linear scale magnitude spectrogram.
+
+        *window_fn* and *wkwargs* behave as in :class:`Spectrogram`.
+        """
+
+        def __init__(
+            self,
+            n_fft: int = 400,
+            n_iter: int = 32,
+            win_length: int | None = None,
+            hop_length: int | None = None,
+            window_fn: Callable[..., Tensor] = _hann_window,
+            power: float = 2.0,
+            wkwargs: dict | None = None,
+            momentum: float = 0.99,
+            length: int | None = None,
+            rand_init: bool = True,
+        ):
+            self.rand_init = rand_init
+            window_length = win_length if win_length is not None else n_fft
+            self._griffin_lim = _GriffinLim(
+                n_fft,
+                n_iter,
+                window_length,
+                hop_length,
+                window_fn(window_length, **(wkwargs or {})),
+                power,
+                momentum,
+                length,
+            )
+
+        def __call__(self, specgram: Tensor) -> Tensor:
+            initial_phase = Tensor.rand(*specgram.shape, 2) if self.rand_init else None
+            return self._griffin_lim(specgram, initial_phase)
+
+    class TimeStretch:
+        """Stretch packed ``(..., freq, time, 2)`` complex spectrograms in time without changing pitch."""
+
+        def __init__(self, hop_length: int | None = None, n_freq: int = 201, fixed_rate: float | None = None):
+            self.hop_length = hop_length if hop_length is not None else n_freq - 1
+            self.n_freq = n_freq
+            self.fixed_rate = fixed_rate
+
+        def __call__(self, complex_specgrams: Tensor, overriding_rate: float | None = None) -> Tensor:
+            rate = overriding_rate if overriding_rate is not None else self.fixed_rate
+            if rate is None:
+                raise ValueError("If no fixed_rate is specified, must pass a valid rate to the forward method.")
+            return _phase_vocoder(complex_specgrams, rate, self.hop_length)
+
+    class Resample:
+        """Resample a signal from one frequency to another."""
+
+        def __init__(
+            self,
+            orig_freq: int = 16000,
+            new_freq: int = 16000,
+            resampling_method: str = "sinc_interp_hann",
+            lowpass_filter_width: int = 6,
+            rolloff: float = 0.99,
+            beta: float | None = None,
+        ):
+            self._resample = _Resample(
+                orig_freq,
+                new_freq,
+                lowpass_filter_width=lowpass_filter_width,
+                rolloff=rolloff,
+                window=_RESAMPLING_METHOD_MAP[resampling_method],
+                beta=DEFAULT_RESAMPLING_KAISER_BETA if beta is None else beta,
+            )
+
+        def __call__(self, waveform: Tensor) -> Tensor:
+            return self._resample(waveform)
+
 
 transforms = _Transforms()
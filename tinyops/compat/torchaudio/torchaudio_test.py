@@ -4,12 +4,14 @@ Compares tinyops.compat.torchaudio against actual torchaudio.
 """
 
 import numpy as np
+import pytest
 import torch
 import torchaudio.transforms as T
 from tinygrad import Tensor
 
 from tinyops._core import assert_close
 from tinyops.compat import torchaudio as tta
+from tinyops.ops.signal import WindowKind, realized_window
 
 
 class TestMuLawEncoding:
@@ -111,6 +113,12 @@ class TestFrequencyMasking:
         result_np = result.numpy()
         assert result_np.min() >= 0.0
 
+    def test_unmasked_values_preserved(self):
+        spectrogram = np.random.rand(1, 20, 30).astype(np.float32) + 1.0
+        result = tta.transforms.FrequencyMasking(freq_mask_param=5)(Tensor(spectrogram)).numpy()
+        kept = result != 0
+        np.testing.assert_array_equal(result[kept], spectrogram[kept])
+
 
 class TestTimeMasking:
     def test_shape_preserved(self):
@@ -125,3 +133,227 @@ class TestTimeMasking:
         result = transform(Tensor(spectrogram))
         result_np = result.numpy()
         assert result_np.min() >= 0.0
+
+    def test_unmasked_values_preserved(self):
+        spectrogram = np.random.rand(1, 20, 30).astype(np.float32) + 1.0
+        result = tta.transforms.TimeMasking(time_mask_param=5)(Tensor(spectrogram)).numpy()
+        kept = result != 0
+        np.testing.assert_array_equal(result[kept], spectrogram[kept])
+
+
+class TestSpectrogram:
+    def test_power_default_hop(self):
+        waveform = np.random.randn(2, 400).astype(np.float32)
+        result = tta.transforms.Spectrogram(n_fft=64)(Tensor(waveform))
+        expected = T.Spectrogram(n_fft=64)(torch.tensor(waveform)).numpy()
+        assert result.shape == expected.shape
+        assert_close(result, expected, atol=1e-3, rtol=1e-4)
+
+    def test_normalized_magnitude(self):
+        waveform = np.random.randn(1, 300).astype(np.float32)
+        result = tta.transforms.Spectrogram(n_fft=64, hop_length=10, power=1.0, normalized=True)(Tensor(waveform))
+        expected = T.Spectrogram(n_fft=64, hop_length=10, power=1.0, normalized=True)(torch.tensor(waveform)).numpy()
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_complex_short_window_constant_pad(self):
+        waveform = np.random.randn(300).astype(np.float32)
+        transform_ours = tta.transforms.Spectrogram(n_fft=48, win_length=32, pad=3, power=None, pad_mode="constant")
+        transform_ref = T.Spectrogram(n_fft=48, win_length=32, pad=3, power=None, pad_mode="constant")
+        result = transform_ours(Tensor(waveform))
+        expected = torch.view_as_real(transform_ref(torch.tensor(waveform))).numpy()
+        assert result.shape == expected.shape
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_window_fn_and_frame_length_normalization(self):
+        waveform = np.random.randn(2, 300).astype(np.float32)
+
+        def hamming_window(length, periodic=True):
+            return realized_window(WindowKind.HAMMING, length, symmetric=not periodic)
+
+        arguments = {"n_fft": 64, "hop_length": 16, "normalized": "frame_length", "wkwargs": {"periodic": False}}
+        result = tta.transforms.Spectrogram(window_fn=hamming_window, **arguments)(Tensor(waveform))
+        expected = T.Spectrogram(window_fn=torch.hamming_window, **arguments)(torch.tensor(waveform)).numpy()
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_two_sided_complex(self):
+        waveform = np.random.randn(250).astype(np.float32)
+        arguments = {"n_fft": 45, "power": None, "normalized": "window", "onesided": False}
+        result = tta.transforms.Spectrogram(**arguments)(Tensor(waveform))
+        expected = torch.view_as_real(T.Spectrogram(**arguments)(torch.tensor(waveform))).numpy()
+        assert result.shape == expected.shape
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_two_sided_power_ignores_return_complex(self):
+        waveform = np.random.randn(1, 320).astype(np.float32)
+        result = tta.transforms.Spectrogram(n_fft=64, onesided=False, return_complex=True)(Tensor(waveform))
+        expected = T.Spectrogram(n_fft=64, onesided=False)(torch.tensor(waveform)).numpy()
+        assert result.shape == expected.shape
+        assert_close(result, expected, atol=1e-3, rtol=1e-4)
+
+    def test_invalid_normalized_raises(self):
+        with pytest.raises(ValueError):
+            tta.transforms.Spectrogram(normalized="energy")
+
+
+class TestMelScale:
+    def test_default_htk(self):
+        spectrogram = np.abs(np.random.randn(2, 201, 12)).astype(np.float32)
+        result = tta.transforms.MelScale()(Tensor(spectrogram))
+        expected = T.MelScale()(torch.tensor(spectrogram)).numpy()
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_slaney_scale_and_norm(self):
+        spectrogram = np.abs(np.random.randn(201, 10)).astype(np.float32)
+        arguments = {"n_mels": 40, "sample_rate": 22050, "f_min": 50.0, "f_max": 8000.0}
+        arguments.update(norm="slaney", mel_scale="slaney")
+        result = tta.transforms.MelScale(**arguments)(Tensor(spectrogram))
+        expected = T.MelScale(**arguments)(torch.tensor(spectrogram)).numpy()
+        assert_close(result, expected, atol=1e-5, rtol=1e-4)
+
+
+class TestMelSpectrogram:
+    def test_default(self):
+        waveform = np.random.randn(2, 2000).astype(np.float32)
+        result = tta.transforms.MelSpectrogram()(Tensor(waveform))
+        expected = T.MelSpectrogram()(torch.tensor(waveform)).numpy()
+        assert result.shape == expected.shape
+        assert_close(result, expected, atol=1e-3, rtol=1e-4)
+
+    def test_custom_frames_and_padding(self):
+        waveform = np.random.randn(1500).astype(np.float32)
+        arguments = {"sample_rate": 22050, "n_fft": 256, "hop_length": 64, "n_mels": 32, "pad": 5, "norm": "slaney"}
+        result = tta.transforms.MelSpectrogram(**arguments)(Tensor(waveform))
+        expected = T.MelSpectrogram(**arguments)(torch.tensor(waveform)).numpy()
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_window_fn_and_normalization(self):
+        waveform = np.random.randn(2, 1200).astype(np.float32)
+
+        def hamming_window(length, periodic=True):
+            return realized_window(WindowKind.HAMMING, length, symmetric=not periodic)
+
+        arguments = {"n_fft": 128, "win_length": 96, "n_mels": 24, "normalized": True, "wkwargs": {"periodic": False}}
+        result = tta.transforms.MelSpectrogram(window_fn=hamming_window, **arguments)(Tensor(waveform))
+        expected = T.MelSpectrogram(window_fn=torch.hamming_window, **arguments)(torch.tensor(waveform)).numpy()
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_deprecated_onesided_warns(self):
+        waveform = np.random.randn(800).astype(np.float32)
+        with pytest.warns(UserWarning, match="onesided"):
+            transform = tta.transforms.MelSpectrogram(n_fft=64, n_mels=16, onesided=False)
+        with pytest.warns(UserWarning, match="onesided"):
+            reference = T.MelSpectrogram(n_fft=64, n_mels=16, onesided=False)
+        assert_close(transform(Tensor(waveform)), reference(torch.tensor(waveform)).numpy(), atol=1e-4, rtol=1e-4)
+
+
+class TestMFCC:
+    def test_decibel_mels(self):
+        waveform = np.random.randn(2, 2000).astype(np.float32)
+        result = tta.transforms.MFCC()(Tensor(waveform))
+        expected = T.MFCC()(torch.tensor(waveform)).numpy()
+        assert result.shape == expected.shape
+        assert_close(result, expected, atol=1e-2, rtol=1e-4)
+
+    def test_log_mels(self):
+        waveform = np.random.randn(1500).astype(np.float32)
+        arguments = {"n_mfcc": 13, "log_mels": True, "melkwargs": {"n_fft": 256, "n_mels": 40}}
+        result = tta.transforms.MFCC(**arguments)(Tensor(waveform))
+        expected = T.MFCC(**arguments)(torch.tensor(waveform)).numpy()
+        assert_close(result, expected, atol=1e-3, rtol=1e-4)
+
+    def test_unsupported_dct_type(self):
+        with pytest.raises(ValueError):
+            tta.transforms.MFCC(dct_type=3)
+
+
+class TestResample:
+    def test_downsample_batch(self):
+        waveform = np.random.randn(2, 3, 4410).astype(np.float32)
+        result = tta.transforms.Resample(44100, 16000)(Tensor(waveform))
+        expected = T.Resample(44100, 16000)(torch.tensor(waveform)).numpy()
+        assert result.shape == expected.shape
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_upsample(self):
+        waveform = np.random.randn(801).astype(np.float32)
+        result = tta.transforms.Resample(8000, 16000)(Tensor(waveform))
+        expected = T.Resample(8000, 16000)(torch.tensor(waveform)).numpy()
+        assert result.shape == expected.shape
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_kaiser_window(self):
+        waveform = np.random.randn(2, 2205).astype(np.float32)
+        arguments = {"resampling_method": "sinc_interp_kaiser", "lowpass_filter_width": 8, "rolloff": 0.95}
+        result = tta.transforms.Resample(22050, 16000, **arguments)(Tensor(waveform))
+        expected = T.Resample(22050, 16000, **arguments)(torch.tensor(waveform)).numpy()
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_equal_rates_is_identity(self):
+        waveform = np.random.randn(100).astype(np.float32)
+        assert_close(tta.transforms.Resample(48000, 48000)(Tensor(waveform)), waveform)
+
+
+class TestGriffinLim:
+    def test_zero_initial_phase_with_momentum(self):
+        waveform = np.random.randn(2, 4000).astype(np.float32)
+        specgram = T.Spectrogram(n_fft=256)(torch.tensor(waveform))
+        arguments = {"n_fft": 256, "n_iter": 4, "rand_init": False}
+        transform = tta.transforms.GriffinLim(**arguments)
+        expected = T.GriffinLim(**arguments)(specgram).numpy()
+        assert_close(transform(Tensor(specgram.numpy())), expected, atol=1e-4, rtol=1e-4)
+        # A second call with the same shape replays the captured iteration.
+        assert_close(transform(Tensor(specgram.numpy())), expected, atol=1e-4, rtol=1e-4)
+
+    def test_magnitude_with_length(self):
+        waveform = np.random.randn(3000).astype(np.float32)
+        specgram = T.Spectrogram(n_fft=128, power=1.0)(torch.tensor(waveform))
+        arguments = {"n_fft": 128, "n_iter": 3, "power": 1.0, "momentum": 0.0, "length": 3000, "rand_init": False}
+        result = tta.transforms.GriffinLim(**arguments)(Tensor(specgram.numpy()))
+        expected = T.GriffinLim(**arguments)(specgram).numpy()
+        assert result.shape == expected.shape
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_positional_window_fn(self):
+        waveform = np.random.randn(3000).astype(np.float32)
+        specgram = T.Spectrogram(n_fft=128, win_length=96, hop_length=24)(torch.tensor(waveform))
+
+        def hamming_window(length, periodic=True):
+            return realized_window(WindowKind.HAMMING, length, symmetric=not periodic)
+
+        arguments = (128, 3, 96, 24)
+        trailing = (2.0, {"periodic": True}, 0.5, 3000, False)
+        result = tta.transforms.GriffinLim(*arguments, hamming_window, *trailing)(Tensor(specgram.numpy()))
+        expected = T.GriffinLim(*arguments, torch.hamming_window, *trailing)(specgram).numpy()
+        assert result.shape == expected.shape
+        assert_close(result, expected, atol=1e-4, rtol=1e-4)
+
+    def test_random_initial_phase_shape(self):
+        specgram = np.abs(np.random.randn(65, 20)).astype(np.float32)
+        result = tta.transforms.GriffinLim(n_fft=128, n_iter=2)(Tensor(specgram))
+        assert result.shape == (19 * 64,)
+
+
+class TestTimeStretch:
+    # torchaudio accumulates the phase in single precision; the reference runs in double and ours stays close to it.
+    @staticmethod
+    def _complex_spectrogram(shape: tuple[int, ...]) -> torch.Tensor:
+        waveform = torch.tensor(np.random.randn(*shape).astype(np.float32))
+        return torch.stft(waveform, 256, 64, window=torch.hann_window(256), return_complex=True)
+
+    def test_fixed_rate(self):
+        specgram = self._complex_spectrogram((2, 3000))
+        expected = T.TimeStretch(hop_length=64, n_freq=129, fixed_rate=1.3)(specgram.to(torch.complex128))
+        result = tta.transforms.TimeStretch(hop_length=64, n_freq=129, fixed_rate=1.3)(
+            Tensor(torch.view_as_real(specgram).numpy())
+        )
+        assert_close(result, torch.view_as_real(expected).numpy(), atol=1e-3, rtol=1e-3)
+
+    def test_overriding_rate_slows_down(self):
+        specgram = self._complex_spectrogram((3000,))
+        expected = T.TimeStretch(n_freq=129)(specgram.to(torch.complex128), 0.8)
+        result = tta.transforms.TimeStretch(n_freq=129)(Tensor(torch.view_as_real(specgram).numpy()), 0.8)
+        assert_close(result, torch.view_as_real(expected).numpy(), atol=1e-3, rtol=1e-3)
+
+    def test_missing_rate_raises(self):
+        with pytest.raises(ValueError):
+            tta.transforms.TimeStretch(n_freq=129)(Tensor.zeros(129, 10, 2))
@@ -1 +1,9 @@
 """tinyops.ops - Pure tinygrad operations with domain-modeled API."""
+
+from ._jit_step_cache import (
+    DEFAULT_JIT_STEP_CACHE_SIZE,
+    clear_jit_step_cache,
+    jit_step_cache_info,
+    set_jit_step_cache_size,
+)
+from ._lru_cache import CacheInfo
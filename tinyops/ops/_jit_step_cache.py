@@ -0,0 +1,53 @@
+"""Captured TinyJit steps of iterative ops and their bounded module-level cache."""
+
+from collections.abc import Callable
+
+from tinygrad import TinyJit
+
+from tinyops.ops._lru_cache import CacheInfo, LeastRecentlyUsedCache
+
+# A captured step holds its compiled kernels and intermediate buffers; 32 covers the input shapes a
+# pipeline alternates between, while a sweep over many batch sizes releases its oldest captures.
+DEFAULT_JIT_STEP_CACHE_SIZE = 32
+
+_step_cache: LeastRecentlyUsedCache[TinyJit] = LeastRecentlyUsedCache(DEFAULT_JIT_STEP_CACHE_SIZE)
+
+
+def captured_step(function: Callable[..., None], key: tuple) -> TinyJit:
+    """Return the cached ``TinyJit`` of *function* for *key*, wrapping a new one on a miss.
+
+    The step's kernels are captured on its second call and replayed on
+    every later one, so *key* must pin down everything the captured graph
+    depends on besides the input buffers: their shapes and device, and for a
+    bound method the instance, which the cache then keeps alive.
+
+    Args:
+        function: Step that updates its tensor arguments in place.
+        key: Hashable description of the inputs, e.g. ``(shape, device)``.
+
+    Returns:
+        The ``TinyJit`` wrapping *function* for *key*.
+    """
+    return _step_cache.get((function, *key), lambda: TinyJit(function))
+
+
+def jit_step_cache_info() -> CacheInfo:
+    """Hit/miss counters and occupancy of the step cache."""
+    return _step_cache.info()
+
+
+def set_jit_step_cache_size(maximum_size: int) -> None:
+    """Bound the step cache to *maximum_size* steps, evicting the least recently used.
+
+    Args:
+        maximum_size: New bound; ``0`` disables caching, so every call captures afresh.
+
+    Raises:
+        ValueError: If ``maximum_size`` is negative.
+    """
+    _step_cache.resize(maximum_size)
+
+
+def clear_jit_step_cache() -> None:
+    """Drop every captured step and reset the hit/miss counters."""
+    _step_cache.clear()
@@ -0,0 +1,69 @@
+"""Bounded least-recently-used store behind the module-level caches of realized tables and captured steps."""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Counters of a module cache, mirroring ``functools.lru_cache``."""
+
+    hits: int
+    misses: int
+    maximum_size: int
+    current_size: int
+
+
+class LeastRecentlyUsedCache[Value]:
+    """Values keyed by hashable tuples, dropping the least recently used beyond ``maximum_size``.
+
+    Unlike ``functools.lru_cache`` the bound can change at runtime, and the
+    key is built by the caller, so arguments that only select a device or
+    dtype can be canonicalized before the lookup.
+    """
+
+    def __init__(self, maximum_size: int):
+        self.maximum_size = maximum_size
+        self.hits = 0
+        self.misses = 0
+        self.values: OrderedDict[tuple, Value] = OrderedDict()
+
+    def get(self, key: tuple, build: Callable[[], Value]) -> Value:
+        """Return the value stored under *key*, calling *build* and storing its result on a miss."""
+        value = self.values.get(key)
+        if value is not None:
+            self.hits += 1
+            self.values.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = build()
+        if self.maximum_size > 0:
+            self.values[key] = value
+            self._evict_to(self.maximum_size)
+        return value
+
+    def info(self) -> CacheInfo:
+        """Hit/miss counters and occupancy."""
+        return CacheInfo(self.hits, self.misses, self.maximum_size, len(self.values))
+
+    def resize(self, maximum_size: int) -> None:
+        """Bound the cache to *maximum_size* values, evicting the least recently used.
+
+        Raises:
+            ValueError: If ``maximum_size`` is negative.
+        """
+        if maximum_size < 0:
+            raise ValueError(f"maximum_size must be non-negative, got {maximum_size}")
+        self.maximum_size = maximum_size
+        self._evict_to(maximum_size)
+
+    def clear(self) -> None:
+        """Drop every value and reset the hit/miss counters."""
+        self.values.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _evict_to(self, maximum_size: int) -> None:
+        while len(self.values) > maximum_size:
+            self.values.popitem(last=False)
@@ -1,5 +1,6 @@
 """Shared tensor helpers for ops that must stay on tinygrad + stdlib only."""
 
+import math
 from collections.abc import Sequence
 
 from tinygrad import Tensor
@@ -11,3 +12,35 @@ def unique_sorted_values(values: Tensor) -> list:
     if not isinstance(flat, Sequence) or isinstance(flat, (str, bytes)):
         flat = [flat]
     return sorted(set(flat))
+
+
+# 2 pi split Cody-Waite style: the leading part has few mantissa bits, so multiples of it are exact in float32.
+_TWO_PI_LEADING = 6.28125
+_TWO_PI_TRAILING = 2 * math.pi - _TWO_PI_LEADING
+
+
+def principal_angle(angle: Tensor) -> Tensor:
+    """Wrap *angle* into ``[-pi, pi]`` without losing the precision of large float32 phases.
+
+    Subtracting ``round(angle / 2 pi)`` turns of a two-part ``2 pi`` keeps
+    the remainder accurate to the input's own rounding, where a single
+    float32 ``2 pi`` constant (or ``cos`` of the unreduced angle) would
+    add an error proportional to the number of turns.
+    """
+    turns = (angle / (2 * math.pi)).round()
+    return angle - turns * _TWO_PI_LEADING - turns * _TWO_PI_TRAILING
+
+
+def complex_angle(real: Tensor, imaginary: Tensor) -> Tensor:
+    """Elementwise ``atan2(imaginary, real)`` in ``[-pi, pi]``, zero where both parts are zero.
+
+    The ratio of the smaller to the larger magnitude stays in ``[0, 1]``,
+    where ``atan`` is well conditioned; the quadrant is restored afterwards.
+    """
+    absolute_real, absolute_imaginary = real.abs(), imaginary.abs()
+    larger = absolute_real.maximum(absolute_imaginary)
+    smaller = absolute_real.minimum(absolute_imaginary)
+    angle = (smaller / (larger == 0).where(1.0, larger)).atan()
+    angle = (absolute_imaginary > absolute_real).where(math.pi / 2 - angle, angle)
+    angle = (real < 0).where(math.pi - angle, angle)
+    return (imaginary < 0).where(-angle, angle)
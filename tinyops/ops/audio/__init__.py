@@ -1,8 +1,29 @@
 """Audio processing operations: encoding, transforms, masking."""
 
+from ._filter_matrices import (
+    DEFAULT_FILTER_MATRIX_CACHE_SIZE,
+    clear_filter_matrix_cache,
+    filter_matrix_cache_info,
+    set_filter_matrix_cache_size,
+)
 from .amplitude_to_decibels import SpectrogramScale, amplitude_to_decibels
 from .fade import FadeShape, fade
 from .frequency_mask import frequency_mask
+from .griffin_lim import GriffinLim
+from .mel_filterbank import MelFilterNormalization, MelScaleFormula, hertz_to_mel, mel_filterbank, mel_to_hertz
+from .mel_frequency_cepstral_coefficients import MelFrequencyCepstralCoefficients
+from .mel_scale import MelScale
+from .mel_spectrogram import MelSpectrogram
 from .mu_law_decode import mu_law_decode
 from .mu_law_encode import mu_law_encode
+from .phase_vocoder import phase_vocoder
+from .resample import Resample
+from .resampling_filter_bank import (
+    DEFAULT_RESAMPLING_KAISER_BETA,
+    ResamplingWindow,
+    reduced_sample_rates,
+    resampling_filter_bank,
+)
+from .spectrogram import SpectrogramNormalization, spectrogram
+from .spectrogram_augmentation import spectrogram_augmentation
 from .time_mask import time_mask
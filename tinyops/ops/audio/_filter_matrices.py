@@ -0,0 +1,97 @@
+"""Realized constant matrices for the audio transforms, built once per configuration.
+
+Transforms look their matrices up here in ``__init__``, so every instance
+with the same configuration (for example one per worker request) shares a
+single realized buffer instead of rebuilding the filterbank graph.
+"""
+
+from collections.abc import Callable
+
+from tinygrad import Device, Tensor
+
+from tinyops.ops._lru_cache import CacheInfo, LeastRecentlyUsedCache
+from tinyops.ops.audio.mel_filterbank import MelFilterNormalization, MelScaleFormula, mel_filterbank
+from tinyops.ops.audio.resampling_filter_bank import ResamplingWindow, resampling_filter_bank
+from tinyops.ops.signal.discrete_cosine_transform_matrix import (
+    CosineTransformNormalization,
+    discrete_cosine_transform_matrix,
+)
+
+# The largest entries are resampling banks (160 x 161 taps for 44100 -> 48000); 64 covers the
+# configurations a feature pipeline mixes, while a sweep over rates or band counts cannot pin every
+# matrix it ever built.
+DEFAULT_FILTER_MATRIX_CACHE_SIZE = 64
+
+_matrix_cache: LeastRecentlyUsedCache[Tensor] = LeastRecentlyUsedCache(DEFAULT_FILTER_MATRIX_CACHE_SIZE)
+
+
+def _realized_matrix(build: Callable[..., Tensor], arguments: tuple, device: str | None) -> Tensor:
+    device = Device.canonicalize(device)
+    return _matrix_cache.get((build, *arguments, device), lambda: build(*arguments).to(device).realize())
+
+
+def realized_mel_filterbank(
+    frequency_bin_count: int,
+    sample_rate: int,
+    mel_band_count: int,
+    minimum_frequency: float,
+    maximum_frequency: float | None,
+    normalization: MelFilterNormalization,
+    formula: MelScaleFormula,
+    device: str | None = None,
+) -> Tensor:
+    arguments = (
+        frequency_bin_count,
+        sample_rate,
+        mel_band_count,
+        minimum_frequency,
+        maximum_frequency,
+        normalization,
+        formula,
+    )
+    return _realized_matrix(mel_filterbank, arguments, device)
+
+
+def realized_cosine_transform_matrix(
+    coefficient_count: int,
+    input_length: int,
+    normalization: CosineTransformNormalization,
+    device: str | None = None,
+) -> Tensor:
+    arguments = (coefficient_count, input_length, normalization)
+    return _realized_matrix(discrete_cosine_transform_matrix, arguments, device)
+
+
+def realized_resampling_filter_bank(
+    original_frequency: int,
+    new_frequency: int,
+    lowpass_filter_width: int,
+    rolloff: float,
+    window: ResamplingWindow,
+    beta: float,
+    device: str | None = None,
+) -> Tensor:
+    arguments = (original_frequency, new_frequency, lowpass_filter_width, rolloff, window, beta)
+    return _realized_matrix(resampling_filter_bank, arguments, device)
+
+
+def filter_matrix_cache_info() -> CacheInfo:
+    """Hit/miss counters and occupancy of the mel, DCT and resampling matrix cache."""
+    return _matrix_cache.info()
+
+
+def set_filter_matrix_cache_size(maximum_size: int) -> None:
+    """Bound the matrix cache to *maximum_size* matrices, evicting the least recently used.
+
+    Args:
+        maximum_size: New bound; ``0`` disables caching.
+
+    Raises:
+        ValueError: If ``maximum_size`` is negative.
+    """
+    _matrix_cache.resize(maximum_size)
+
+
+def clear_filter_matrix_cache() -> None:
+    """Drop every cached matrix and reset the hit/miss counters."""
+    _matrix_cache.clear()
@@ -1,5 +1,7 @@
 from tinygrad import Tensor
 
+from tinyops.ops.audio.spectrogram_augmentation import spectrogram_augmentation
+
 
 def _spectrogram_mask(
     spectrogram: Tensor,
@@ -8,9 +10,12 @@ def _spectrogram_mask(
     mask_value: float = 0.0,
     independent_masks: bool = False,
     _random_values: tuple | None = None,
-    _indices: Tensor | None = None,
 ) -> Tensor:
-    """Mask a contiguous region along a specific axis in a spectrogram."""
+    """Mask a contiguous region along the frequency (``axis=-2``) or time (``axis=-1``) axis of a spectrogram.
+
+    This is the single-band case of
+    :func:`~tinyops.ops.audio.spectrogram_augmentation.spectrogram_augmentation`.
+    """
     if spectrogram.ndim < 2:
         raise ValueError("Input spectrogram must be at least 2D.")
     if maximum_mask_length < 0:
@@ -34,15 +39,8 @@ def _spectrogram_mask(
         random_length = Tensor.rand(*random_shape)
         random_start = Tensor.rand(*random_shape)
 
-    mask_length = (random_length * maximum_mask_length).floor()
-    mask_start = (random_start * (dim_count - mask_length)).floor()
-
-    if _indices is None:
-        index_shape = [1] * spectrogram.ndim
-        index_shape[axis] = dim_count
-        indices = Tensor.arange(dim_count, dtype=spectrogram.dtype).reshape(index_shape)
-    else:
-        indices = _indices
-
-    mask = (indices >= mask_start) & (indices < mask_start + mask_length)
-    return spectrogram.where(mask.logical_not(), mask_value)
+    # The (length, start) pair sits on the singleton axes; the first of them becomes the axis of masks.
+    random_values = random_length.stack(random_start, dim=-1)[..., 0, :, :]
+    if axis == -2:
+        return spectrogram_augmentation(spectrogram, random_values, maximum_mask_length, 0, 1, 0, mask_value)
+    return spectrogram_augmentation(spectrogram, random_values, 0, maximum_mask_length, 0, 1, mask_value)
@@ -9,7 +9,6 @@ def frequency_mask(
     mask_value: float = 0.0,
     independent_masks: bool = False,
     _random_values: tuple | None = None,
-    _frequency_indices: Tensor | None = None,
 ) -> Tensor:
     """Mask a contiguous band of frequency bins in a spectrogram.
 
@@ -19,7 +18,6 @@ def frequency_mask(
         mask_value: Value to fill in the masked region.
         independent_masks: If True, apply different masks per batch element.
         _random_values: Internal testing parameter.
-        _frequency_indices: Internal testing parameter.
 
     Returns:
         Masked spectrogram tensor.
@@ -31,5 +29,4 @@ def frequency_mask(
         mask_value=mask_value,
         independent_masks=independent_masks,
         _random_values=_random_values,
-        _indices=_frequency_indices,
     )
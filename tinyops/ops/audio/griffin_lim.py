@@ -0,0 +1,121 @@
+from tinygrad import Tensor
+
+from tinyops.ops._jit_step_cache import captured_step
+from tinyops.ops.signal.inverse_short_time_fourier_transform import inverse_short_time_fourier_transform
+from tinyops.ops.signal.short_time_fourier_transform import short_time_fourier_transform
+from tinyops.ops.signal.window_cache import WindowKind, realized_window
+
+# Added to the magnitude before normalizing phases, so silent bins keep a finite phase.
+_PHASE_NORMALIZATION_EPSILON = 1e-16
+
+
+class GriffinLim:
+    """Reconstruct a waveform from a magnitude spectrogram with the fast Griffin-Lim algorithm.
+
+    Each iteration inverts the spectrogram with the current phase estimate,
+    re-analyses the result and keeps only its phase, extrapolated away from
+    the previous rebuild by ``momentum / (1 + momentum)`` as in fast
+    Griffin-Lim (Perraudin et al., 2013). The iteration body has a fixed
+    shape, so it runs under ``TinyJit``: the kernels are captured once per
+    spectrogram shape and later iterations (and later calls with that
+    shape) replay them without rescheduling. The captured steps live in the
+    bounded step cache (see :func:`~tinyops.ops.set_jit_step_cache_size`)
+    rather than on the instance. The default periodic Hann window is
+    realized once per configuration.
+
+    Args:
+        frame_length: FFT size ``n_fft`` of the spectrogram.
+        iteration_count: Number of phase refinement iterations.
+        window_length: Window length. ``None`` means ``frame_length``.
+        hop_length: Samples between frames. ``None`` means ``window_length // 2``.
+        window: Synthesis and analysis window of ``window_length`` samples.
+            ``None`` means a periodic Hann window.
+        power: Exponent the spectrogram magnitude was raised to (2 for power, 1 for magnitude).
+        momentum: Fast Griffin-Lim momentum in ``[0, 1)``; ``0`` is the original algorithm.
+        length: Output length in samples. ``None`` keeps ``(frames - 1) * hop_length``.
+
+    Raises:
+        ValueError: If *momentum* is outside ``[0, 1)``, *iteration_count*
+            is negative or *power* is not positive.
+    """
+
+    def __init__(
+        self,
+        frame_length: int = 400,
+        iteration_count: int = 32,
+        window_length: int | None = None,
+        hop_length: int | None = None,
+        window: Tensor | None = None,
+        power: float = 2.0,
+        momentum: float = 0.99,
+        length: int | None = None,
+    ):
+        if not 0 <= momentum < 1:
+            raise ValueError(f"momentum must be in the range [0, 1), got {momentum}")
+        if iteration_count < 0:
+            raise ValueError(f"iteration_count must be non-negative, got {iteration_count}")
+        if power <= 0:
+            raise ValueError(f"power must be positive, got {power}")
+
+        self.frame_length = frame_length
+        self.iteration_count = iteration_count
+        self.window_length = window_length if window_length is not None else frame_length
+        self.hop_length = hop_length if hop_length is not None else self.window_length // 2
+        self.power = power
+        self.momentum = momentum
+        self.length = length
+        if window is None:
+            window = realized_window(WindowKind.HANN, self.window_length, symmetric=False)
+        self.window = window
+
+    def _invert(self, magnitude: Tensor, angles: Tensor) -> Tensor:
+        spectrum = magnitude.unsqueeze(-1) * angles
+        return inverse_short_time_fourier_transform(
+            spectrum, self.frame_length, self.hop_length, self.window, center=True, length=self.length
+        )
+
+    def _iterate(self, magnitude: Tensor, angles: Tensor, previous: Tensor) -> None:
+        """One refinement step that updates *angles* and *previous* in place."""
+        waveform = self._invert(magnitude, angles)
+        rebuilt = short_time_fourier_transform(waveform, self.frame_length, self.hop_length, self.window).contiguous()
+        update = rebuilt - self.momentum / (1 + self.momentum) * previous
+        update = update / ((update * update).sum(axis=-1, keepdim=True).sqrt() + _PHASE_NORMALIZATION_EPSILON)
+        update = update.contiguous()
+        # Both new values read the old state, so they are realized before either buffer is overwritten.
+        Tensor.realize(rebuilt, update)
+        angles.assign(update)
+        previous.assign(rebuilt)
+        Tensor.realize(angles, previous)
+
+    def __call__(self, spectrogram: Tensor, initial_phase: Tensor | None = None) -> Tensor:
+        """Map a ``(..., frame_length // 2 + 1, frames)`` spectrogram to a ``(..., time)`` waveform.
+
+        Args:
+            spectrogram: Magnitude raised to *power*.
+            initial_phase: Starting phase estimate as complex values of shape
+                ``(..., frame_length // 2 + 1, frames, 2)`` (broadcastable);
+                it need not have unit modulus. ``None`` starts every bin at
+                phase zero. Pass ``Tensor.rand`` with a fixed seed for a
+                reproducible random start.
+
+        Raises:
+            ValueError: If the frequency axis does not match *frame_length*.
+        """
+        bin_count = self.frame_length // 2 + 1
+        if spectrogram.ndim < 2 or spectrogram.shape[-2] != bin_count:
+            raise ValueError(f"spectrogram must have shape (..., {bin_count}, frames), got {spectrogram.shape}")
+
+        magnitude = spectrogram.float().pow(1 / self.power).contiguous().realize()
+        complex_shape = (*magnitude.shape, 2)
+        if initial_phase is None:
+            angles = Tensor.ones(*magnitude.shape, 1).pad((None,) * magnitude.ndim + ((0, 1),))
+        else:
+            angles = initial_phase.float().expand(complex_shape)
+        # Fresh buffers: the iteration assigns into them, and the caller's phase must stay untouched.
+        angles = angles.clone().realize()
+        previous = Tensor.zeros(complex_shape).contiguous().realize()
+
+        step = captured_step(self._iterate, (magnitude.shape, magnitude.device))
+        for _ in range(self.iteration_count):
+            step(magnitude, angles, previous)
+        return self._invert(magnitude, angles)
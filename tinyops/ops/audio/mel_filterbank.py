@@ -0,0 +1,110 @@
+import math
+from enum import Enum
+
+from tinygrad import Tensor, dtypes
+
+# HTK: mel = 2595 * log10(1 + hz / 700).
+_HTK_MEL_FACTOR = 2595.0
+_HTK_CORNER_FREQUENCY = 700.0
+
+# Slaney (Auditory Toolbox): linear below 1 kHz, logarithmic above.
+_SLANEY_LINEAR_HERTZ_PER_MEL = 200.0 / 3
+_SLANEY_LOG_REGION_START_HERTZ = 1000.0
+_SLANEY_LOG_REGION_START_MEL = _SLANEY_LOG_REGION_START_HERTZ / _SLANEY_LINEAR_HERTZ_PER_MEL
+_SLANEY_LOG_STEP = math.log(6.4) / 27.0
+
+
+class MelScaleFormula(Enum):
+    """Hertz-to-mel mapping."""
+
+    HTK = "htk"
+    SLANEY = "slaney"
+
+
+class MelFilterNormalization(Enum):
+    """Per-filter scaling of the triangular mel filters."""
+
+    NONE = "none"
+    SLANEY = "slaney"
+
+
+def hertz_to_mel(frequency: float, formula: MelScaleFormula = MelScaleFormula.HTK) -> float:
+    """Convert a frequency in hertz to mels."""
+    if formula == MelScaleFormula.HTK:
+        return _HTK_MEL_FACTOR * math.log10(1.0 + frequency / _HTK_CORNER_FREQUENCY)
+    if frequency < _SLANEY_LOG_REGION_START_HERTZ:
+        return frequency / _SLANEY_LINEAR_HERTZ_PER_MEL
+    return _SLANEY_LOG_REGION_START_MEL + math.log(frequency / _SLANEY_LOG_REGION_START_HERTZ) / _SLANEY_LOG_STEP
+
+
+def mel_to_hertz(mel: float, formula: MelScaleFormula = MelScaleFormula.HTK) -> float:
+    """Convert mels to a frequency in hertz (inverse of :func:`hertz_to_mel`)."""
+    if formula == MelScaleFormula.HTK:
+        return _HTK_CORNER_FREQUENCY * (10.0 ** (mel / _HTK_MEL_FACTOR) - 1.0)
+    if mel < _SLANEY_LOG_REGION_START_MEL:
+        return mel * _SLANEY_LINEAR_HERTZ_PER_MEL
+    return _SLANEY_LOG_REGION_START_HERTZ * math.exp(_SLANEY_LOG_STEP * (mel - _SLANEY_LOG_REGION_START_MEL))
+
+
+def mel_filterbank(
+    frequency_bin_count: int,
+    sample_rate: int,
+    mel_band_count: int,
+    minimum_frequency: float = 0.0,
+    maximum_frequency: float | None = None,
+    normalization: MelFilterNormalization = MelFilterNormalization.NONE,
+    formula: MelScaleFormula = MelScaleFormula.HTK,
+) -> Tensor:
+    """Build a triangular mel filterbank matrix.
+
+    Filter edges are ``mel_band_count + 2`` points evenly spaced on the mel
+    scale; filter ``m`` rises from edge ``m`` to edge ``m + 1`` and falls to
+    edge ``m + 2``. STFT bins are spaced evenly on ``[0, sample_rate // 2]``,
+    matching ``torchaudio.functional.melscale_fbanks``. Multiplying the
+    result by a ``(..., frequency_bin_count, frames)`` spectrogram yields
+    ``(..., mel_band_count, frames)``.
+
+    Args:
+        frequency_bin_count: Number of STFT bins, ``n_fft // 2 + 1``.
+        sample_rate: Sample rate of the audio in hertz.
+        mel_band_count: Number of mel filters.
+        minimum_frequency: Lowest filter edge in hertz.
+        maximum_frequency: Highest filter edge in hertz. ``None`` means
+            ``sample_rate / 2``.
+        normalization: ``SLANEY`` scales each filter to unit area in hertz.
+        formula: Hertz-to-mel mapping.
+
+    Returns:
+        Tensor of shape ``(mel_band_count, frequency_bin_count)``.
+
+    Raises:
+        ValueError: If counts are not positive or the frequency range is empty.
+    """
+    if frequency_bin_count < 1 or mel_band_count < 1:
+        raise ValueError(
+            f"frequency_bin_count and mel_band_count must be positive, got {frequency_bin_count}, {mel_band_count}"
+        )
+    maximum_frequency = sample_rate / 2 if maximum_frequency is None else maximum_frequency
+    if not 0.0 <= minimum_frequency < maximum_frequency:
+        raise ValueError(
+            f"need 0 <= minimum_frequency < maximum_frequency, got {minimum_frequency}, {maximum_frequency}"
+        )
+
+    minimum_mel = hertz_to_mel(minimum_frequency, formula)
+    mel_step = (hertz_to_mel(maximum_frequency, formula) - minimum_mel) / (mel_band_count + 1)
+    edges = [mel_to_hertz(minimum_mel + index * mel_step, formula) for index in range(mel_band_count + 2)]
+    lower_edges = Tensor(edges[:-2], dtype=dtypes.float32).reshape(mel_band_count, 1)
+    center_edges = Tensor(edges[1:-1], dtype=dtypes.float32).reshape(mel_band_count, 1)
+    upper_edges = Tensor(edges[2:], dtype=dtypes.float32).reshape(mel_band_count, 1)
+
+    bin_spacing = (sample_rate // 2) / max(frequency_bin_count - 1, 1)
+    bin_frequencies = Tensor.arange(frequency_bin_count, dtype=dtypes.float32).reshape(1, frequency_bin_count)
+    bin_frequencies = bin_frequencies * bin_spacing
+
+    rising = (bin_frequencies - lower_edges) / (center_edges - lower_edges)
+    falling = (upper_edges - bin_frequencies) / (upper_edges - center_edges)
+    filters = rising.minimum(falling).maximum(0.0)
+
+    if normalization == MelFilterNormalization.SLANEY:
+        filters = filters * (2.0 / (upper_edges - lower_edges))
+    return filters
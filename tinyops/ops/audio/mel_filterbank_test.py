@@ -0,0 +1,68 @@
+"""Pure-tinygrad tests for mel filterbanks and the mel transforms (no reference libraries)."""
+
+from tinygrad import Device, Tensor
+
+from tinyops.ops.audio._filter_matrices import (
+    DEFAULT_FILTER_MATRIX_CACHE_SIZE,
+    clear_filter_matrix_cache,
+    filter_matrix_cache_info,
+    set_filter_matrix_cache_size,
+)
+from tinyops.ops.audio.mel_filterbank import MelScaleFormula, hertz_to_mel, mel_filterbank, mel_to_hertz
+from tinyops.ops.audio.mel_frequency_cepstral_coefficients import MelFrequencyCepstralCoefficients
+from tinyops.ops.audio.mel_scale import MelScale
+from tinyops.ops.audio.mel_spectrogram import MelSpectrogram
+
+
+def test_mel_conversion_roundtrip():
+    for formula in MelScaleFormula:
+        for frequency in (0.0, 440.0, 1000.0, 7600.0):
+            assert abs(mel_to_hertz(hertz_to_mel(frequency, formula), formula) - frequency) < 1e-6
+
+
+def test_filters_are_non_negative_triangles():
+    filters = mel_filterbank(frequency_bin_count=65, sample_rate=16000, mel_band_count=8).numpy()
+    assert filters.shape == (8, 65)
+    for row in filters:
+        assert float(row.min()) >= 0.0
+        assert 0.0 < float(row.max()) <= 1.0
+
+
+def test_rejects_empty_frequency_range():
+    try:
+        mel_filterbank(frequency_bin_count=65, sample_rate=16000, mel_band_count=8, minimum_frequency=9000.0)
+        raise AssertionError("expected ValueError")
+    except ValueError as error:
+        assert "minimum_frequency" in str(error)
+
+
+def test_instances_share_realized_filterbank():
+    assert MelScale(16, 8000, 33).filterbank is MelScale(16, 8000, 33).filterbank
+    default_device = MelScale(16, 8000, 33, device=Device.DEFAULT.lower()).filterbank
+    assert default_device is MelScale(16, 8000, 33).filterbank
+
+
+def test_filter_matrix_cache_is_bounded():
+    clear_filter_matrix_cache()
+    set_filter_matrix_cache_size(1)
+    try:
+        first = MelScale(16, 8000, 33).filterbank
+        MelScale(8, 8000, 33)
+        assert filter_matrix_cache_info() == (0, 2, 1, 1)
+        assert MelScale(16, 8000, 33).filterbank is not first
+    finally:
+        set_filter_matrix_cache_size(DEFAULT_FILTER_MATRIX_CACHE_SIZE)
+
+
+def test_mel_scale_rejects_mismatched_bins():
+    try:
+        MelScale(16, 8000, 33)(Tensor.ones(20, 4))
+        raise AssertionError("expected ValueError")
+    except ValueError as error:
+        assert "33" in str(error)
+
+
+def test_mfcc_output_shape():
+    mel_spectrogram = MelSpectrogram(sample_rate=8000, frame_length=64, mel_band_count=16)
+    transform = MelFrequencyCepstralCoefficients(8000, coefficient_count=5, mel_spectrogram=mel_spectrogram)
+    assert transform(Tensor.ones(2, 256)).shape == (2, 5, 9)
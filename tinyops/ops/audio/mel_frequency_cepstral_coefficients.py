@@ -0,0 +1,64 @@
+from tinygrad import Tensor
+
+from tinyops.ops.audio._filter_matrices import realized_cosine_transform_matrix
+from tinyops.ops.audio.amplitude_to_decibels import SpectrogramScale, amplitude_to_decibels
+from tinyops.ops.audio.mel_spectrogram import MelSpectrogram
+from tinyops.ops.signal.discrete_cosine_transform_matrix import CosineTransformNormalization
+
+# Offset added before the natural log when log_mels is set, as in torchaudio.
+_LOG_MEL_OFFSET = 1e-6
+# Dynamic range applied by the decibel conversion when log_mels is not set, as in torchaudio.
+_DECIBEL_DYNAMIC_RANGE = 80.0
+
+
+class MelFrequencyCepstralCoefficients:
+    """Mel-frequency cepstral coefficients: log-mel spectrogram, then one DCT-II matmul.
+
+    The DCT matrix is realized once per ``(coefficient_count, mel_band_count,
+    normalization)`` on the mel front end's device and shared between
+    instances.
+
+    Args:
+        sample_rate: Sample rate of the audio in hertz. Used to build the
+            default *mel_spectrogram*.
+        coefficient_count: Number of cepstral coefficients to keep.
+        normalization: DCT-II row scaling.
+        log_mels: If True, use ``log(mel + 1e-6)``; otherwise convert the
+            power mel spectrogram to decibels with an 80 dB dynamic range.
+        mel_spectrogram: Mel front end. ``None`` means
+            ``MelSpectrogram(sample_rate)``.
+
+    Raises:
+        ValueError: If *coefficient_count* exceeds the number of mel bands.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        coefficient_count: int = 40,
+        normalization: CosineTransformNormalization = CosineTransformNormalization.ORTHONORMAL,
+        log_mels: bool = False,
+        mel_spectrogram: MelSpectrogram | None = None,
+    ):
+        self.mel_spectrogram = mel_spectrogram if mel_spectrogram is not None else MelSpectrogram(sample_rate)
+        mel_band_count = self.mel_spectrogram.mel_scale.mel_band_count
+        if coefficient_count > mel_band_count:
+            raise ValueError(
+                f"coefficient_count ({coefficient_count}) cannot exceed the number of mel bands ({mel_band_count})"
+            )
+        self.sample_rate = sample_rate
+        self.coefficient_count = coefficient_count
+        self.normalization = normalization
+        self.log_mels = log_mels
+        self.cosine_transform = realized_cosine_transform_matrix(
+            coefficient_count, mel_band_count, normalization, self.mel_spectrogram.mel_scale.filterbank.device
+        )
+
+    def __call__(self, waveform: Tensor) -> Tensor:
+        """Map a ``(..., time)`` waveform to ``(..., coefficient_count, frames)``."""
+        mel = self.mel_spectrogram(waveform)
+        if self.log_mels:
+            log_mel = (mel + _LOG_MEL_OFFSET).log()
+        else:
+            log_mel = amplitude_to_decibels(mel, SpectrogramScale.POWER, dynamic_range=_DECIBEL_DYNAMIC_RANGE)
+        return self.cosine_transform @ log_mel
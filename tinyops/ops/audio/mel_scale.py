@@ -0,0 +1,65 @@
+from tinygrad import Tensor
+
+from tinyops.ops.audio._filter_matrices import realized_mel_filterbank
+from tinyops.ops.audio.mel_filterbank import MelFilterNormalization, MelScaleFormula
+
+
+class MelScale:
+    """Project a linear-frequency spectrogram onto mel bands.
+
+    The filterbank is realized once per configuration and device and shared
+    between instances; each call is a single matmul.
+
+    Args:
+        mel_band_count: Number of mel filters.
+        sample_rate: Sample rate of the audio in hertz.
+        frequency_bin_count: Number of STFT bins, ``n_fft // 2 + 1``.
+        minimum_frequency: Lowest filter edge in hertz.
+        maximum_frequency: Highest filter edge in hertz. ``None`` means
+            ``sample_rate / 2``.
+        normalization: Per-filter scaling.
+        formula: Hertz-to-mel mapping.
+        device: Device the filterbank is realized on; ``None`` means the
+            default device.
+    """
+
+    def __init__(
+        self,
+        mel_band_count: int = 128,
+        sample_rate: int = 16000,
+        frequency_bin_count: int = 201,
+        minimum_frequency: float = 0.0,
+        maximum_frequency: float | None = None,
+        normalization: MelFilterNormalization = MelFilterNormalization.NONE,
+        formula: MelScaleFormula = MelScaleFormula.HTK,
+        device: str | None = None,
+    ):
+        self.mel_band_count = mel_band_count
+        self.sample_rate = sample_rate
+        self.frequency_bin_count = frequency_bin_count
+        self.minimum_frequency = minimum_frequency
+        self.maximum_frequency = maximum_frequency
+        self.normalization = normalization
+        self.formula = formula
+        self.filterbank = realized_mel_filterbank(
+            frequency_bin_count,
+            sample_rate,
+            mel_band_count,
+            minimum_frequency,
+            maximum_frequency,
+            normalization,
+            formula,
+            device,
+        )
+
+    def __call__(self, spectrogram: Tensor) -> Tensor:
+        """Map ``(..., frequency_bin_count, frames)`` to ``(..., mel_band_count, frames)``.
+
+        Raises:
+            ValueError: If the frequency axis does not match the filterbank.
+        """
+        if spectrogram.ndim < 2 or spectrogram.shape[-2] != self.frequency_bin_count:
+            raise ValueError(
+                f"spectrogram must have shape (..., {self.frequency_bin_count}, frames), got {spectrogram.shape}"
+            )
+        return self.filterbank @ spectrogram
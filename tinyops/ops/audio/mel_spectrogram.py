@@ -0,0 +1,91 @@
+from tinygrad import Tensor
+
+from tinyops.ops.audio.mel_filterbank import MelFilterNormalization, MelScaleFormula
+from tinyops.ops.audio.mel_scale import MelScale
+from tinyops.ops.audio.spectrogram import SpectrogramNormalization, spectrogram
+from tinyops.ops.signal.short_time_fourier_transform import FramePaddingMode
+from tinyops.ops.signal.window_cache import WindowKind, realized_window
+
+
+class MelSpectrogram:
+    """Mel-band spectrogram of a waveform: STFT magnitude, then one filterbank matmul.
+
+    The default periodic Hann window and the filterbank are realized once
+    per configuration and shared between instances. Compose with
+    :func:`~tinyops.ops.audio.amplitude_to_decibels.amplitude_to_decibels`
+    for log-mel features.
+
+    Args:
+        sample_rate: Sample rate of the audio in hertz.
+        frame_length: FFT size ``n_fft``.
+        window_length: Window length. ``None`` means ``frame_length``.
+        hop_length: Samples between frames. ``None`` means ``window_length // 2``.
+        window: Analysis window of ``window_length`` samples. ``None`` means
+            a periodic Hann window.
+        minimum_frequency: Lowest filter edge in hertz.
+        maximum_frequency: Highest filter edge in hertz. ``None`` means
+            ``sample_rate / 2``.
+        mel_band_count: Number of mel filters.
+        power: Exponent applied to the STFT magnitude.
+        normalization: Scaling of the STFT before the magnitude is taken.
+        center: If True, pad half a frame on each side before framing.
+        padding_mode: Padding used when *center* is True.
+        filter_normalization: Per-filter scaling.
+        formula: Hertz-to-mel mapping.
+        device: Device the window and filterbank are realized on; ``None``
+            means the default device.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_length: int = 400,
+        window_length: int | None = None,
+        hop_length: int | None = None,
+        window: Tensor | None = None,
+        minimum_frequency: float = 0.0,
+        maximum_frequency: float | None = None,
+        mel_band_count: int = 128,
+        power: float = 2.0,
+        normalization: SpectrogramNormalization = SpectrogramNormalization.NONE,
+        center: bool = True,
+        padding_mode: FramePaddingMode = FramePaddingMode.REFLECT,
+        filter_normalization: MelFilterNormalization = MelFilterNormalization.NONE,
+        formula: MelScaleFormula = MelScaleFormula.HTK,
+        device: str | None = None,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_length = frame_length
+        self.window_length = window_length if window_length is not None else frame_length
+        self.hop_length = hop_length if hop_length is not None else self.window_length // 2
+        self.power = power
+        self.normalization = normalization
+        self.center = center
+        self.padding_mode = padding_mode
+        if window is None:
+            window = realized_window(WindowKind.HANN, self.window_length, symmetric=False, device=device)
+        self.window = window
+        self.mel_scale = MelScale(
+            mel_band_count,
+            sample_rate,
+            frame_length // 2 + 1,
+            minimum_frequency,
+            maximum_frequency,
+            filter_normalization,
+            formula,
+            device,
+        )
+
+    def __call__(self, waveform: Tensor) -> Tensor:
+        """Map a ``(..., time)`` waveform to ``(..., mel_band_count, frames)``."""
+        magnitude = spectrogram(
+            waveform,
+            self.frame_length,
+            hop_length=self.hop_length,
+            window=self.window,
+            power=self.power,
+            normalization=self.normalization,
+            center=self.center,
+            padding_mode=self.padding_mode,
+        )
+        return self.mel_scale(magnitude)
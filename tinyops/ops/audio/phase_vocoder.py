@@ -0,0 +1,110 @@
+import math
+from collections.abc import Sequence
+
+from tinygrad import Tensor, dtypes
+
+from tinyops.ops._tensor_utils import complex_angle, principal_angle
+
+
+def _frame_positions(
+    rates: Sequence[float], frame_count: int, output_frame_count: int
+) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+    """Per-rate ``(rates, 1, 1, output_frames)`` neighbouring frame indices, fractions and validity.
+
+    Output frame ``j`` of rate ``r`` sits at time step ``s = j * r``, between
+    input frames ``floor(s)`` and ``floor(s) + 1``. Indices past the end of
+    the input are clamped to ``frames``, the index of a silent padding
+    frame, and output frames past ``ceil(frames / r)`` are marked invalid.
+    The trailing singleton axes broadcast over the folded examples and
+    frequencies.
+    """
+    # Time steps are computed on the host in double precision, like torch.arange, before rounding to float32.
+    time_steps = Tensor(
+        [[index * rate for index in range(output_frame_count)] for rate in rates], dtype=dtypes.float32
+    ).reshape(len(rates), 1, 1, output_frame_count)
+    valid = Tensor(
+        [[index < math.ceil(frame_count / rate) for index in range(output_frame_count)] for rate in rates]
+    ).reshape(len(rates), 1, 1, output_frame_count)
+    lower_frame = time_steps.floor()
+    lower_index = lower_frame.cast(dtypes.int32)
+    upper_index = (lower_index + 1).minimum(frame_count)
+    return lower_index.minimum(frame_count), upper_index, time_steps - lower_frame, valid
+
+
+def phase_vocoder(spectrogram: Tensor, rate: float | Sequence[float], hop_length: int) -> Tensor:
+    """Stretch a complex spectrogram in time by *rate* without changing its pitch.
+
+    Output frame ``j`` reads input time ``j * rate``: its magnitude is
+    linearly interpolated between the two neighbouring frames, and its
+    phase is the running sum of the measured per-frame phase advance, each
+    wrapped around the advance expected from *hop_length*. The two
+    neighbouring frames of every output frame are gathered by index, so the
+    cost is linear in the number of frames, and the phase is accumulated
+    with one cumulative sum along time. The whole stretch (for every rate in
+    a batch) is a single graph with no per-frame loop.
+
+    Args:
+        spectrogram: Packed complex spectrogram of shape
+            ``(..., frequency, frames, 2)`` (real, imaginary).
+        rate: Speed-up factor; ``> 1`` shortens and ``< 1`` lengthens. A
+            sequence gives one rate per entry of the leading axis of
+            *spectrogram*, so a whole augmentation batch is stretched in
+            one call.
+        hop_length: Hop between STFT frames in samples; the expected phase
+            advance of bin ``k`` is ``pi * hop_length * k / (frequency - 1)``.
+
+    Returns:
+        Tensor of shape ``(..., frequency, ceil(frames / min_rate), 2)``. With
+        several rates, example ``b`` holds ``ceil(frames / rate[b])`` frames
+        followed by zeros.
+
+    Raises:
+        ValueError: If a rate or *hop_length* is not positive, the input is
+            not packed complex, or the number of rates does not match the
+            leading axis.
+    """
+    rates = [rate] if isinstance(rate, (int, float)) else list(rate)
+    if not rates or any(value <= 0 for value in rates):
+        raise ValueError(f"rates must be positive, got {rate}")
+    if hop_length <= 0:
+        raise ValueError(f"hop_length must be positive, got {hop_length}")
+    if spectrogram.ndim < 3 or spectrogram.shape[-1] != 2:
+        raise ValueError(f"spectrogram must have shape (..., frequency, frames, 2), got {spectrogram.shape}")
+    batched = not isinstance(rate, (int, float))
+    if batched and (spectrogram.ndim < 4 or spectrogram.shape[0] != len(rates)):
+        raise ValueError(f"expected a leading axis of {len(rates)} examples, got shape {spectrogram.shape}")
+    if not batched and rate == 1.0:
+        return spectrogram
+
+    *leading_shape, frequency_count, frame_count, _ = spectrogram.shape
+    output_frame_count = math.ceil(frame_count / min(rates))
+    # (rates, rest, frequency, frames): examples sharing a rate are folded together.
+    spectrogram = spectrogram.float().reshape(len(rates), -1, frequency_count, frame_count, 2)
+    real, imaginary = spectrogram[..., 0], spectrogram[..., 1]
+    magnitude = (real * real + imaginary * imaginary).sqrt()
+    # Materialized once; it feeds both frame gathers and the initial phase.
+    angle = complex_angle(real, imaginary).contiguous()
+
+    lower_index, upper_index, fraction, valid = _frame_positions(rates, frame_count, output_frame_count)
+    gathered_shape = (*magnitude.shape[:-1], output_frame_count)
+    lower_index, upper_index = lower_index.expand(gathered_shape), upper_index.expand(gathered_shape)
+    # One silent frame past the end stands in for every clamped index.
+    magnitude, padded_angle = magnitude.pad((0, 1)), angle.pad((0, 1))
+    lower_magnitude, upper_magnitude = magnitude.gather(-1, lower_index), magnitude.gather(-1, upper_index)
+    stretched_magnitude = valid.where(lower_magnitude * (1 - fraction) + upper_magnitude * fraction, 0.0)
+    # Expected advance per hop, reduced modulo 2 pi on the host so every phase term stays within a few radians.
+    advance_per_bin = math.pi * hop_length / max(frequency_count - 1, 1)
+    phase_advance = Tensor(
+        [math.remainder(bin_index * advance_per_bin, 2 * math.pi) for bin_index in range(frequency_count)],
+        dtype=dtypes.float32,
+    ).reshape(frequency_count, 1)
+    frame_difference = padded_angle.gather(-1, upper_index) - padded_angle.gather(-1, lower_index)
+    deviation = principal_angle(frame_difference - phase_advance)
+    # Frame j accumulates the initial phase plus the advances measured between earlier output frames.
+    increments = angle[..., :1].cat(principal_angle(deviation[..., :-1] + phase_advance), dim=-1)
+    accumulated_phase = principal_angle(increments.cumsum(axis=-1))
+
+    stretched = (stretched_magnitude * accumulated_phase.cos()).stack(
+        stretched_magnitude * accumulated_phase.sin(), dim=-1
+    )
+    return stretched.reshape(*leading_shape, frequency_count, output_frame_count, 2)
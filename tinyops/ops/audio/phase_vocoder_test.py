@@ -0,0 +1,61 @@
+"""Pure-tinygrad tests for the batched phase vocoder (no reference libraries)."""
+
+import math
+
+import pytest
+from tinygrad import Tensor
+
+from tinyops._core import assert_close
+from tinyops.ops.audio.phase_vocoder import phase_vocoder
+
+_FREQUENCY_COUNT = 9
+_FRAME_COUNT = 12
+_HOP_LENGTH = 4
+
+
+def _packed_spectrogram(example_count: int) -> Tensor:
+    """Deterministic ``(examples, frequency, frames, 2)`` spectrogram with varied magnitude and phase."""
+    magnitude = Tensor.arange(example_count * _FREQUENCY_COUNT * _FRAME_COUNT).reshape(
+        example_count, _FREQUENCY_COUNT, _FRAME_COUNT
+    )
+    phase = (magnitude * 0.7).sin() * 3
+    magnitude = 1 + (magnitude * 0.3).cos()
+    return (magnitude * phase.cos()).stack(magnitude * phase.sin(), dim=-1)
+
+
+def test_unit_rate_is_identity():
+    spectrogram = _packed_spectrogram(2)
+    assert phase_vocoder(spectrogram, 1.0, _HOP_LENGTH) is spectrogram
+
+
+def test_output_frame_count():
+    result = phase_vocoder(_packed_spectrogram(1), 0.7, _HOP_LENGTH)
+    assert result.shape == (1, _FREQUENCY_COUNT, math.ceil(_FRAME_COUNT / 0.7), 2)
+
+
+def test_integer_rate_keeps_selected_magnitudes():
+    spectrogram = _packed_spectrogram(1)
+    result = phase_vocoder(spectrogram, 2.0, _HOP_LENGTH)
+    expected_magnitude = (spectrogram[..., ::2, :] ** 2).sum(axis=-1).sqrt()
+    assert_close(result.square().sum(axis=-1).sqrt(), expected_magnitude, atol=1e-5, rtol=1e-5)
+
+
+def test_batched_rates_match_single_rate_calls():
+    rates = [1.5, 0.8, 1.1]
+    spectrogram = _packed_spectrogram(len(rates))
+    result = phase_vocoder(spectrogram, rates, _HOP_LENGTH)
+    assert result.shape == (len(rates), _FREQUENCY_COUNT, math.ceil(_FRAME_COUNT / 0.8), 2)
+    for example, rate in enumerate(rates):
+        expected = phase_vocoder(spectrogram[example], rate, _HOP_LENGTH)
+        frame_count = expected.shape[-2]
+        assert_close(result[example, :, :frame_count], expected, atol=1e-5, rtol=1e-5)
+        assert (result[example, :, frame_count:].abs().max().item() if frame_count < result.shape[-2] else 0) == 0
+
+
+@pytest.mark.parametrize(
+    ("rate", "shape"),
+    [(0.0, (1, 9, 12, 2)), (-1.0, (1, 9, 12, 2)), (1.2, (1, 9, 12)), ([1.2, 0.9], (3, 9, 12, 2))],
+)
+def test_invalid_arguments(rate, shape):
+    with pytest.raises(ValueError):
+        phase_vocoder(Tensor.zeros(*shape), rate, _HOP_LENGTH)
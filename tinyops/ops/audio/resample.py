@@ -0,0 +1,89 @@
+import math
+
+from tinygrad import Tensor
+
+from tinyops.ops.audio._filter_matrices import realized_resampling_filter_bank
+from tinyops.ops.audio.resampling_filter_bank import (
+    DEFAULT_RESAMPLING_KAISER_BETA,
+    ResamplingWindow,
+    reduced_sample_rates,
+)
+
+
+class Resample:
+    """Change the sample rate of waveforms with a polyphase windowed-sinc filter.
+
+    The rate ratio is reduced to ``L -> M`` and the ``M``-phase filter bank
+    is realized once per configuration and device and shared between
+    instances. Each call is one convolution with stride ``L`` over all
+    waveforms in the batch, whose ``M`` output channels interleave into the
+    new time axis.
+
+    Args:
+        original_frequency: Input sample rate in hertz.
+        new_frequency: Output sample rate in hertz.
+        lowpass_filter_width: Sinc zero crossings kept on each side of the centre.
+        rolloff: Cutoff as a fraction of the lower Nyquist frequency.
+        window: Taper applied to the truncated sinc.
+        beta: Kaiser shape parameter, used only with ``ResamplingWindow.KAISER``.
+        device: Device the filter bank is realized on; ``None`` means the
+            default device.
+
+    Raises:
+        ValueError: If a rate or ``lowpass_filter_width`` is not positive.
+    """
+
+    def __init__(
+        self,
+        original_frequency: int = 16000,
+        new_frequency: int = 16000,
+        lowpass_filter_width: int = 6,
+        rolloff: float = 0.99,
+        window: ResamplingWindow = ResamplingWindow.HANN,
+        beta: float = DEFAULT_RESAMPLING_KAISER_BETA,
+        device: str | None = None,
+    ):
+        self.original_frequency = original_frequency
+        self.new_frequency = new_frequency
+        self.lowpass_filter_width = lowpass_filter_width
+        self.rolloff = rolloff
+        self.window = window
+        self.beta = beta
+        self.reduced_original_frequency, self.reduced_new_frequency = reduced_sample_rates(
+            original_frequency, new_frequency
+        )
+        self.filter_bank = realized_resampling_filter_bank(
+            self.reduced_original_frequency,
+            self.reduced_new_frequency,
+            lowpass_filter_width,
+            rolloff,
+            window,
+            beta,
+            device,
+        )
+
+    def __call__(self, waveform: Tensor) -> Tensor:
+        """Resample ``(..., time)`` to ``(..., ceil(time * new_frequency / original_frequency))``.
+
+        Raises:
+            ValueError: If *waveform* is a scalar.
+        """
+        if waveform.ndim < 1:
+            raise ValueError("waveform must be at least 1-D")
+        if self.reduced_original_frequency == self.reduced_new_frequency:
+            return waveform
+
+        batch_shape = waveform.shape[:-1]
+        sample_count = waveform.shape[-1]
+        phase_count, tap_count = self.filter_bank.shape
+        stride = self.reduced_original_frequency
+        width = (tap_count - stride) // 2
+        output_length = math.ceil(phase_count * sample_count / stride)
+
+        signals = waveform.reshape(-1, 1, 1, sample_count).cast(self.filter_bank.dtype)
+        signals = signals.pad((None, None, None, (width, width + stride)))
+        weights = self.filter_bank.reshape(phase_count, 1, 1, tap_count)
+        # (batch, phase, 1, block) -> (batch, block, phase) so each block's phases are contiguous in time.
+        blocks = signals.conv2d(weights, stride=(1, stride))
+        interleaved = blocks.squeeze(2).transpose(1, 2).flatten(1)
+        return interleaved[:, :output_length].reshape(*batch_shape, output_length)
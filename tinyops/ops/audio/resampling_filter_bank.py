@@ -0,0 +1,81 @@
+import math
+from enum import Enum
+
+from tinygrad import Tensor
+
+from tinyops.ops.signal._window import kaiser_taper
+
+# Kaiser shape parameter torchaudio uses for ``sinc_interp_kaiser`` when none is given.
+DEFAULT_RESAMPLING_KAISER_BETA = 14.769656459379492
+
+
+class ResamplingWindow(Enum):
+    """Window applied to the truncated sinc interpolation kernel."""
+
+    HANN = "hann"
+    KAISER = "kaiser"
+
+
+def reduced_sample_rates(original_frequency: int, new_frequency: int) -> tuple[int, int]:
+    """Divide both rates by their greatest common divisor (44100 -> 16000 becomes 441 -> 160)."""
+    divisor = math.gcd(original_frequency, new_frequency)
+    return original_frequency // divisor, new_frequency // divisor
+
+
+def resampling_filter_bank(
+    original_frequency: int,
+    new_frequency: int,
+    lowpass_filter_width: int = 6,
+    rolloff: float = 0.99,
+    window: ResamplingWindow = ResamplingWindow.HANN,
+    beta: float = DEFAULT_RESAMPLING_KAISER_BETA,
+) -> Tensor:
+    """Polyphase bank of windowed-sinc interpolation filters.
+
+    With the rates reduced to ``L -> M``, output sample ``m`` of every
+    block of ``M`` reads ``L + 2 * width`` input samples through filter
+    ``m``, a sinc low-passed at ``min(L, M) * rolloff`` and evaluated at the
+    fractional offset of that output between the inputs. Stacking the
+    ``M`` phases lets one strided convolution produce a whole block per
+    ``L`` input samples.
+
+    Args:
+        original_frequency: Input sample rate in hertz.
+        new_frequency: Output sample rate in hertz.
+        lowpass_filter_width: Sinc zero crossings kept on each side of the
+            centre; larger is sharper and slower.
+        rolloff: Cutoff as a fraction of the lower Nyquist frequency.
+        window: Taper applied to the truncated sinc.
+        beta: Kaiser shape parameter, used only with ``ResamplingWindow.KAISER``.
+
+    Returns:
+        Tensor of shape ``(M, L + 2 * width)`` with
+        ``width = ceil(lowpass_filter_width * L / (min(L, M) * rolloff))``.
+
+    Raises:
+        ValueError: If a rate is not positive or ``lowpass_filter_width``
+            is not positive.
+    """
+    if original_frequency <= 0 or new_frequency <= 0:
+        raise ValueError(f"sample rates must be positive, got {original_frequency} and {new_frequency}")
+    if lowpass_filter_width <= 0:
+        raise ValueError(f"lowpass_filter_width must be positive, got {lowpass_filter_width}")
+
+    original_frequency, new_frequency = reduced_sample_rates(original_frequency, new_frequency)
+    cutoff = min(original_frequency, new_frequency) * rolloff
+    width = math.ceil(lowpass_filter_width * original_frequency / cutoff)
+    tap_count = original_frequency + 2 * width
+
+    # Distance from each phase's output sample to each input tap, in zero crossings of the low-pass sinc.
+    tap_times = (Tensor.arange(tap_count).reshape(1, tap_count) - width) / original_frequency
+    phase_times = Tensor.arange(new_frequency).reshape(new_frequency, 1) / new_frequency
+    offset = ((tap_times - phase_times) * cutoff).clip(-lowpass_filter_width, lowpass_filter_width)
+    relative_position = offset / lowpass_filter_width
+    if window == ResamplingWindow.HANN:
+        taper = (relative_position * (math.pi / 2)).cos().square()
+    else:
+        taper = kaiser_taper(relative_position, beta)
+
+    angle = offset * math.pi
+    sinc = (offset == 0).where(1.0, angle.sin() / angle)
+    return sinc * taper * (cutoff / original_frequency)
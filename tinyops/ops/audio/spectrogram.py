@@ -0,0 +1,72 @@
+import math
+from enum import Enum
+
+from tinygrad import Tensor
+
+from tinyops.ops.signal.short_time_fourier_transform import FramePaddingMode, short_time_fourier_transform
+
+
+class SpectrogramNormalization(Enum):
+    """How the STFT is scaled before the magnitude is taken."""
+
+    NONE = "none"
+    WINDOW = "window"
+    FRAME_LENGTH = "frame_length"
+
+
+def spectrogram(
+    waveform: Tensor,
+    frame_length: int,
+    hop_length: int | None = None,
+    window: Tensor | None = None,
+    power: float | None = 2.0,
+    normalization: SpectrogramNormalization = SpectrogramNormalization.NONE,
+    center: bool = True,
+    padding_mode: FramePaddingMode = FramePaddingMode.REFLECT,
+    onesided: bool = True,
+) -> Tensor:
+    """Compute a magnitude, power or complex spectrogram of a waveform.
+
+    Args:
+        waveform: Real tensor of shape ``(..., time)``.
+        frame_length: FFT size ``n_fft``.
+        hop_length: Samples between frames. Defaults to ``frame_length // 4``.
+        window: Analysis window of at most ``frame_length`` samples.
+            ``None`` means a rectangular window.
+        power: Exponent applied to the magnitude (2 for power, 1 for
+            magnitude). ``None`` returns the complex STFT.
+        normalization: Divide the STFT by the window's L2 norm
+            (``WINDOW``) or by ``sqrt(frame_length)`` (``FRAME_LENGTH``).
+        center: If True, pad half a frame on each side before framing.
+        padding_mode: Padding used when *center* is True.
+        onesided: If False, return all ``frame_length`` bins; the upper bins
+            are the complex conjugates of the mirrored lower ones.
+
+    Returns:
+        Tensor of shape ``(..., bins, frames)``, or ``(..., bins, frames, 2)``
+        when *power* is None, with ``bins = frame_length // 2 + 1`` when
+        *onesided* and ``frame_length`` otherwise.
+
+    Raises:
+        ValueError: If *power* is not positive, or the STFT arguments are invalid.
+    """
+    if power is not None and power <= 0:
+        raise ValueError(f"power must be positive or None, got {power}")
+
+    spectrum = short_time_fourier_transform(waveform, frame_length, hop_length, window, center, padding_mode)
+    if normalization is SpectrogramNormalization.WINDOW:
+        window_norm = math.sqrt(frame_length) if window is None else (window * window).sum().sqrt()
+        spectrum = spectrum / window_norm
+    elif normalization is SpectrogramNormalization.FRAME_LENGTH:
+        spectrum = spectrum / math.sqrt(frame_length)
+    if not onesided:
+        # A real signal's spectrum is Hermitian: bin k is the conjugate of bin frame_length - k.
+        mirrored = spectrum[..., 1 : frame_length - frame_length // 2, :, :].flip(-3)
+        spectrum = spectrum.cat(mirrored * Tensor([1.0, -1.0], device=spectrum.device), dim=-3)
+    if power is None:
+        return spectrum
+
+    squared_magnitude = (spectrum * spectrum).sum(axis=-1)
+    if power == 2.0:
+        return squared_magnitude
+    return squared_magnitude.pow(power / 2)
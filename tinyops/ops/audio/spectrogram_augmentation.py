@@ -0,0 +1,82 @@
+from tinygrad import Tensor, dtypes
+
+
+def _band_union(random_values: Tensor, maximum_mask_length: int, axis_length: int) -> Tensor:
+    """Union of the bands drawn by ``(..., masks, 2)`` *random_values* as a ``(..., axis_length)`` bool mask.
+
+    Each ``(length, start)`` pair of uniforms maps to a band like
+    :func:`~tinyops.ops.audio._masking._spectrogram_mask`: the length is
+    ``floor(u * maximum_mask_length)`` and the start is uniform over the
+    positions where that band fits.
+    """
+    mask_length = (random_values[..., 0] * maximum_mask_length).floor().unsqueeze(-1)
+    mask_start = (random_values[..., 1].unsqueeze(-1) * (axis_length - mask_length)).floor()
+    indices = Tensor.arange(axis_length, dtype=random_values.dtype, device=random_values.device)
+    in_band = (indices >= mask_start) & (indices < mask_start + mask_length)
+    return in_band.any(axis=-2)
+
+
+def spectrogram_augmentation(
+    spectrogram: Tensor,
+    random_values: Tensor,
+    maximum_frequency_mask_length: int,
+    maximum_time_mask_length: int,
+    frequency_mask_count: int = 2,
+    time_mask_count: int = 2,
+    mask_value: float = 0.0,
+) -> Tensor:
+    """Apply several frequency and time masks to a spectrogram in one pass (SpecAugment).
+
+    All mask lengths and starts come from *random_values*, so the bands
+    for every example are computed together on small ``(masks, bins)`` and
+    ``(masks, frames)`` index grids. Their union broadcasts to the full
+    ``(..., frequency, time)`` shape and is applied with a single ``where``,
+    instead of one full-tensor pass per mask.
+
+    Args:
+        spectrogram: Input spectrogram of shape ``(..., frequency, time)``.
+        random_values: Uniform samples in ``[0, 1)`` of shape
+            ``(..., frequency_mask_count + time_mask_count, 2)`` holding a
+            ``(length, start)`` pair per mask, frequency masks first. Leading
+            axes broadcast against those of *spectrogram*, so giving them per
+            example draws independent masks. ``Tensor.rand`` of that shape
+            with a fixed seed makes the augmentation reproducible.
+        maximum_frequency_mask_length: Maximum number of frequency bins per mask.
+        maximum_time_mask_length: Maximum number of time steps per mask.
+        frequency_mask_count: Number of frequency masks.
+        time_mask_count: Number of time masks.
+        mask_value: Value to fill in the masked region.
+
+    Returns:
+        Masked spectrogram tensor of the same shape.
+
+    Raises:
+        ValueError: If the spectrogram is not at least 2D, a mask length or
+            count is negative or a length exceeds its axis, or
+            *random_values* has the wrong trailing shape.
+    """
+    if spectrogram.ndim < 2:
+        raise ValueError("Input spectrogram must be at least 2D.")
+    frequency_count, time_count = spectrogram.shape[-2:]
+    for name, maximum_length, axis_length in (
+        ("maximum_frequency_mask_length", maximum_frequency_mask_length, frequency_count),
+        ("maximum_time_mask_length", maximum_time_mask_length, time_count),
+    ):
+        if not 0 <= maximum_length <= axis_length:
+            raise ValueError(f"{name} ({maximum_length}) must be between 0 and the dimension size ({axis_length})")
+    if frequency_mask_count < 0 or time_mask_count < 0:
+        raise ValueError("mask counts must be non-negative.")
+    mask_count = frequency_mask_count + time_mask_count
+    if random_values.ndim < 2 or random_values.shape[-2:] != (mask_count, 2):
+        raise ValueError(f"random_values must have shape (..., {mask_count}, 2), got {random_values.shape}")
+
+    if mask_count == 0:
+        return spectrogram
+
+    random_values = random_values.cast(dtypes.float32)
+    masked_frequencies = _band_union(
+        random_values[..., :frequency_mask_count, :], maximum_frequency_mask_length, frequency_count
+    )
+    masked_times = _band_union(random_values[..., frequency_mask_count:, :], maximum_time_mask_length, time_count)
+    mask = masked_frequencies.unsqueeze(-1) | masked_times.unsqueeze(-2)
+    return mask.where(mask_value, spectrogram)
@@ -0,0 +1,62 @@
+"""Pure-tinygrad tests for fused SpecAugment masking (no reference libraries)."""
+
+from tinygrad import Tensor
+
+from tinyops._core import assert_close
+from tinyops.ops.audio.frequency_mask import frequency_mask
+from tinyops.ops.audio.spectrogram_augmentation import spectrogram_augmentation
+from tinyops.ops.audio.time_mask import time_mask
+
+# Per-example (length, start) uniforms for two frequency masks followed by two time masks.
+_RANDOM_VALUES = [
+    [[0.5, 0.5], [0.2, 0.9], [0.7, 0.1], [0.99, 0.6]],
+    [[0.0, 0.3], [0.9, 0.0], [0.4, 0.99], [0.1, 0.5]],
+]
+
+
+def _sequential_masks(spectrogram: Tensor, random_values: Tensor) -> Tensor:
+    batch_size = spectrogram.shape[0]
+    for mask in range(4):
+        masking, maximum_length = (frequency_mask, 8) if mask < 2 else (time_mask, 10)
+        pair = (
+            random_values[:, mask, 0].reshape(batch_size, 1, 1),
+            random_values[:, mask, 1].reshape(batch_size, 1, 1),
+        )
+        spectrogram = masking(spectrogram, maximum_length, independent_masks=True, _random_values=pair)
+    return spectrogram
+
+
+def test_matches_sequential_single_masks():
+    spectrogram = Tensor.arange(2 * 20 * 30).reshape(2, 20, 30).float() + 1
+    random_values = Tensor(_RANDOM_VALUES)
+    fused = spectrogram_augmentation(spectrogram, random_values, 8, 10)
+    assert_close(fused, _sequential_masks(spectrogram, random_values))
+
+
+def test_shared_draw_broadcasts_over_batch():
+    spectrogram = Tensor.ones(3, 20, 30)
+    fused = spectrogram_augmentation(spectrogram, Tensor(_RANDOM_VALUES[0]), 8, 10, mask_value=-1.0).numpy()
+    assert (fused[0] == fused[1]).all() and (fused[0] == fused[2]).all()
+    assert (fused == -1.0).any()
+
+
+def test_zero_counts_leave_axis_untouched():
+    spectrogram = Tensor.ones(2, 20, 30)
+    random_values = Tensor([[[0.9, 0.5]], [[0.9, 0.2]]])
+    masked = spectrogram_augmentation(spectrogram, random_values, 8, 10, frequency_mask_count=0, time_mask_count=1)
+    columns = (masked.numpy() == 0).all(axis=1)
+    assert columns.any(axis=1).all()
+
+
+def test_invalid_arguments_raise():
+    spectrogram = Tensor.ones(2, 20, 30)
+    for arguments, message in (
+        ((spectrogram, Tensor.rand(2, 3, 2), 8, 10), "random_values"),
+        ((spectrogram, Tensor.rand(2, 4, 2), 21, 10), "maximum_frequency_mask_length"),
+        ((Tensor.ones(30), Tensor.rand(4, 2), 8, 10), "at least 2D"),
+    ):
+        try:
+            spectrogram_augmentation(*arguments)
+            raise AssertionError("expected ValueError")
+        except ValueError as error:
+            assert message in str(error)
@@ -9,7 +9,6 @@ def time_mask(
     mask_value: float = 0.0,
     independent_masks: bool = False,
     _random_values: tuple | None = None,
-    _time_indices: Tensor | None = None,
 ) -> Tensor:
     """Mask a contiguous span of time steps in a spectrogram.
 
@@ -19,7 +18,6 @@ def time_mask(
         mask_value: Value to fill in the masked region.
         independent_masks: If True, apply different masks per batch element.
         _random_values: Internal testing parameter.
-        _time_indices: Internal testing parameter.
 
     Returns:
         Masked spectrogram tensor.
@@ -31,5 +29,4 @@ def time_mask(
         mask_value=mask_value,
         independent_masks=independent_masks,
         _random_values=_random_values,
-        _indices=_time_indices,
     )
@@ -0,0 +1,51 @@
+"""Pure-tinygrad tests for the captured TinyJit step cache (no reference libraries)."""
+
+from tinygrad import Tensor
+
+from tinyops.ops._jit_step_cache import (
+    DEFAULT_JIT_STEP_CACHE_SIZE,
+    captured_step,
+    clear_jit_step_cache,
+    jit_step_cache_info,
+    set_jit_step_cache_size,
+)
+
+
+def _double_in_place(values: Tensor) -> None:
+    values.assign((values * 2).contiguous()).realize()
+
+
+def test_repeated_lookup_hits_cache():
+    clear_jit_step_cache()
+    first = captured_step(_double_in_place, ((4,), "CPU"))
+    second = captured_step(_double_in_place, ((4,), "CPU"))
+    assert first is second
+    info = jit_step_cache_info()
+    assert (info.hits, info.misses, info.current_size) == (1, 1, 1)
+
+
+def test_key_and_function_select_the_step():
+    clear_jit_step_cache()
+    step = captured_step(_double_in_place, ((4,), "CPU"))
+    assert captured_step(_double_in_place, ((8,), "CPU")) is not step
+    assert captured_step(lambda values: None, ((4,), "CPU")) is not step
+    assert jit_step_cache_info().misses == 3
+
+
+def test_size_bounds_the_cache():
+    clear_jit_step_cache()
+    set_jit_step_cache_size(1)
+    try:
+        captured_step(_double_in_place, (2,))
+        captured_step(_double_in_place, (4,))
+        assert jit_step_cache_info() == (0, 2, 1, 1)
+    finally:
+        set_jit_step_cache_size(DEFAULT_JIT_STEP_CACHE_SIZE)
+
+
+def test_cached_step_replays_in_place_updates():
+    clear_jit_step_cache()
+    values = Tensor.ones(4).contiguous().realize()
+    for _ in range(4):
+        captured_step(_double_in_place, (values.shape, values.device))(values)
+    assert values.tolist() == [16.0] * 4
@@ -1,6 +1,7 @@
 """Linear algebra operations: products, decompositions, matrix properties."""
 
 from .cholesky_decomposition import cholesky_decomposition
+from .cholesky_solve import cholesky_solve
 from .condition_number import condition_number
 from .determinant import determinant
 from .diagonal import diagonal
@@ -16,8 +17,11 @@ from .matrix_rank import matrix_rank
 from .norm import norm
 from .outer_product import outer_product
 from .pseudo_inverse import pseudo_inverse
-from .qr_decomposition import qr_decomposition
+from .qr_decomposition import QrMode, qr_decomposition
+from .singular_value_decomposition import singular_value_decomposition
+from .singular_values import singular_values
 from .solve_linear_system import solve_linear_system
+from .symmetric_eigendecomposition import symmetric_eigendecomposition
 from .tensor_dot_product import tensor_dot_product
 from .trace import trace
 from .vector_dot_product import vector_dot_product
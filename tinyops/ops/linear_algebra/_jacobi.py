@@ -0,0 +1,114 @@
+"""Shared parallel-ordered Jacobi rotation helpers for the symmetric eigensolver and the SVD."""
+
+from tinygrad import Tensor, dtypes
+from tinygrad.dtype import DType
+
+from tinyops.ops._jit_step_cache import captured_step
+
+JACOBI_SWEEP_COUNT = 10
+# One-sided sweeps converge more slowly on rank-deficient input, where the null-space columns keep rotating.
+ONE_SIDED_JACOBI_SWEEP_COUNT = 15
+
+
+def machine_epsilon(dtype: DType) -> float:
+    """Spacing of *dtype* values at 1; scales the default singular value cutoffs, as numpy does for its dtype."""
+    return 2.0 ** -dtypes.finfo(dtype)[1]
+
+
+def jacobi_rotation(first_diagonal: Tensor, second_diagonal: Tensor, off_diagonal: Tensor) -> tuple[Tensor, Tensor]:
+    """Cosines and sines of the rotations that diagonalize symmetric 2x2 blocks.
+
+    For ``[[a_pp, a_pq], [a_pq, a_qq]]`` and ``J = [[c, s], [-s, c]]``, the
+    off-diagonal of ``J^T A J`` is zero. The smaller of the two possible
+    angles is taken, so the rotation never swaps the diagonal entries.
+    """
+    has_rotation = off_diagonal != 0
+    ratio = (second_diagonal - first_diagonal) / (2 * has_rotation.where(off_diagonal, 1.0))
+    # A vanishing off-diagonal overflows the ratio to infinity, which correctly gives a zero tangent.
+    tangent = (ratio >= 0).where(1.0, -1.0) / (ratio.abs() + (1 + ratio * ratio).sqrt())
+    tangent = has_rotation.where(tangent, 0.0)
+    cosine = 1 / (1 + tangent * tangent).sqrt()
+    return cosine, tangent * cosine
+
+
+def rotate_and_permute_columns(matrix: Tensor, cosines: Tensor, sines: Tensor) -> Tensor:
+    """Rotate the column pairs ``(2i, 2i + 1)`` of ``(..., rows, n)`` matrices, then advance the pairing.
+
+    Pair ``i`` is multiplied on the right by ``[[c_i, s_i], [-s_i, c_i]]``,
+    with *cosines* and *sines* of shape ``(..., n / 2)``. The columns are
+    then moved round-robin, with column 0 fixed and every other column
+    stepping one place around the ring of pair slots. After ``n - 1`` calls
+    every pair of columns has met exactly once and the columns are back in
+    their original order, so one sweep is ``n - 1`` identical steps.
+    """
+    *leading_shape, columns = matrix.shape
+    pairs = matrix.reshape(*leading_shape, columns // 2, 2)
+    first, second = pairs[..., 0], pairs[..., 1]
+    cosines, sines = cosines.unsqueeze(-2), sines.unsqueeze(-2)
+    rotated_first = cosines * first - sines * second
+    rotated_second = sines * first + cosines * second
+    if columns > 2:
+        rotated_first, rotated_second = (
+            rotated_first[..., :1].cat(rotated_second[..., :1], rotated_first[..., 1:-1], dim=-1),
+            rotated_second[..., 1:].cat(rotated_first[..., -1:], dim=-1),
+        )
+    return rotated_first.stack(rotated_second, dim=-1).reshape(matrix.shape)
+
+
+def _orthogonalization_step(columns: Tensor, rotations: Tensor) -> None:
+    """Rotate every current column pair of *columns* to be orthogonal and accumulate into *rotations*, in place."""
+    pairs = columns.reshape(*columns.shape[:-1], columns.shape[-1] // 2, 2)
+    first, second = pairs[..., 0], pairs[..., 1]
+    # The rotation diagonalizes the pair's 2x2 block of the Gram matrix columns^T columns.
+    cosines, sines = jacobi_rotation(
+        (first * first).sum(axis=-2), (second * second).sum(axis=-2), (first * second).sum(axis=-2)
+    )
+    rotated = rotate_and_permute_columns(columns, cosines, sines).contiguous()
+    accumulated = rotate_and_permute_columns(rotations, cosines, sines).contiguous()
+    # Both new values read the old state, so they are realized before either buffer is overwritten.
+    Tensor.realize(rotated, accumulated)
+    columns.assign(rotated)
+    rotations.assign(accumulated)
+    Tensor.realize(columns, rotations)
+
+
+def jacobi_singular_value_decomposition(matrix: Tensor, sweep_count: int) -> tuple[Tensor, Tensor, Tensor]:
+    """Thin ``(U, S, V)`` of ``(..., m, n)`` matrices by one-sided (Hestenes) Jacobi.
+
+    The columns of the taller orientation are rotated in round-robin pairs
+    until they are mutually orthogonal, so ``A V = U diag(S)`` with the
+    accumulated rotations ``V``. Singular values are the column norms,
+    sorted descending, with ``k = min(m, n)`` of them. Columns of ``U``
+    belonging to singular values at or below ``max(m, n) * eps`` times the
+    largest one are zero: those values are rounding noise, and dividing by
+    them would give a copy of another column instead of a new direction.
+    Float inputs keep their dtype. The steps run under ``TinyJit`` and the
+    results are realized.
+    """
+    rows, columns = matrix.shape[-2:]
+    transposed = rows < columns
+    working = matrix if dtypes.is_float(matrix.dtype) else matrix.float()
+    working = working.transpose(-1, -2) if transposed else working
+    size = min(rows, columns)
+    # An odd column count gets a zero extra column; it is never rotated and is sliced off at the end.
+    padded_size = size + size % 2
+    # A fresh buffer: the steps assign into it, and the caller's matrix must stay untouched.
+    working = working.pad((0, padded_size - size)).clone().realize()
+    rotations = Tensor.eye(padded_size, dtype=working.dtype, device=matrix.device)
+    rotations = rotations.expand(*working.shape[:-2], padded_size, padded_size).contiguous().realize()
+    if padded_size > 0:
+        step = captured_step(_orthogonalization_step, (working.shape, working.dtype, working.device))
+        for _ in range(sweep_count * (padded_size - 1)):
+            step(working, rotations)
+
+    working, rotations = working[..., :size], rotations[..., :size, :size]
+    singular_values, order = (working * working).sum(axis=-2).sqrt().sort(-1, descending=True)
+    working = working.gather(-1, order.unsqueeze(-2).expand(working.shape))
+    rotations = rotations.gather(-1, order.unsqueeze(-2).expand(rotations.shape))
+    cutoff = singular_values[..., :1] * (max(rows, columns) * machine_epsilon(singular_values.dtype))
+    significant = (singular_values > cutoff).unsqueeze(-2)
+    left = significant.where(working / significant.where(singular_values.unsqueeze(-2), 1.0), 0.0)
+    if transposed:
+        left, rotations = rotations, left
+    Tensor.realize(left, singular_values, rotations)
+    return left, singular_values, rotations
@@ -0,0 +1,84 @@
+"""Shared batched LU factorization with partial pivoting and solves built on it."""
+
+from tinygrad import Tensor, dtypes
+
+from tinyops.ops.linear_algebra._substitution import back_substitution, forward_substitution
+
+
+def packed_lu_factorization(matrix: Tensor) -> tuple[Tensor, Tensor]:
+    """Factor ``P_r @ matrix = L @ U`` for a ``(..., n, n)`` batch with partial pivoting.
+
+    Step ``k`` picks the first row ``i >= k`` with the largest ``|U[i, k]|``
+    as a one-hot mask, swaps it with row ``k`` through one-hot vector
+    products (``O(n^2)`` per step, no data-dependent indexing) and
+    eliminates below the pivot with a rank-one update. Every intermediate
+    keeps its shape, so the factorization is one lazy graph of depth linear
+    in ``n`` with ``O(n^3)`` work. Float inputs are factored in their own
+    dtype; other dtypes are factored in ``float32``.
+
+    Returns:
+        ``(packed, row_order)``: *packed* holds the multipliers of the unit
+        lower factor below the diagonal and ``U`` on and above it;
+        *row_order* of shape ``(..., n)`` holds the original row index of
+        each row of ``P_r @ matrix``, as ``int32``.
+    """
+    size = matrix.shape[-1]
+    device = matrix.device
+    dtype = matrix.dtype if dtypes.is_float(matrix.dtype) else dtypes.float32
+    packed = matrix.cast(dtype)
+    reversed_rows = Tensor.arange(size, 0, -1, device=device).reshape(size, 1).contiguous()
+    # The original row indices are swapped alongside the rows, as a column of their own.
+    row_order = (size - reversed_rows).expand(*matrix.shape[:-1], 1)
+    # The step is carried as data (a one-hot current row and a mask of the rows not yet eliminated) instead of a
+    # Python index, so every step compiles to the same few kernels and only their buffers change.
+    current = (reversed_rows == size).cast(dtype).contiguous()
+    remaining = Tensor.ones(size, 1, dtype=dtype, device=device).contiguous()
+    for _ in range(size):
+        current_column = current.transpose()
+        below = (remaining - current).contiguous()
+        column = (packed * current_column).sum(axis=-1, keepdim=True)
+        # One-hot column marking the first row at or below the diagonal with the largest magnitude.
+        candidates = remaining * column.abs() + remaining - 1
+        is_largest = candidates == candidates.max(axis=-2, keepdim=True)
+        first_largest = (is_largest * reversed_rows).max(axis=-2, keepdim=True)
+        is_pivot = reversed_rows == first_largest
+
+        # Swap the current and pivot rows; when they coincide the two corrections cancel.
+        pivot_row = (is_pivot * packed).sum(axis=-2, keepdim=True)
+        swap = current - is_pivot.cast(dtype)
+        swapped = packed + swap * (pivot_row - (current * packed).sum(axis=-2, keepdim=True))
+        pivot_index = (is_pivot * row_order).sum(axis=-2, keepdim=True)
+        current_index = (current.bool() * row_order).sum(axis=-2, keepdim=True)
+        row_order = (row_order + swap.cast(dtypes.int32) * (pivot_index - current_index)).contiguous()
+
+        # A zero pivot means the whole remaining column is zero, so its multipliers are zero too.
+        pivot_value = (pivot_row * current_column).sum(axis=-1, keepdim=True)
+        swapped_column = (swapped * current_column).sum(axis=-1, keepdim=True)
+        multipliers = below * swapped_column / (pivot_value == 0).where(1.0, pivot_value)
+        trailing_columns = below.transpose()
+        update = multipliers * (pivot_row * trailing_columns) - current_column * (multipliers - below * swapped_column)
+        packed = (swapped - update).contiguous()
+        remaining = below
+        current = current.pad((0, 0, 1, 0))[:-1].contiguous()
+    return packed, row_order.squeeze(-1)
+
+
+def permutation_sign(row_order: Tensor) -> Tensor:
+    """Determinant ``+1`` or ``-1`` of the permutation described by a ``(..., n)`` *row_order*, from its inversions."""
+    size = row_order.shape[-1]
+    later = Tensor.ones(size, size, device=row_order.device).triu(1).bool()
+    inversions = (later & (row_order.unsqueeze(-1) > row_order.unsqueeze(-2))).sum(axis=(-2, -1), dtype=dtypes.int32)
+    return 1 - 2 * (inversions % 2)
+
+
+def permute_rows(row_order: Tensor, values: Tensor) -> Tensor:
+    """Gather rows ``values[..., row_order[i], :]`` with a one-hot ``(..., n, n)`` matmul."""
+    size = row_order.shape[-1]
+    columns = Tensor.arange(size, device=row_order.device)
+    return (row_order.unsqueeze(-1) == columns).cast(values.dtype) @ values
+
+
+def lu_factor_solve(packed: Tensor, row_order: Tensor, constants: Tensor) -> Tensor:
+    """Solve ``matrix @ x = constants`` from :func:`packed_lu_factorization`, for ``(..., n, k)`` *constants*."""
+    intermediate = forward_substitution(packed, permute_rows(row_order, constants), unit_diagonal=True)
+    return back_substitution(packed, intermediate)
@@ -0,0 +1,44 @@
+"""Shared batched triangular solves by column-oriented substitution with static shapes."""
+
+from tinygrad import Tensor
+
+
+def _substitute(triangular: Tensor, constants: Tensor, forward: bool, unit_diagonal: bool) -> Tensor:
+    size = triangular.shape[-1]
+    rows = Tensor.arange(size, device=triangular.device).reshape(size, 1)
+    # The step is carried as data (a one-hot current row and a mask of the unsolved rows) instead of a Python
+    # index, so every step compiles to the same few kernels and only their buffers change.
+    current = (rows == (0 if forward else size - 1)).cast(triangular.dtype).contiguous()
+    unsolved = Tensor.ones(size, 1, dtype=triangular.dtype, device=triangular.device).contiguous()
+    solution = constants
+    for _ in range(size):
+        current_row = (current * solution).sum(axis=-2, keepdim=True)
+        column = (triangular * current.transpose()).sum(axis=-1, keepdim=True)
+        solved_row = current_row if unit_diagonal else current_row / (current * column).sum(axis=-2, keepdim=True)
+        # Finish the current row and eliminate it from every row still unsolved at once.
+        unsolved = (unsolved - current).contiguous()
+        solution = (solution - unsolved * column * solved_row + current * (solved_row - current_row)).contiguous()
+        next_current = current.pad((0, 0, 1, 0))[:-1] if forward else current.pad((0, 0, 0, 1))[1:]
+        current = next_current.contiguous()
+    return solution
+
+
+def forward_substitution(lower: Tensor, constants: Tensor, unit_diagonal: bool = False) -> Tensor:
+    """Solve ``lower @ x = constants`` for ``(..., n, n)`` lower-triangular and ``(..., n, k)`` constants.
+
+    Each of the ``n`` steps finishes one row of the solution and subtracts
+    its contribution from every later row at once, so the graph depth is
+    linear in ``n`` and the work is ``O(n^2 k)``. Entries above the
+    diagonal of *lower* (and the diagonal itself with *unit_diagonal*) are
+    ignored, so a packed LU factor can be passed as is.
+    """
+    return _substitute(lower, constants, forward=True, unit_diagonal=unit_diagonal)
+
+
+def back_substitution(upper: Tensor, constants: Tensor, unit_diagonal: bool = False) -> Tensor:
+    """Solve ``upper @ x = constants`` for ``(..., n, n)`` upper-triangular and ``(..., n, k)`` constants.
+
+    The mirror image of :func:`forward_substitution`, finishing rows from
+    the last to the first.
+    """
+    return _substitute(upper, constants, forward=False, unit_diagonal=unit_diagonal)
@@ -2,36 +2,45 @@ from tinygrad import Tensor
 
 
 def cholesky_decomposition(matrix: Tensor) -> Tensor:
-    """Compute the Cholesky decomposition of a symmetric positive-definite matrix.
+    """Compute the Cholesky decomposition of a batch of symmetric positive-definite matrices.
 
     Returns the lower triangular factor L such that ``L @ L.T == matrix``.
+    The factorization is right-looking: step ``k`` scales column ``k`` of
+    the trailing block by the square root of its diagonal entry and
+    subtracts its outer product from the block. The step is carried as a
+    one-hot column instead of a Python index and nothing is realized, so
+    the whole batch is one fixed lazy graph of depth linear in ``n`` whose
+    steps all compile to the same kernels.
 
     Args:
-        matrix: A symmetric positive-definite matrix of shape (n, n).
+        matrix: Symmetric positive-definite matrices of shape ``(..., n, n)``.
+            Only the lower triangle is read.
 
     Returns:
-        The lower triangular Cholesky factor.
-    """
-    size = matrix.shape[0]
-    if size == 0:
-        return Tensor.zeros(0, 0, dtype=matrix.dtype)
-
-    columns = []
-    for column_index in range(size):
-        previous_columns = Tensor.cat(*columns, dim=1) if columns else Tensor.zeros(size, 0, dtype=matrix.dtype)
-
-        squared_sum = (previous_columns[column_index, :] * previous_columns[column_index, :]).sum()
-        diagonal_element = (matrix[column_index, column_index] - squared_sum).sqrt()
+        The lower triangular Cholesky factors, shape ``(..., n, n)``. A
+        matrix that is not positive definite yields NaN entries.
 
-        if column_index < size - 1:
-            cross_product = previous_columns[column_index + 1 :, :] @ previous_columns[column_index, :]
-            below_diagonal = (matrix[column_index + 1 :, column_index] - cross_product) / diagonal_element
-        else:
-            below_diagonal = Tensor.zeros(0, dtype=matrix.dtype)
-
-        zeros_above = Tensor.zeros(column_index, dtype=matrix.dtype)
-        diagonal_reshaped = diagonal_element.reshape(1)
-        new_column = Tensor.cat(zeros_above, diagonal_reshaped, below_diagonal).realize()
-        columns.append(new_column.unsqueeze(1))
-
-    return Tensor.cat(*columns, dim=1)
+    Raises:
+        ValueError: If the input is not at least 2D or not square.
+    """
+    if len(matrix.shape) < 2:
+        raise ValueError("Must be >= 2D")
+    size = matrix.shape[-1]
+    if matrix.shape[-2] != size:
+        raise ValueError("Must be square")
+
+    rows = Tensor.arange(size, device=matrix.device).reshape(size, 1)
+    # Mirroring the lower triangle makes the rank-one updates see an exactly symmetric matrix.
+    trailing = matrix.tril() + matrix.tril(-1).transpose(-1, -2)
+    factor = Tensor.zeros(*matrix.shape, dtype=trailing.dtype, device=matrix.device)
+    current = (rows == 0).float().contiguous()
+    remaining = Tensor.ones(size, 1, device=matrix.device).contiguous()
+    for _ in range(size):
+        column = (trailing * current.transpose()).sum(axis=-1, keepdim=True)
+        pivot = (current * column).sum(axis=-2, keepdim=True).sqrt()
+        factor_column = (remaining * column / pivot).contiguous()
+        trailing = (trailing - factor_column * factor_column.transpose(-1, -2)).contiguous()
+        factor = (factor + factor_column * current.transpose()).contiguous()
+        remaining = (remaining - current).contiguous()
+        current = current.pad((0, 0, 1, 0))[:-1].contiguous()
+    return factor
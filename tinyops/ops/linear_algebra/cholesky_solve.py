@@ -0,0 +1,30 @@
+from tinygrad import Tensor
+
+from tinyops.ops.linear_algebra._substitution import back_substitution, forward_substitution
+
+
+def cholesky_solve(factor: Tensor, constants: Tensor) -> Tensor:
+    """Solve ``(L @ L.T) @ x = constants`` given the Cholesky factor ``L``.
+
+    One forward substitution with ``L`` and one back substitution with
+    ``L.T`` cover every column of *constants* at once, so a batch of
+    symmetric positive-definite systems costs ``O(n^2 k)`` each once the
+    factor from :func:`cholesky_decomposition` is known.
+
+    Args:
+        factor: Lower triangular Cholesky factors of shape ``(..., n, n)``.
+        constants: Right-hand side vector ``(..., n)`` or matrix ``(..., n, k)``.
+
+    Returns:
+        Solution tensor with the shape of *constants*.
+
+    Raises:
+        ValueError: If the factor is not square.
+    """
+    if len(factor.shape) < 2 or factor.shape[-2] != factor.shape[-1]:
+        raise ValueError("Must be square")
+
+    if constants.ndim == factor.ndim - 1:
+        return cholesky_solve(factor, constants.unsqueeze(-1)).squeeze(-1)
+    intermediate = forward_substitution(factor, constants)
+    return back_substitution(factor.transpose(-1, -2), intermediate)
@@ -2,28 +2,29 @@ from tinygrad import Tensor
 
 from tinyops.ops.linear_algebra.inverse import inverse
 from tinyops.ops.linear_algebra.norm import norm
+from tinyops.ops.linear_algebra.singular_values import singular_values
 
 
 def condition_number(matrix: Tensor, order: int | float | str | None = None) -> Tensor:
     """Compute the condition number of a matrix.
 
-    The condition number is ``norm(matrix) * norm(inverse(matrix))``.
+    For ``order`` ``None`` or ``2`` this is the ratio of the largest to the
+    smallest singular value (``-2`` gives its reciprocal), which also works
+    for batches and non-square matrices. Other orders use
+    ``norm(matrix) * norm(inverse(matrix))``.
 
     Args:
         matrix: Input matrix tensor.
-        order: Order of the norm (same as :func:`norm`). The 2-norm
-            is not supported.
+        order: Order of the norm (same as :func:`norm`).
 
     Returns:
-        Condition number scalar tensor.
-
-    Raises:
-        NotImplementedError: For order=None or order=2 (requires SVD).
+        Condition number tensor; infinite for singular input with the
+        singular value orders.
     """
-    if order is None:
-        raise NotImplementedError("Default condition number (2-norm) not supported. Use order='fro', 1, -1, inf, -inf.")
-    if order == 2:
-        raise NotImplementedError("2-norm condition number not supported.")
+    if order is None or order in (2, -2):
+        values = singular_values(matrix)
+        largest, smallest = values[..., 0], values[..., -1]
+        return largest / smallest if order != -2 else smallest / largest
 
     inverse_matrix = inverse(matrix)
     return norm(matrix, order=order) * norm(inverse_matrix, order=order)
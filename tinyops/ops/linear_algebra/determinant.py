@@ -1,50 +1,33 @@
 from tinygrad import Tensor
 
-
-def _get_minor(matrix: Tensor, column: int, size: int) -> Tensor:
-    """Extract the submatrix by removing the first row and the specified column."""
-    sub_matrix_parts = []
-    if column > 0:
-        sub_matrix_parts.append(matrix[1:, :column])
-    if column < size - 1:
-        sub_matrix_parts.append(matrix[1:, column + 1 :])
-
-    if len(sub_matrix_parts) > 1:
-        return sub_matrix_parts[0].cat(sub_matrix_parts[1], dim=1)
-    if len(sub_matrix_parts) == 1:
-        return sub_matrix_parts[0]
-    return Tensor([])
+from tinyops.ops.linear_algebra._lu import packed_lu_factorization, permutation_sign
+from tinyops.ops.linear_algebra.diagonal import diagonal
 
 
 def determinant(matrix: Tensor) -> Tensor:
-    """Compute the determinant of a square matrix via Laplace expansion.
+    """Compute the determinant of a batch of square matrices via LU decomposition.
 
-    This is O(n!) and intended only for small matrices.
+    The determinant is the product of the pivots of the partially pivoted
+    LU factorization, negated once per row swap. The pivots are multiplied
+    as a sum of logarithms of their magnitudes, so a determinant that fits
+    in float32 is not lost to an intermediate product overflowing. This is
+    ``O(n^3)`` and handles every matrix of the batch in one graph.
 
     Args:
-        matrix: A 2D square tensor.
+        matrix: Tensor of shape ``(..., n, n)``.
 
     Returns:
-        Scalar tensor containing the determinant.
+        Tensor of shape ``(...)`` holding the determinants.
 
     Raises:
-        ValueError: If the input is not a square 2D matrix.
+        ValueError: If the input is not at least 2D or not square.
     """
-    if len(matrix.shape) != 2 or matrix.shape[0] != matrix.shape[1]:
-        raise ValueError("Input must be a square 2D matrix.")
-
-    size = matrix.shape[0]
-    if size == 0:
-        return Tensor(1.0)
-    if size == 1:
-        return matrix[0, 0]
-    if size == 2:
-        return matrix[0, 0] * matrix[1, 1] - matrix[0, 1] * matrix[1, 0]
-
-    total = Tensor(0.0)
-    for column in range(size):
-        sign = (-1) ** column
-        sub_matrix = _get_minor(matrix, column, size)
-        total += sign * matrix[0, column] * determinant(sub_matrix)
-
-    return total
+    if len(matrix.shape) < 2 or matrix.shape[-2] != matrix.shape[-1]:
+        raise ValueError("Input must be a square matrix.")
+
+    if matrix.shape[-1] == 0:
+        return Tensor.ones(*matrix.shape[:-2], device=matrix.device)
+    packed, row_order = packed_lu_factorization(matrix)
+    pivots = diagonal(packed, axis_1=-2, axis_2=-1)
+    sign = permutation_sign(row_order) * pivots.sign().prod(axis=-1)
+    return sign * pivots.abs().log().sum(axis=-1).exp()
@@ -1,22 +1,40 @@
-from tinygrad import Tensor
+from tinygrad import Tensor, dtypes
 
-from tinyops.ops.linear_algebra.qr_decomposition import qr_decomposition
+from tinyops.ops.linear_algebra._jacobi import machine_epsilon
+from tinyops.ops.linear_algebra.singular_values import singular_values
 
 
-def matrix_rank(matrix: Tensor, tolerance: float = 1e-5) -> Tensor:
-    """Compute the rank of a matrix via QR decomposition.
+def matrix_rank(
+    matrix: Tensor,
+    tolerance: float | None = None,
+    hermitian: bool = False,
+    relative_tolerance: float | None = None,
+) -> Tensor:
+    """Compute the rank of a batch of matrices as the number of significant singular values.
 
     Args:
-        matrix: Input 2D tensor.
-        tolerance: Threshold below which diagonal values of R are
-            considered zero.
+        matrix: Input tensor of shape ``(..., m, n)``.
+        tolerance: Singular values at or below this threshold count as
+            zero. Takes precedence over *relative_tolerance*.
+        hermitian: If True, the matrices are taken to be symmetric and the
+            singular values are their absolute eigenvalues.
+        relative_tolerance: Threshold relative to the largest singular
+            value, used when *tolerance* is ``None``. ``None`` uses
+            ``max(m, n) * eps`` for the ``eps`` of the singular values'
+            dtype, as numpy does.
 
     Returns:
-        Scalar tensor containing the rank.
+        Tensor of shape ``(...)`` containing the ranks.
     """
-    if matrix.shape[0] == 0 or matrix.shape[1] == 0:
-        return Tensor(0)
+    rows, columns = matrix.shape[-2:]
+    if rows == 0 or columns == 0:
+        return Tensor.zeros(*matrix.shape[:-2], dtype=dtypes.int32)
 
-    _, upper_triangular = qr_decomposition(matrix)
-    diagonal_elements = upper_triangular.flatten()[:: upper_triangular.shape[1] + 1]
-    return (diagonal_elements.abs() > tolerance).sum()
+    values = singular_values(matrix, hermitian=hermitian)
+    if tolerance is None:
+        if relative_tolerance is None:
+            relative_tolerance = max(rows, columns) * machine_epsilon(values.dtype)
+        threshold = values[..., :1] * relative_tolerance
+    else:
+        threshold = tolerance
+    return (values > threshold).sum(axis=-1)
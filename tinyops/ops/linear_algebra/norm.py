@@ -1,5 +1,7 @@
 from tinygrad import Tensor
 
+from tinyops.ops.linear_algebra.singular_values import singular_values
+
 
 def _vector_norm(
     tensor: Tensor,
@@ -62,8 +64,13 @@ def _matrix_norm(
         result = _induced_matrix_norm(tensor, row_axis, column_axis, use_maximum=True)
     elif order == -1:
         result = _induced_matrix_norm(tensor, row_axis, column_axis, use_maximum=False)
-    elif order == 2:
-        raise NotImplementedError("Spectral norm (order=2) not supported.")
+    elif order in (2, -2):
+        # Largest or smallest singular value, taken with the two matrix axes moved last.
+        batch_axes = [ax for ax in range(number_of_dimensions) if ax not in (row_axis, column_axis)]
+        values = singular_values(tensor.permute(*batch_axes, row_axis, column_axis))
+        result = values[..., 0] if order == 2 else values[..., -1]
+        for ax in sorted((row_axis, column_axis)):
+            result = result.unsqueeze(ax)
     else:
         raise ValueError(f"Invalid norm order for matrices: {order}")
 
@@ -86,7 +93,8 @@ def norm(
     Args:
         tensor: Input tensor.
         order: Order of the norm. Supports numeric orders, ``'fro'``,
-            ``inf`` and ``-inf``.
+            ``inf`` and ``-inf``; matrix orders ``2`` and ``-2`` are the
+            largest and smallest singular values.
         axis: Axis or axes along which to compute. Determines vector vs
             matrix norm semantics.
         keep_dimensions: If True, reduced axes are kept as size-one dimensions.
@@ -1,44 +1,37 @@
 from tinygrad import Tensor
 
-from tinyops.ops.linear_algebra._newton_schulz import (
-    NEWTON_SCHULZ_ITERATIONS,
-    NUMERICAL_STABILITY_EPSILON,
-    _initial_scaled_transpose_approximation,
-)
+from tinyops.ops.linear_algebra._jacobi import machine_epsilon
+from tinyops.ops.linear_algebra.singular_value_decomposition import singular_value_decomposition
 
 
-def pseudo_inverse(matrix: Tensor) -> Tensor:
-    """Compute the Moore-Penrose pseudo-inverse using Newton-Schulz iteration.
+def pseudo_inverse(matrix: Tensor, relative_tolerance: float | None = None, hermitian: bool = False) -> Tensor:
+    """Compute the Moore-Penrose pseudo-inverse of a batch of matrices from their SVD.
+
+    ``pinv(A) = V diag(1 / S) U^T``, with the singular values at or below
+    the cutoff treated as zero, so rank-deficient and badly scaled inputs
+    get the minimum-norm solution instead of a diverging one.
 
     Args:
-        matrix: Input tensor (at least 2D).
+        matrix: Input tensor of shape ``(..., m, n)``.
+        relative_tolerance: Cutoff for small singular values, relative to
+            the largest one. ``None`` uses ``max(m, n) * eps`` for the
+            ``eps`` of the singular values' dtype, as numpy does.
+        hermitian: If True, the matrices are taken to be symmetric and
+            decomposed through their eigendecomposition (see
+            :func:`~tinyops.ops.linear_algebra.singular_value_decomposition.singular_value_decomposition`).
 
     Returns:
-        Pseudo-inverse tensor.
+        Pseudo-inverse tensor of shape ``(..., n, m)``.
 
     Raises:
         ValueError: If the input is not at least 2D.
     """
     if len(matrix.shape) < 2:
         raise ValueError("Must be >= 2D")
-
-    rows, columns = matrix.shape[-2], matrix.shape[-1]
-    approximation = _initial_scaled_transpose_approximation(
-        matrix,
-        numerical_stability_epsilon=NUMERICAL_STABILITY_EPSILON,
-    )
-
-    if rows >= columns:
-        identity = Tensor.eye(columns)
-        for _ in range(NEWTON_SCHULZ_ITERATIONS):
-            product = approximation.matmul(matrix)
-            correction = (2 * identity) - product
-            approximation = correction.matmul(approximation)
-    else:
-        identity = Tensor.eye(rows)
-        for _ in range(NEWTON_SCHULZ_ITERATIONS):
-            product = matrix.matmul(approximation)
-            correction = (2 * identity) - product
-            approximation = approximation.matmul(correction)
-
-    return approximation
+    rows, columns = matrix.shape[-2:]
+    left, values, right_transposed = singular_value_decomposition(matrix, hermitian=hermitian)
+    if relative_tolerance is None:
+        relative_tolerance = max(rows, columns) * machine_epsilon(values.dtype)
+    significant = values > values[..., :1] * relative_tolerance
+    reciprocals = significant.where(1 / significant.where(values, 1.0), 0.0)
+    return (right_transposed.transpose(-1, -2) * reciprocals.unsqueeze(-2)).matmul(left.transpose(-1, -2))
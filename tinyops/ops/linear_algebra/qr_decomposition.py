@@ -1,27 +1,59 @@
-from tinygrad import Tensor
-
-NUMERICAL_STABILITY_EPSILON = 1e-7
-
-
-def _classical_gram_schmidt_basis(matrix: Tensor, rank: int) -> Tensor:
-    """Build reduced Q via classical Gram-Schmidt on the leading *rank* columns."""
-    orthogonal_columns = []
-    for column_index in range(rank):
-        vector = matrix[:, column_index]
-        if column_index > 0:
-            previous_orthogonal = Tensor.stack(orthogonal_columns, dim=1)
-            projection = previous_orthogonal @ (previous_orthogonal.T @ vector)
-            vector = vector - projection
-
-        vector_norm = vector.pow(2).sum().sqrt()
-        orthogonal_vector = Tensor.where(
-            vector_norm > NUMERICAL_STABILITY_EPSILON,
-            vector / vector_norm,
-            Tensor.zeros(*vector.shape, dtype=vector.dtype),
-        )
-        orthogonal_columns.append(orthogonal_vector)
+from enum import Enum
+
+from tinygrad import Tensor, dtypes
+
+from tinyops.ops.linear_algebra.diagonal import diagonal
+
+
+class QrMode(Enum):
+    """Shape of the factors returned by QR decomposition."""
+
+    REDUCED = "reduced"
+    COMPLETE = "complete"
+
 
-    return Tensor.stack(orthogonal_columns, dim=1)
+def _householder_triangularization(matrix: Tensor) -> tuple[Tensor, Tensor]:
+    """Complete ``(Q^T, R)`` of a ``(..., m, n)`` batch by ``min(m, n)`` Householder reflections.
+
+    Reflection ``k`` maps the part of column ``k`` at or below row ``k`` onto
+    a multiple of the ``k``-th unit vector. It is applied to ``R`` and to the
+    accumulated ``Q^T`` as a rank-one update, ``O(m n)`` and ``O(m^2)``
+    work per step. The step is carried as one-hot row and column buffers
+    instead of Python indices, so every step compiles to the same kernels.
+    Float inputs are reduced in their own dtype, others in ``float32``.
+    """
+    rows, columns = matrix.shape[-2:]
+    row_indices = Tensor.arange(rows, device=matrix.device).reshape(rows, 1)
+    column_indices = Tensor.arange(columns, device=matrix.device).reshape(1, columns)
+    dtype = matrix.dtype if dtypes.is_float(matrix.dtype) else dtypes.float32
+    upper_triangular = matrix.cast(dtype)
+    transposed_orthogonal = Tensor.eye(rows, dtype=dtype, device=matrix.device)
+    transposed_orthogonal = transposed_orthogonal.expand(*matrix.shape[:-2], rows, rows)
+    current_row = (row_indices == 0).cast(dtype).contiguous()
+    current_column = (column_indices == 0).cast(dtype).contiguous()
+    remaining = Tensor.ones(rows, 1, dtype=dtype, device=matrix.device).contiguous()
+    for _ in range(min(rows, columns)):
+        column = remaining * (upper_triangular * current_column).sum(axis=-1, keepdim=True)
+        leading = (current_row * column).sum(axis=-2, keepdim=True)
+        # Reflect onto the side opposite the leading entry, so forming the reflector never cancels.
+        target = (leading < 0).where(1.0, -1.0) * (column * column).sum(axis=-2, keepdim=True).sqrt()
+        reflector = (column - target * current_row).contiguous()
+        squared_norm = (reflector * reflector).sum(axis=-2, keepdim=True)
+        # An all-zero column is already reduced, so its reflection is skipped.
+        has_reflection = squared_norm > 0
+        scale = has_reflection.where(2 / has_reflection.where(squared_norm, 1.0), 0.0)
+        upper_triangular = upper_triangular - scale * reflector * (reflector * upper_triangular).sum(
+            axis=-2, keepdim=True
+        )
+        upper_triangular = upper_triangular.contiguous()
+        transposed_orthogonal = transposed_orthogonal - scale * reflector * (reflector * transposed_orthogonal).sum(
+            axis=-2, keepdim=True
+        )
+        transposed_orthogonal = transposed_orthogonal.contiguous()
+        remaining = (remaining - current_row).contiguous()
+        current_row = current_row.pad((0, 0, 1, 0))[:-1].contiguous()
+        current_column = current_column.pad((1, 0))[:, :-1].contiguous()
+    return transposed_orthogonal, upper_triangular.triu()
 
 
 def _align_qr_diagonal_signs(
@@ -30,29 +62,42 @@ def _align_qr_diagonal_signs(
     rank: int,
 ) -> tuple[Tensor, Tensor]:
     """Flip Q columns and R rows so the diagonal of R is non-negative."""
-    diagonal_values = upper_triangular.flatten()[:: upper_triangular.shape[1] + 1][:rank]
+    diagonal_values = diagonal(upper_triangular, axis_1=-2, axis_2=-1)[..., :rank]
     signs = (diagonal_values < 0).cast(orthogonal.dtype) * -2 + 1
-    orthogonal = orthogonal * signs
-    upper_triangular = signs.reshape(-1, 1) * upper_triangular
+    orthogonal = orthogonal * signs.pad((0, orthogonal.shape[-1] - rank), value=1).unsqueeze(-2)
+    upper_triangular = signs.pad((0, upper_triangular.shape[-2] - rank), value=1).unsqueeze(-1) * upper_triangular
     return orthogonal, upper_triangular
 
 
-def qr_decomposition(matrix: Tensor) -> tuple[Tensor, Tensor]:
-    """Compute the reduced QR decomposition using the Gram-Schmidt process.
+def qr_decomposition(matrix: Tensor, mode: QrMode = QrMode.REDUCED) -> tuple[Tensor, Tensor]:
+    """Compute the QR decomposition of a batch of matrices with Householder reflections.
+
+    Householder reflections keep ``Q`` orthogonal to working precision even
+    for ill-conditioned input, unlike Gram-Schmidt. The reflections run for
+    every matrix of the batch at once in one lazy graph of depth linear in
+    ``min(m, n)``, and the signs are chosen so the diagonal of R is
+    non-negative.
 
     Args:
-        matrix: Input matrix of shape (m, n).
+        matrix: Input matrices of shape ``(..., m, n)``.
+        mode: ``REDUCED`` returns ``(..., m, k)`` and ``(..., k, n)`` factors
+            with ``k = min(m, n)``; ``COMPLETE`` returns ``(..., m, m)`` and
+            ``(..., m, n)``.
 
     Returns:
-        A tuple (orthogonal, upper_triangular) where orthogonal has shape
-        (m, k) and upper_triangular has shape (k, n), with k = min(m, n).
+        A tuple (orthogonal, upper_triangular) with
+        ``orthogonal @ upper_triangular == matrix``.
+
+    Raises:
+        ValueError: If the input is not at least 2D.
     """
-    rows, columns = matrix.shape
+    if len(matrix.shape) < 2:
+        raise ValueError("Must be >= 2D")
+    rows, columns = matrix.shape[-2:]
     rank = min(rows, columns)
 
-    if rank == 0:
-        return Tensor.zeros(rows, 0, dtype=matrix.dtype), Tensor.zeros(0, columns, dtype=matrix.dtype)
-
-    orthogonal = _classical_gram_schmidt_basis(matrix, rank)
-    upper_triangular = orthogonal.T @ matrix
+    transposed_orthogonal, upper_triangular = _householder_triangularization(matrix)
+    orthogonal = transposed_orthogonal.transpose(-1, -2)
+    if mode == QrMode.REDUCED:
+        orthogonal, upper_triangular = orthogonal[..., :rank], upper_triangular[..., :rank, :]
     return _align_qr_diagonal_signs(orthogonal, upper_triangular, rank)
@@ -0,0 +1,79 @@
+from tinygrad import Tensor
+
+from tinyops.ops.linear_algebra._jacobi import ONE_SIDED_JACOBI_SWEEP_COUNT, jacobi_singular_value_decomposition
+from tinyops.ops.linear_algebra.qr_decomposition import QrMode, qr_decomposition
+from tinyops.ops.linear_algebra.symmetric_eigendecomposition import symmetric_eigendecomposition
+
+
+def _hermitian_singular_value_decomposition(matrix: Tensor) -> tuple[Tensor, Tensor, Tensor]:
+    """``(U, S, V^T)`` of symmetric matrices from their eigendecomposition, as numpy's ``hermitian=True`` does.
+
+    The singular values are the absolute eigenvalues, sorted descending,
+    and each row of ``V^T`` is its eigenvector times the eigenvalue's sign.
+    """
+    eigenvalues, eigenvectors = symmetric_eigendecomposition(matrix)
+    singular_values, order = eigenvalues.abs().sort(-1, descending=True)
+    signs = eigenvalues.gather(-1, order).sign()
+    left = eigenvectors.gather(-1, order.unsqueeze(-2).expand(eigenvectors.shape))
+    right_transposed = (left * signs.unsqueeze(-2)).transpose(-1, -2)
+    Tensor.realize(left, singular_values, right_transposed)
+    return left, singular_values, right_transposed
+
+
+def singular_value_decomposition(
+    matrix: Tensor,
+    full_matrices: bool = False,
+    sweep_count: int = ONE_SIDED_JACOBI_SWEEP_COUNT,
+    hermitian: bool = False,
+) -> tuple[Tensor, Tensor, Tensor]:
+    """Singular value decomposition of a batch of matrices by one-sided Jacobi.
+
+    The columns of the matrix (of its transpose, when it is wide) are
+    rotated in round-robin pairs until they are mutually orthogonal; their
+    norms are the singular values. Each sweep is ``n - 1`` steps of
+    identical shape that run under ``TinyJit``, so a fixed *sweep_count*
+    replays the same captured kernels. Jacobi finds small singular values
+    to high relative accuracy, and 15 sweeps reach float32 precision for
+    matrices up to a few hundred columns, rank-deficient ones included. The results are realized.
+
+    Singular vectors of the longer side that belong to negligible singular
+    values (at or below ``max(m, n) * eps`` times the largest) have no
+    direction of their own; a QR decomposition replaces them with an
+    orthonormal complement of the others, so the singular vectors are
+    orthonormal for rank-deficient input too.
+
+    Args:
+        matrix: Input matrices of shape ``(..., m, n)``.
+        full_matrices: If True, the singular vectors of the longer side are
+            completed to a square orthogonal matrix.
+        sweep_count: Number of Jacobi sweeps.
+        hermitian: If True, the matrices are taken to be symmetric (only
+            the lower triangle is read) and decomposed through
+            :func:`~tinyops.ops.linear_algebra.symmetric_eigendecomposition.symmetric_eigendecomposition`;
+            *full_matrices* and *sweep_count* are then ignored.
+
+    Returns:
+        A tuple (left, singular_values, right_transposed) of shapes
+        ``(..., m, k)``, ``(..., k)`` and ``(..., k, n)`` with
+        ``k = min(m, n)`` (``m`` and ``n`` for *full_matrices*), with
+        ``left @ diag(singular_values) @ right_transposed == matrix`` and
+        the singular values in descending order.
+
+    Raises:
+        ValueError: If the input is not at least 2D, or not square when
+            *hermitian* is True.
+    """
+    if len(matrix.shape) < 2:
+        raise ValueError("Must be >= 2D")
+    if hermitian:
+        return _hermitian_singular_value_decomposition(matrix)
+    rows, columns = matrix.shape[-2:]
+
+    left, singular_values, right = jacobi_singular_value_decomposition(matrix, sweep_count)
+    # Sorting put the zero columns last, so QR keeps the others and fills those with an orthonormal complement.
+    mode = QrMode.COMPLETE if full_matrices else QrMode.REDUCED
+    if rows >= columns:
+        left, _ = qr_decomposition(left, mode)
+    else:
+        right, _ = qr_decomposition(right, mode)
+    return left, singular_values, right.transpose(-1, -2)
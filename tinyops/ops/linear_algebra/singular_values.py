@@ -0,0 +1,34 @@
+from tinygrad import Tensor
+
+from tinyops.ops.linear_algebra._jacobi import ONE_SIDED_JACOBI_SWEEP_COUNT, jacobi_singular_value_decomposition
+from tinyops.ops.linear_algebra.symmetric_eigendecomposition import symmetric_eigendecomposition
+
+
+def singular_values(
+    matrix: Tensor,
+    sweep_count: int = ONE_SIDED_JACOBI_SWEEP_COUNT,
+    hermitian: bool = False,
+) -> Tensor:
+    """Singular values of a batch of matrices by one-sided Jacobi.
+
+    Args:
+        matrix: Input matrices of shape ``(..., m, n)``.
+        sweep_count: Number of Jacobi sweeps.
+        hermitian: If True, the matrices are taken to be symmetric (only
+            the lower triangle is read) and the singular values are their
+            absolute eigenvalues; *sweep_count* is then ignored.
+
+    Returns:
+        Tensor of shape ``(..., min(m, n))`` in descending order.
+
+    Raises:
+        ValueError: If the input is not at least 2D, or not square when
+            *hermitian* is True.
+    """
+    if len(matrix.shape) < 2:
+        raise ValueError("Must be >= 2D")
+    if hermitian:
+        eigenvalues, _ = symmetric_eigendecomposition(matrix)
+        return eigenvalues.abs().sort(-1, descending=True)[0]
+    _, values, _ = jacobi_singular_value_decomposition(matrix, sweep_count)
+    return values
@@ -1,19 +1,29 @@
 from tinygrad import Tensor
 
-from tinyops.ops.linear_algebra.inverse import inverse
+from tinyops.ops.linear_algebra._lu import lu_factor_solve, packed_lu_factorization
 
 
 def solve_linear_system(coefficients: Tensor, constants: Tensor) -> Tensor:
     """Solve a linear system of equations ``coefficients @ x = constants``.
 
+    Uses LU decomposition with partial pivoting followed by forward and
+    back substitution, without forming the inverse.
+
     Args:
-        coefficients: Coefficient matrix.
-        constants: Right-hand side vector or matrix.
+        coefficients: Coefficient matrix of shape ``(..., n, n)``.
+        constants: Right-hand side vector ``(..., n)`` or matrix ``(..., n, k)``.
 
     Returns:
-        Solution tensor.
+        Solution tensor with the shape of *constants*.
+
+    Raises:
+        ValueError: If the coefficients are not square.
     """
-    inverse_coefficients = inverse(coefficients)
+    if len(coefficients.shape) < 2 or coefficients.shape[-2] != coefficients.shape[-1]:
+        raise ValueError("Must be square")
+
+    packed, row_order = packed_lu_factorization(coefficients)
     if constants.ndim == coefficients.ndim - 1:
-        return inverse_coefficients.matmul(constants.unsqueeze(-1)).squeeze(-1)
-    return inverse_coefficients.matmul(constants)
+        return lu_factor_solve(packed, row_order, constants.unsqueeze(-1)).squeeze(-1)
+    right_hand_side = constants.expand(*packed.shape[:-2], *constants.shape[-2:])
+    return lu_factor_solve(packed, row_order, right_hand_side)
@@ -0,0 +1,55 @@
+"""Pure-tinygrad tests for the bounded least-recently-used store behind the module caches."""
+
+from tinyops.ops._lru_cache import LeastRecentlyUsedCache
+
+
+def test_repeated_lookup_builds_once():
+    cache = LeastRecentlyUsedCache(4)
+    builds = []
+
+    def build() -> list[int]:
+        builds.append(2)
+        return [2]
+
+    assert cache.get((2,), build) is cache.get((2,), build)
+    assert builds == [2]
+    info = cache.info()
+    assert (info.hits, info.misses, info.maximum_size, info.current_size) == (1, 1, 4, 1)
+
+
+def test_least_recently_used_value_is_evicted():
+    cache = LeastRecentlyUsedCache(2)
+    two = cache.get((2,), lambda: [2])
+    cache.get((4,), lambda: [4])
+    cache.get((2,), lambda: [2])
+    cache.get((8,), lambda: [8])
+    assert cache.info().current_size == 2
+    assert cache.get((2,), lambda: [2]) is two
+    assert cache.info().misses == 3
+
+
+def test_shrinking_evicts_and_zero_size_disables_caching():
+    cache = LeastRecentlyUsedCache(4)
+    for length in (2, 4, 8):
+        cache.get((length,), lambda length=length: [length])
+    cache.resize(1)
+    assert list(cache.values) == [(8,)]
+    cache.resize(0)
+    assert cache.get((4,), lambda: [4]) is not cache.get((4,), lambda: [4])
+    assert cache.info().current_size == 0
+
+
+def test_clear_resets_counters():
+    cache = LeastRecentlyUsedCache(4)
+    cache.get((2,), lambda: [2])
+    cache.get((2,), lambda: [2])
+    cache.clear()
+    assert cache.info() == (0, 0, 4, 0)
+
+
+def test_rejects_negative_size():
+    try:
+        LeastRecentlyUsedCache(4).resize(-1)
+        raise AssertionError("expected ValueError")
+    except ValueError as error:
+        assert "non-negative" in str(error)
@@ -2,19 +2,48 @@
 
 from .blackman_window import blackman_window
 from .convolution_1d import ConvolutionMode, convolution_1d
+from .convolution_method import FFT_CONVOLUTION_CROSSOVER_LENGTH, ConvolutionMethod, resolve_convolution_method
+from .discrete_cosine_transform_matrix import CosineTransformNormalization, discrete_cosine_transform_matrix
 from .discrete_fourier_transform import discrete_fourier_transform
 from .discrete_white_noise_matrix import discrete_white_noise_matrix
+from .extended_kalman_predict import extended_kalman_predict
+from .extended_kalman_update import extended_kalman_update
 from .fourier_frequencies import fourier_frequencies
+from .fourier_transform_plan import (
+    FourierDirection,
+    FourierTransformPlan,
+    clear_fourier_plan_cache,
+    fourier_plan_cache_info,
+    fourier_transform_plan,
+    set_fourier_plan_cache_size,
+)
 from .hamming_window import hamming_window
 from .hanning_window import hanning_window
+from .innovation_likelihood import innovation_likelihood
 from .inverse_discrete_fourier_transform import inverse_discrete_fourier_transform
 from .inverse_real_discrete_fourier_transform import inverse_real_discrete_fourier_transform
+from .inverse_short_time_fourier_transform import inverse_short_time_fourier_transform
 from .inverse_two_dimensional_discrete_fourier_transform import (
     inverse_two_dimensional_discrete_fourier_transform,
 )
 from .kaiser_window import kaiser_window
+from .kalman_predict import kalman_predict
+from .kalman_update import kalman_update
+from .linear_filter import linear_filter
 from .merwe_scaled_sigma_points import merwe_scaled_sigma_points
+from .overlap_save_convolution import overlap_save_convolution, overlap_save_kernel_spectrum
+from .rauch_tung_striebel_smoother import rauch_tung_striebel_smoother
 from .real_discrete_fourier_transform import real_discrete_fourier_transform
+from .second_order_sections_filter import SECOND_ORDER_SECTION_COEFFICIENT_COUNT, second_order_sections_filter
+from .short_time_fourier_transform import FramePaddingMode, short_time_fourier_transform
 from .two_dimensional_discrete_fourier_transform import (
     two_dimensional_discrete_fourier_transform,
 )
+from .window_cache import (
+    DEFAULT_WINDOW_CACHE_SIZE,
+    WindowKind,
+    clear_window_cache,
+    realized_window,
+    set_window_cache_size,
+    window_cache_info,
+)
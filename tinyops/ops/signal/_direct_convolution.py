@@ -0,0 +1,31 @@
+"""Direct (sliding product) evaluation of batched multichannel convolutions."""
+
+from tinygrad import Tensor
+
+
+def direct_convolution(signal: Tensor, kernel: Tensor, padding: tuple[int, int]) -> Tensor:
+    """Convolve every channel of a batch with one ``conv2d``.
+
+    A shared kernel treats every batch item and channel as its own image;
+    per-channel kernels use a grouped (depthwise) conv.
+
+    Args:
+        signal: Input of shape ``(batch, channels, N)``.
+        kernel: Kernels of shape ``(1, K)`` shared by every channel, or
+            ``(channels, K)``.
+        padding: Zeros added before and after the signal; the output holds
+            the ``N + sum(padding) - K + 1`` fully overlapping positions.
+
+    Returns:
+        Tensor of shape ``(batch, channels, N + sum(padding) - K + 1)``.
+    """
+    batch_size, channel_count, signal_length = signal.shape
+    kernel_length = kernel.shape[-1]
+    weights = kernel.flip(-1).reshape(kernel.shape[0], 1, 1, kernel_length)
+    if kernel.shape[0] > 1:
+        inputs = signal.reshape(batch_size, channel_count, 1, signal_length)
+        convolved = inputs.conv2d(weights, groups=channel_count, padding=(*padding, 0, 0))
+    else:
+        inputs = signal.reshape(batch_size * channel_count, 1, 1, signal_length)
+        convolved = inputs.conv2d(weights, padding=(*padding, 0, 0))
+    return convolved.reshape(batch_size, channel_count, -1)
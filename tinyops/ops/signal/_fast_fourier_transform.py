@@ -0,0 +1,229 @@
+"""Iterative fast Fourier transform stages over split real/imaginary planes.
+
+Stages operate on the last axis of ``(..., N)`` real and imaginary tensors
+so arbitrary leading batch axes share one lazy graph. Keeping the two
+planes separate avoids re-packing ``(real, imag)`` pairs at every stage.
+Twiddle and DFT-matrix tables are built here but owned (and realized once)
+by :class:`~tinyops.ops.signal.fourier_transform_plan.FourierTransformPlan`.
+"""
+
+import math
+
+from tinygrad import Tensor, dtypes
+from tinygrad.dtype import DType
+
+# Radices with dedicated butterfly passes; lengths with any other prime factor use Bluestein.
+MIXED_RADIX_FACTORS: tuple[int, ...] = (2, 3, 5, 7)
+
+
+def small_radix_factorization(length: int) -> tuple[int, ...] | None:
+    """Factor *length* into :data:`MIXED_RADIX_FACTORS`, or None if another prime remains."""
+    radices: list[int] = []
+    remaining = length
+    for radix in MIXED_RADIX_FACTORS:
+        while remaining % radix == 0:
+            radices.append(radix)
+            remaining //= radix
+    return tuple(radices) if remaining == 1 else None
+
+
+def digit_reversal_permutation(values: Tensor, radices: tuple[int, ...]) -> Tensor:
+    """Reorder the last axis of *values* into mixed-radix digit-reversed order.
+
+    An axis of length ``prod(radices)`` viewed as one digit axis per radix is
+    digit-reversed by reversing the order of those axes, so the gather is a
+    single reshape/permute movement with no index tensor. With every radix
+    equal to 2 this is the classic bit reversal.
+
+    Args:
+        values: Tensor whose last axis has length ``prod(radices)``.
+        radices: Stage radices in the order the butterfly passes apply them.
+
+    Returns:
+        Tensor of the same shape with the last axis digit-reversed.
+    """
+    if len(radices) <= 1:
+        return values
+
+    batch_shape = values.shape[:-1]
+    batch_rank = len(batch_shape)
+    digit_count = len(radices)
+    digit_view = values.reshape(*batch_shape, *radices)
+    reversed_axes = (*range(batch_rank), *range(batch_rank + digit_count - 1, batch_rank - 1, -1))
+    return digit_view.permute(reversed_axes).reshape(*batch_shape, values.shape[-1])
+
+
+def bit_reversal_permutation(values: Tensor) -> Tensor:
+    """Reorder a power-of-two last axis of *values* into bit-reversed index order."""
+    bit_count = values.shape[-1].bit_length() - 1
+    return digit_reversal_permutation(values, (2,) * bit_count)
+
+
+def complex_multiply(
+    left_real: Tensor,
+    left_imaginary: Tensor,
+    right_real: Tensor,
+    right_imaginary: Tensor,
+) -> tuple[Tensor, Tensor]:
+    """Elementwise complex product of split-plane operands (broadcasting)."""
+    return (
+        left_real * right_real - left_imaginary * right_imaginary,
+        left_real * right_imaginary + left_imaginary * right_real,
+    )
+
+
+def phase_dtype(dtype: DType) -> DType:
+    """Dtype the angles of *dtype* tables are evaluated in: float64 for float64, float32 otherwise.
+
+    Narrower floats get float32 angles so the table is rounded only once, in
+    the final cast; float64 tables need float64 angles to stay accurate.
+    """
+    return dtypes.float64 if dtype == dtypes.float64 else dtypes.float32
+
+
+def unit_phasor(angle: Tensor, dtype: DType) -> tuple[Tensor, Tensor]:
+    """``(cos, sin)`` of *angle* (in :func:`phase_dtype` of *dtype*), cast to *dtype* after evaluation."""
+    return angle.cos().cast(dtype), angle.sin().cast(dtype)
+
+
+def butterfly_stage_tables(half_size: int, sign: int, dtype: DType, device: str) -> tuple[Tensor, ...]:
+    """Twiddles ``exp(sign * pi * i * k / half_size)`` and the ``(+1, -1)`` butterfly sign."""
+    angle = Tensor.arange(half_size, dtype=phase_dtype(dtype), device=device) * (sign * math.pi / half_size)
+    butterfly_sign = Tensor([[1.0], [-1.0]], dtype=dtype, device=device)
+    return (*unit_phasor(angle, dtype), butterfly_sign)
+
+
+def radix_stage_tables(radix: int, sub_length: int, sign: int, dtype: DType, device: str) -> tuple[Tensor, ...]:
+    """Twiddles ``exp(sign * 2 pi i j k / (radix * sub_length))`` and the ``radix``-point DFT matrix.
+
+    The DFT matrix is shaped ``(radix, radix, 1)`` so it broadcasts against
+    ``(..., 1, radix, sub_length)`` blocks in :func:`radix_stage`.
+    """
+    term_indices = Tensor.arange(radix, dtype=phase_dtype(dtype), device=device).reshape(radix, 1)
+    frequency_indices = Tensor.arange(sub_length, dtype=phase_dtype(dtype), device=device).reshape(1, sub_length)
+    angle = term_indices * frequency_indices * (sign * 2 * math.pi / (radix * sub_length))
+
+    matrix_angles = [[sign * 2 * math.pi * output * term / radix for term in range(radix)] for output in range(radix)]
+    dft_real = Tensor([[[math.cos(value)] for value in row] for row in matrix_angles], dtype=dtype, device=device)
+    dft_imaginary = Tensor([[[math.sin(value)] for value in row] for row in matrix_angles], dtype=dtype, device=device)
+    return (*unit_phasor(angle, dtype), dft_real, dft_imaginary)
+
+
+def stage_tables(radices: tuple[int, ...], sign: int, dtype: DType, device: str) -> tuple[tuple[Tensor, ...], ...]:
+    """Per-stage tables for :func:`mixed_radix_transform`, in application order."""
+    tables = []
+    sub_length = 1
+    for radix in radices:
+        if radix == 2:
+            tables.append(butterfly_stage_tables(sub_length, sign, dtype, device))
+        else:
+            tables.append(radix_stage_tables(radix, sub_length, sign, dtype, device))
+        sub_length *= radix
+    return tuple(tables)
+
+
+def butterfly_stage(
+    real: Tensor,
+    imaginary: Tensor,
+    twiddle_real: Tensor,
+    twiddle_imaginary: Tensor,
+    butterfly_sign: Tensor,
+) -> tuple[Tensor, Tensor]:
+    """Combine adjacent length-``h`` sub-spectra into length ``2h`` spectra (``h`` = twiddle length).
+
+    The last axis is viewed as ``(N / (2h), 2, h)``: index 0 of the middle
+    axis holds the even sub-spectrum, index 1 the odd one. Outputs are
+    ``even + sign * twiddled_odd`` with ``sign`` broadcast over that middle
+    axis, which keeps every stage a pure elementwise expression over
+    expanded views instead of a pad-and-add concatenation.
+    """
+    batch_shape = real.shape[:-1]
+    length = real.shape[-1]
+    half_size = twiddle_real.shape[-1]
+    block_shape = (*batch_shape, length // (2 * half_size), 2, half_size)
+    real_blocks = real.reshape(block_shape)
+    imaginary_blocks = imaginary.reshape(block_shape)
+
+    even_real, odd_real = real_blocks[..., 0:1, :], real_blocks[..., 1:2, :]
+    even_imaginary, odd_imaginary = imaginary_blocks[..., 0:1, :], imaginary_blocks[..., 1:2, :]
+    twiddled_real, twiddled_imaginary = complex_multiply(odd_real, odd_imaginary, twiddle_real, twiddle_imaginary)
+
+    combined_real = even_real + butterfly_sign * twiddled_real
+    combined_imaginary = even_imaginary + butterfly_sign * twiddled_imaginary
+    return combined_real.reshape(*batch_shape, length), combined_imaginary.reshape(*batch_shape, length)
+
+
+def radix_stage(
+    real: Tensor,
+    imaginary: Tensor,
+    twiddle_real: Tensor,
+    twiddle_imaginary: Tensor,
+    dft_real: Tensor,
+    dft_imaginary: Tensor,
+) -> tuple[Tensor, Tensor]:
+    """Combine ``radix`` adjacent sub-spectra with a small dense DFT (shapes from the tables).
+
+    The last axis is viewed as ``(N / (radix * sub_length), radix, sub_length)``.
+    Sub-spectrum ``j`` is multiplied by its twiddle row and the
+    ``radix``-point DFT across ``j`` is a broadcast multiply and a reduction
+    over a tiny axis, so the stage stays one vectorized expression.
+    """
+    batch_shape = real.shape[:-1]
+    length = real.shape[-1]
+    radix, sub_length = twiddle_real.shape
+    block_shape = (*batch_shape, length // (radix * sub_length), radix, sub_length)
+    real_blocks = real.reshape(block_shape)
+    imaginary_blocks = imaginary.reshape(block_shape)
+
+    twiddled_real, twiddled_imaginary = complex_multiply(real_blocks, imaginary_blocks, twiddle_real, twiddle_imaginary)
+    combined_real, combined_imaginary = complex_multiply(
+        dft_real, dft_imaginary, twiddled_real.unsqueeze(-3), twiddled_imaginary.unsqueeze(-3)
+    )
+    return (
+        combined_real.sum(axis=-2).reshape(*batch_shape, length),
+        combined_imaginary.sum(axis=-2).reshape(*batch_shape, length),
+    )
+
+
+def mixed_radix_transform(
+    real: Tensor,
+    imaginary: Tensor,
+    radices: tuple[int, ...],
+    tables: tuple[tuple[Tensor, ...], ...],
+) -> tuple[Tensor, Tensor]:
+    """Unscaled DFT along the last axis for lengths that factor into *radices*.
+
+    Decimation-in-time: one digit-reversal gather followed by one vectorized
+    pass per radix, so graph depth grows with the number of factors rather
+    than with a Python recursion tree. Radix-2 passes use an add/subtract
+    butterfly; radix 3, 5 and 7 passes use a small dense DFT. The transform
+    direction is fixed by the sign the *tables* were built with.
+
+    Args:
+        real: Real parts, shape ``(..., N)`` with ``N == prod(radices)``.
+        imaginary: Imaginary parts, same shape as *real*.
+        radices: Factorization of ``N``, applied in order.
+        tables: Output of :func:`stage_tables` for the same *radices*.
+
+    Returns:
+        ``(real, imaginary)`` spectra with the same shape as the inputs.
+    """
+    real = digit_reversal_permutation(real, radices)
+    imaginary = digit_reversal_permutation(imaginary, radices)
+
+    for radix, table in zip(radices, tables):
+        if radix == 2:
+            real, imaginary = butterfly_stage(real, imaginary, *table)
+        else:
+            real, imaginary = radix_stage(real, imaginary, *table)
+    return real, imaginary
+
+
+def chirp_phase(indices: Tensor, length: int, dtype: DType) -> Tensor:
+    """Bluestein chirp phase ``pi * n^2 / N`` for *dtype* tables, with ``n^2`` reduced modulo ``2N``.
+
+    Reducing in integer arithmetic before the float conversion keeps the
+    phase exact for long transforms where ``n^2`` exceeds float32 precision.
+    """
+    squared_indices = (indices * indices) % (2 * length)
+    return squared_indices.cast(phase_dtype(dtype)) * (math.pi / length)
@@ -0,0 +1,63 @@
+"""Overlap-add FFT evaluation of full linear convolutions."""
+
+import math
+
+from tinygrad import Tensor
+
+from tinyops.ops.signal._fast_fourier_transform import complex_multiply
+from tinyops.ops.signal._real_fourier_transform import real_forward_transform, real_inverse_transform
+from tinyops.ops.signal._short_time_fourier import overlap_add
+
+
+def block_transform_length(signal_length: int, kernel_length: int) -> int:
+    """Power-of-two FFT size that minimizes ``F log F / (F - K + 1)`` work per output sample.
+
+    Sizes are tried from the smallest that fits the kernel up to the one that
+    holds the whole output in a single block.
+    """
+    output_length = signal_length + kernel_length - 1
+    single_block_length = 1 << (output_length - 1).bit_length()
+    transform_length = 1 << kernel_length.bit_length()
+    best_length, best_cost = single_block_length, math.inf
+    while transform_length <= single_block_length:
+        block_count = math.ceil(signal_length / (transform_length - kernel_length + 1))
+        cost = block_count * transform_length * math.log2(transform_length)
+        if cost < best_cost:
+            best_length, best_cost = transform_length, cost
+        transform_length *= 2
+    return best_length
+
+
+def fft_linear_convolution(signal: Tensor, kernel: Tensor) -> Tensor:
+    """Full linear convolution along the last axis using overlap-add FFTs.
+
+    *signal* is cut into blocks of ``F - K + 1`` samples. All blocks go
+    through one batched real FFT of size ``F``, are multiplied by the
+    kernel spectrum, transformed back, and overlap-added, so the graph size
+    does not depend on the signal length.
+
+    Args:
+        signal: Real tensor of shape ``(..., N)``.
+        kernel: Real tensor of shape ``(..., K)`` broadcastable against
+            *signal* on the leading axes.
+
+    Returns:
+        Tensor of shape ``(..., N + K - 1)``.
+    """
+    signal_length = signal.shape[-1]
+    kernel_length = kernel.shape[-1]
+    output_length = signal_length + kernel_length - 1
+    transform_length = block_transform_length(signal_length, kernel_length)
+    block_length = transform_length - kernel_length + 1
+    block_count = math.ceil(signal_length / block_length)
+
+    signal_padding = (*((None,) * (signal.ndim - 1)), (0, block_count * block_length - signal_length))
+    blocks = signal.pad(signal_padding).reshape(*signal.shape[:-1], block_count, block_length)
+    blocks = blocks.pad((*((None,) * (blocks.ndim - 1)), (0, transform_length - block_length)))
+    kernel = kernel.pad((*((None,) * (kernel.ndim - 1)), (0, transform_length - kernel_length))).unsqueeze(-2)
+
+    block_spectrum = real_forward_transform(blocks)
+    kernel_spectrum = real_forward_transform(kernel)
+    product_real, product_imaginary = complex_multiply(*block_spectrum, *kernel_spectrum)
+    block_outputs = real_inverse_transform(product_real, product_imaginary, transform_length)
+    return overlap_add(block_outputs, block_length)[..., :output_length]
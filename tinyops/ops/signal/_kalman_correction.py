@@ -0,0 +1,34 @@
+"""Shared measurement correction for the linear and extended Kalman updates."""
+
+from tinygrad import Tensor
+
+from tinyops.ops.linear_algebra.cholesky_decomposition import cholesky_decomposition
+from tinyops.ops.linear_algebra.cholesky_solve import cholesky_solve
+
+
+def kalman_correction(
+    state: Tensor,
+    covariance: Tensor,
+    residual: Tensor,
+    measurement_matrix: Tensor,
+    measurement_noise: Tensor,
+) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+    """Posterior ``(state, covariance, gain, innovation_covariance)`` from a ``(..., m)`` residual.
+
+    The measurement model is ``(..., m, n)``. The gain ``K = P H^T S^-1`` is a batched Cholesky solve against
+    ``S = H P H^T + R`` and the covariance uses the Joseph form
+    ``(I - K H) P (I - K H)^T + K R K^T``.
+    """
+    size = state.shape[-1]
+    # H P is the transpose of P H^T because the covariance is symmetric.
+    measured_covariance = measurement_matrix @ covariance
+    innovation_covariance = measured_covariance @ measurement_matrix.transpose(-1, -2) + measurement_noise
+    factor = cholesky_decomposition(innovation_covariance)
+    gain = cholesky_solve(factor, measured_covariance).transpose(-1, -2)
+
+    updated_state = state + (gain @ residual.unsqueeze(-1)).squeeze(-1)
+    correction = Tensor.eye(size, dtype=covariance.dtype, device=covariance.device) - gain @ measurement_matrix
+    updated_covariance = correction @ covariance @ correction.transpose(
+        -1, -2
+    ) + gain @ measurement_noise @ gain.transpose(-1, -2)
+    return updated_state, updated_covariance, gain, innovation_covariance
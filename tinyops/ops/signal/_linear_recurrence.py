@@ -0,0 +1,29 @@
+from tinygrad import Tensor
+
+
+def linear_recurrence_scan(transition: Tensor, inputs: Tensor) -> Tensor:
+    """Solve ``state[n] = transition @ state[n - 1] + inputs[n]`` from a zero state, for every ``n`` at once.
+
+    A Hillis-Steele prefix scan over the affine steps: after the pass with
+    stride ``s`` each state holds the contributions of its ``2 * s`` most
+    recent inputs, so ``ceil(log2(N))`` passes of one shift and one small
+    matmul cover the whole sequence. The transition is time-invariant, so
+    every position in a pass shares the same power ``transition ** s``,
+    squared once per pass.
+
+    Args:
+        transition: State transition of shape ``(..., order, order)``.
+        inputs: Per-step inputs of shape ``(..., N, order)``; leading axes
+            broadcast against those of *transition*.
+
+    Returns:
+        States of shape ``(..., N, order)``.
+    """
+    sample_count = inputs.shape[-2]
+    states, power, stride = inputs, transition, 1
+    while stride < sample_count:
+        earlier = states[..., : sample_count - stride, :].pad(((None,) * (states.ndim - 2)) + ((stride, 0), None))
+        # Materialized per pass: both the shifted and unshifted states feed the next one.
+        states = (states + earlier @ power.transpose(-1, -2)).contiguous()
+        power, stride = power @ power, stride * 2
+    return states
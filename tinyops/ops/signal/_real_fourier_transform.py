@@ -0,0 +1,101 @@
+"""Real-input FFT paths that pack even/odd samples into a half-length complex transform."""
+
+from tinygrad import Tensor
+
+from tinyops.ops.signal._fast_fourier_transform import complex_multiply
+from tinyops.ops.signal.fourier_transform_plan import FourierDirection, fourier_transform_plan
+
+
+def real_forward_transform(samples: Tensor) -> tuple[Tensor, Tensor]:
+    """Non-negative frequency bins of the DFT of real *samples* along the last axis.
+
+    Even lengths pack samples ``(x[2n], x[2n + 1])`` into one complex signal
+    ``z`` of length ``N / 2``, transform it once, and split the result into
+    the even and odd sub-spectra ``E[k] = (Z[k] + conj(Z[-k])) / 2`` and
+    ``O[k] = (Z[k] - conj(Z[-k])) / 2i``. The output is
+    ``X[k] = E[k] + exp(-2 pi i k / N) O[k]``, which halves the transform
+    length and memory of a zero-imaginary full-length FFT. Odd lengths fall
+    back to the full complex transform.
+
+    Args:
+        samples: Real float tensor of shape ``(..., N)`` with ``N >= 1``.
+
+    Returns:
+        ``(real, imaginary)`` tensors of shape ``(..., N // 2 + 1)``.
+    """
+    batch_shape = samples.shape[:-1]
+    length = samples.shape[-1]
+    bin_count = length // 2 + 1
+    if length % 2 == 1:
+        plan = fourier_transform_plan(length, FourierDirection.FORWARD, samples.dtype, samples.device)
+        real, imaginary = plan.execute(samples, samples.zeros_like())
+        return real[..., :bin_count], imaginary[..., :bin_count]
+
+    half_length = length // 2
+    plan = fourier_transform_plan(half_length, FourierDirection.FORWARD, samples.dtype, samples.device)
+    sample_pairs = samples.reshape(*batch_shape, half_length, 2)
+    packed_real, packed_imaginary = plan.execute(sample_pairs[..., 0], sample_pairs[..., 1])
+
+    # Z extended with Z[N/2] = Z[0], so flipping it yields Z[(N/2 - k) mod N/2] for k = 0 .. N/2.
+    extended_real = packed_real.cat(packed_real[..., 0:1], dim=-1)
+    extended_imaginary = packed_imaginary.cat(packed_imaginary[..., 0:1], dim=-1)
+    mirrored_real, mirrored_imaginary = extended_real.flip(-1), extended_imaginary.flip(-1)
+
+    even_real = (extended_real + mirrored_real) / 2
+    even_imaginary = (extended_imaginary - mirrored_imaginary) / 2
+    odd_real = (extended_imaginary + mirrored_imaginary) / 2
+    odd_imaginary = (mirrored_real - extended_real) / 2
+
+    rotated_real, rotated_imaginary = complex_multiply(odd_real, odd_imaginary, *plan.packing_twiddle)
+    return even_real + rotated_real, even_imaginary + rotated_imaginary
+
+
+def real_inverse_transform(real: Tensor, imaginary: Tensor, length: int) -> Tensor:
+    """Real length-*length* signal from its ``length // 2 + 1`` non-negative DFT bins.
+
+    Inverts :func:`real_forward_transform`: for even lengths the even and odd
+    sub-spectra are recovered from ``X[k]`` and ``conj(X[N/2 - k])``,
+    recombined as ``Z[k] = E[k] + i O[k]``, and one inverse FFT of length
+    ``N / 2`` yields the interleaved samples. The imaginary parts of the DC
+    and Nyquist bins are ignored, as in ``numpy.fft.irfft``. Odd lengths
+    complete the Hermitian spectrum and use the full inverse transform.
+
+    Args:
+        real: Real parts of the bins, float tensor of shape ``(..., length // 2 + 1)``.
+        imaginary: Imaginary parts, same shape as *real*.
+        length: Output length ``N >= 1``.
+
+    Returns:
+        Real tensor of shape ``(..., N)``.
+    """
+    batch_shape = real.shape[:-1]
+    if length % 2 == 1:
+        negative_frequency_count = length - real.shape[-1]
+        full_real = real.cat(real[..., 1 : negative_frequency_count + 1].flip(-1), dim=-1)
+        full_imaginary = imaginary.cat(-imaginary[..., 1 : negative_frequency_count + 1].flip(-1), dim=-1)
+        plan = fourier_transform_plan(length, FourierDirection.INVERSE, real.dtype, real.device)
+        recovered_real, _ = plan.execute(full_real, full_imaginary)
+        return recovered_real
+
+    half_length = length // 2
+    plan = fourier_transform_plan(half_length, FourierDirection.INVERSE, real.dtype, real.device)
+    bin_indices = Tensor.arange(half_length + 1, device=real.device)
+    is_real_bin = (bin_indices == 0) | (bin_indices == half_length)
+    imaginary = is_real_bin.where(0.0, imaginary)
+
+    bin_real, bin_imaginary = real[..., :half_length], imaginary[..., :half_length]
+    mirrored_real = real[..., 1:].flip(-1)
+    mirrored_imaginary = imaginary[..., 1:].flip(-1)
+
+    even_real = (bin_real + mirrored_real) / 2
+    even_imaginary = (bin_imaginary - mirrored_imaginary) / 2
+    twiddle_real, twiddle_imaginary = plan.packing_twiddle
+    odd_real, odd_imaginary = complex_multiply(
+        (bin_real - mirrored_real) / 2,
+        (bin_imaginary + mirrored_imaginary) / 2,
+        twiddle_real[:half_length],
+        twiddle_imaginary[:half_length],
+    )
+
+    packed_real, packed_imaginary = plan.execute(even_real - odd_imaginary, even_imaginary + odd_real)
+    return Tensor.stack([packed_real, packed_imaginary], dim=-1).reshape(*batch_shape, length)
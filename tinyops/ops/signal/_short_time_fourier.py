@@ -0,0 +1,65 @@
+"""Shared framing helpers for the short-time Fourier transform and its inverse."""
+
+import math
+
+from tinygrad import Tensor, dtypes
+
+
+def resolve_hop_length(frame_length: int, hop_length: int | None) -> int:
+    """Default hop is a quarter frame, as in ``torch.stft``.
+
+    Raises:
+        ValueError: If *frame_length* or the resolved hop is not positive.
+    """
+    if frame_length < 1:
+        raise ValueError(f"frame_length must be positive, got {frame_length}")
+    hop_length = frame_length // 4 if hop_length is None else hop_length
+    if hop_length < 1:
+        raise ValueError(f"hop_length must be positive, got {hop_length}")
+    return hop_length
+
+
+def frame_window(window: Tensor | None, frame_length: int) -> Tensor:
+    """Window of length *frame_length*: rectangular when ``None``, else zero-padded on both sides.
+
+    A window shorter than the frame is centered, matching ``torch.stft``
+    with ``win_length < n_fft``.
+
+    Raises:
+        ValueError: If *window* is not 1-D or is longer than *frame_length*.
+    """
+    if window is None:
+        return Tensor.ones(frame_length, dtype=dtypes.float32)
+    if window.ndim != 1 or window.shape[0] > frame_length:
+        raise ValueError(f"window must be 1-D with at most {frame_length} samples, got shape {window.shape}")
+    left_padding = (frame_length - window.shape[0]) // 2
+    return window.cast(dtypes.float32).pad(((left_padding, frame_length - window.shape[0] - left_padding),))
+
+
+def overlap_add(frames: Tensor, hop_length: int) -> Tensor:
+    """Sum ``(..., frames, frame_length)`` frames placed *hop_length* samples apart.
+
+    Each frame is cut into ``ceil(frame_length / hop_length)`` hop-sized
+    chunks. Chunk ``j`` of frame ``t`` lands on output hop ``t + j``, so
+    shifting the chunk-``j`` plane by ``j`` hops and summing over ``j`` is the
+    whole overlap-add. The shift is a pad/flatten/reshape shear, so there is
+    no per-frame or per-chunk loop.
+
+    Returns:
+        Tensor of shape ``(..., (frames - 1) * hop_length + frame_length)``.
+    """
+    *batch_shape, frame_count, frame_length = frames.shape
+    chunk_count = math.ceil(frame_length / hop_length)
+    batch_padding = (None,) * len(batch_shape)
+    chunks = frames.pad((*batch_padding, None, (0, chunk_count * hop_length - frame_length)))
+    chunks = chunks.reshape(*batch_shape, frame_count, chunk_count, hop_length).transpose(-3, -2)
+    planes = chunks.reshape(*batch_shape, chunk_count, frame_count * hop_length)
+
+    # Row j of a (rows, width + rows * hop) matrix, flattened and re-read with
+    # width + (rows - 1) * hop columns, starts j * hop columns further right.
+    plane_length = frame_count * hop_length
+    sheared_length = plane_length + (chunk_count - 1) * hop_length
+    padded = planes.pad((*batch_padding, None, (0, chunk_count * hop_length)))
+    flattened = padded.reshape(*batch_shape, chunk_count * (plane_length + chunk_count * hop_length))
+    sheared = flattened[..., : chunk_count * sheared_length].reshape(*batch_shape, chunk_count, sheared_length)
+    return sheared.sum(axis=-2)[..., : (frame_count - 1) * hop_length + frame_length]
@@ -0,0 +1,45 @@
+"""Unscented transform of batched sigma points, the moment step of an unscented Kalman filter."""
+
+from tinygrad import Tensor
+
+
+def unscented_transform(
+    sigma_points: Tensor,
+    mean_weights: Tensor,
+    covariance_weights: Tensor,
+    noise_covariance: Tensor | None = None,
+) -> tuple[Tensor, Tensor]:
+    """Recover the mean and covariance represented by weighted sigma points.
+
+    Computes ``x = sum_i Wm[i] s_i`` and
+    ``P = sum_i Wc[i] (s_i - x)(s_i - x)^T + noise`` for every filter in the
+    batch with two matmuls. Passing sigma points through a nonlinear model
+    and then through this transform is the prediction (or measurement)
+    step of the unscented Kalman filter.
+
+    Args:
+        sigma_points: Sigma points of shape ``(..., points, k)``, e.g. from
+            :func:`~tinyops.ops.signal.merwe_scaled_sigma_points.merwe_scaled_sigma_points`
+            after a transition or measurement function.
+        mean_weights: Mean weights of shape ``(points,)`` or ``(..., points)``.
+        covariance_weights: Covariance weights, shaped like *mean_weights*.
+        noise_covariance: Additive noise of shape ``(..., k, k)``.
+
+    Returns:
+        ``(mean, covariance)`` with shapes ``(..., k)`` and ``(..., k, k)``.
+
+    Raises:
+        ValueError: If the weights do not have one entry per sigma point.
+    """
+    point_count = sigma_points.shape[-2]
+    if mean_weights.shape[-1] != point_count or covariance_weights.shape[-1] != point_count:
+        raise ValueError(
+            f"weights must have {point_count} entries, got {mean_weights.shape} and {covariance_weights.shape}"
+        )
+
+    mean = (mean_weights.unsqueeze(-2) @ sigma_points).squeeze(-2)
+    deviations = sigma_points - mean.unsqueeze(-2)
+    covariance = (deviations * covariance_weights.unsqueeze(-1)).transpose(-1, -2) @ deviations
+    if noise_covariance is not None:
+        covariance = covariance + noise_covariance
+    return mean, covariance
@@ -1,10 +1,12 @@
-"""Shared helpers for cosine-sum window generation."""
+"""Shared helpers for cosine-sum and Kaiser window generation."""
 
 import math
 from collections.abc import Sequence
 
 from tinygrad import Tensor
 
+from tinyops.ops.signal._modified_bessel import scaled_modified_bessel_i0
+
 # Standard cosine-sum coefficients (a0, a1, a2, ...).
 # Window formula: sum_k (-1)^k * a_k * cos(2 * pi * k * n / denominator).
 HANNING_COEFFICIENTS: tuple[float, ...] = (0.5, 0.5)
@@ -46,3 +48,17 @@ def cosine_sum_window(
         else:
             result = result + term
     return result
+
+
+def kaiser_taper(relative_position: Tensor, beta: float) -> Tensor:
+    """Kaiser taper ``I0(beta * sqrt(1 - r^2)) / I0(beta)`` at positions ``r`` in ``[-1, 1]``.
+
+    The ratio is formed from exponentially scaled ``I0`` values so large
+    ``beta`` does not overflow. Positions need not lie on a sample grid,
+    which lets filter design evaluate the taper at fractional offsets.
+    """
+    # Clamp the radicand against tiny negative values from floating point.
+    argument = beta * (1.0 - relative_position * relative_position).maximum(0.0).sqrt()
+    # I0(x) / I0(beta) = (exp(-|x|) I0(x)) / (exp(-|beta|) I0(beta)) * exp(|x| - |beta|).
+    scale = (argument.abs() - abs(beta)).exp() / scaled_modified_bessel_i0(Tensor(float(beta)))
+    return scaled_modified_bessel_i0(argument) * scale
@@ -1,6 +1,13 @@
+import math
 from enum import Enum
 
 from tinygrad import Tensor
+from tinygrad.dtype import least_upper_dtype, least_upper_float
+
+from tinyops.ops.signal._direct_convolution import direct_convolution
+from tinyops.ops.signal._fft_convolution import block_transform_length, fft_linear_convolution
+from tinyops.ops.signal.convolution_method import ConvolutionMethod, resolve_convolution_method
+from tinyops.ops.signal.overlap_save_convolution import overlap_save_convolution, overlap_save_kernel_spectrum
 
 
 class ConvolutionMode(Enum):
@@ -11,67 +18,128 @@ class ConvolutionMode(Enum):
     SAME = "same"
 
 
-def _order_longer_signal_first(
-    signal: Tensor,
-    kernel: Tensor,
-) -> tuple[Tensor, Tensor, int, int]:
-    """Return (signal, kernel, signal_length, kernel_length) with signal longer.
+def _convolution_output_window(signal_length: int, kernel_length: int, mode: ConvolutionMode) -> tuple[int, int]:
+    """Return (start, length) of *mode*'s output inside the FULL convolution.
 
-    Discrete linear convolution is commutative; swapping keeps the longer
-    sequence as the conv input so padding math stays kernel-relative.
+    Linear convolution is commutative, so like ``numpy.convolve`` the
+    windows are measured against the longer of the two sequences.
     """
-    signal_length = signal.shape[0]
-    kernel_length = kernel.shape[0]
-    if kernel_length > signal_length:
-        return kernel, signal, kernel_length, signal_length
-    return signal, kernel, signal_length, kernel_length
-
-
-def _convolution_1d_padding(
-    mode: ConvolutionMode,
-    kernel_length: int,
-) -> tuple[int, int]:
-    """Left/right spatial padding for the 1D signal given *mode* and kernel size."""
+    shorter_length = min(signal_length, kernel_length)
+    longer_length = max(signal_length, kernel_length)
     if mode == ConvolutionMode.FULL:
-        return kernel_length - 1, kernel_length - 1
+        return 0, signal_length + kernel_length - 1
     if mode == ConvolutionMode.SAME:
-        return kernel_length // 2, (kernel_length - 1) // 2
+        return (shorter_length - 1) // 2, longer_length
     if mode == ConvolutionMode.VALID:
-        return 0, 0
+        return shorter_length - 1, longer_length - shorter_length + 1
     raise ValueError(f"Invalid mode '{mode}'")
 
 
+def _batched_signal_and_kernel(signal: Tensor, kernel: Tensor) -> tuple[Tensor, Tensor]:
+    """Return (signal, kernel) as ``(B, C, N)`` and ``(C or 1, K)``."""
+    if signal.ndim not in (1, 3):
+        raise ValueError(f"signal must have shape (N,) or (batch, channels, N), got {signal.shape}")
+    if kernel.ndim not in (1, 2) or (kernel.ndim == 2 and signal.ndim == 1):
+        raise ValueError(f"kernel must have shape (K,), or (channels, K) for a batched signal, got {kernel.shape}")
+
+    signal = signal.reshape(1, 1, signal.shape[0]) if signal.ndim == 1 else signal
+    kernel = kernel.unsqueeze(0) if kernel.ndim == 1 else kernel
+    channel_count = signal.shape[1]
+    if kernel.shape[0] not in (1, channel_count):
+        raise ValueError(f"got {kernel.shape[0]} kernels for {channel_count} channels")
+    return signal, kernel
+
+
+def _overlap_save_linear_convolution(signal: Tensor, kernel: Tensor) -> Tensor:
+    """Full convolution of ``(B, C, N)`` signals with ``(C or 1, K)`` kernels as one batch of overlap-save blocks.
+
+    The signal, followed by ``K - 1`` zeros, is cut into blocks of
+    ``F - K + 1`` samples whose carry is the tail of the block before, so
+    every block goes through the same
+    :func:`~tinyops.ops.signal.overlap_save_convolution.overlap_save_convolution`
+    step with one shared kernel spectrum. The FFT size ``F`` is at least
+    ``2 (K - 1)`` so that a block holds a whole carry.
+    """
+    signal_length, kernel_length = signal.shape[-1], kernel.shape[-1]
+    output_length = signal_length + kernel_length - 1
+    transform_length = max(
+        block_transform_length(signal_length, kernel_length), 1 << (2 * kernel_length - 3).bit_length()
+    )
+    block_length = transform_length - kernel_length + 1
+    block_count = math.ceil(output_length / block_length)
+
+    stream = signal.pad((None, None, (0, block_count * block_length - signal_length)))
+    blocks = stream.reshape(*signal.shape[:-1], block_count, block_length)
+    carries = blocks[..., :-1, block_length - kernel_length + 1 :].pad((None, None, (1, 0), None))
+    kernel = kernel.unsqueeze(-2)
+    output, _ = overlap_save_convolution(
+        blocks,
+        kernel.expand(*blocks.shape[:-1], kernel_length),
+        carries,
+        ConvolutionMethod.FFT,
+        overlap_save_kernel_spectrum(kernel, block_length),
+    )
+    return output.reshape(*signal.shape[:-1], -1)[..., :output_length]
+
+
 def convolution_1d(
     signal: Tensor,
     kernel: Tensor,
     mode: ConvolutionMode = ConvolutionMode.FULL,
+    method: ConvolutionMethod = ConvolutionMethod.AUTO,
 ) -> Tensor:
-    """Compute the discrete linear convolution of two 1D sequences.
+    """Compute the discrete linear convolution of 1D sequences, optionally batched.
+
+    ``DIRECT`` lowers to one ``conv2d`` over every batch item and channel;
+    per-channel kernels use a grouped (depthwise) conv. ``FFT`` evaluates
+    the full convolution blockwise and slices the requested mode out of it,
+    which is much cheaper for long kernels: a signal at least twice as long
+    as the kernel is streamed through batched overlap-save blocks, anything
+    else is overlap-added. The FFT runs in the promoted float dtype of the
+    inputs (``float32`` for integers), so float64 stays float64 at every
+    length.
 
     Args:
-        signal: First 1D input tensor.
-        kernel: Second 1D input tensor.
-        mode: Output size mode (FULL, VALID, or SAME).
+        signal: Input of shape ``(N,)`` or a multichannel batch of shape
+            ``(batch, channels, N)``.
+        kernel: Kernel of shape ``(K,)`` shared by every channel, or
+            ``(channels, K)`` with one kernel per channel of a batched
+            *signal*.
+        mode: Output size mode (FULL, VALID, or SAME), measured against the
+            longer of ``N`` and ``K``.
+        method: Evaluation algorithm. ``AUTO`` picks ``FFT`` once both
+            inputs are at least
+            :data:`~tinyops.ops.signal.convolution_method.FFT_CONVOLUTION_CROSSOVER_LENGTH`
+            long.
 
     Returns:
-        Convolution result tensor.
+        Convolution result of shape ``(L,)``, or ``(batch, channels, L)``
+        for a batched *signal*.
 
     Raises:
-        ValueError: If inputs are not 1D or are empty.
+        ValueError: If the input shapes are not supported or are empty.
     """
-    if signal.ndim != 1 or kernel.ndim != 1:
-        raise ValueError("Input tensors must be one-dimensional.")
-
-    if signal.shape[0] == 0:
+    output_shape = signal.shape[:-1]
+    signal, kernel = _batched_signal_and_kernel(signal, kernel)
+    signal_length = signal.shape[-1]
+    kernel_length = kernel.shape[-1]
+    if signal_length == 0:
         raise ValueError("signal cannot be empty")
-    if kernel.shape[0] == 0:
+    if kernel_length == 0:
         raise ValueError("kernel cannot be empty")
 
-    signal, kernel, _signal_length, kernel_length = _order_longer_signal_first(signal, kernel)
-    pad_left, pad_right = _convolution_1d_padding(mode, kernel_length)
-
-    x = signal.reshape(1, 1, 1, -1)
-    w = kernel.flip(0).reshape(1, 1, 1, -1)
-
-    out = x.conv2d(w, padding=(pad_left, pad_right, 0, 0))
-    return out.flatten()
+    start, output_length = _convolution_output_window(signal_length, kernel_length, mode)
+
+    if resolve_convolution_method(method, signal_length, kernel_length) == ConvolutionMethod.FFT:
+        dtype = least_upper_float(least_upper_dtype(signal.dtype, kernel.dtype))
+        signal, kernel = signal.cast(dtype), kernel.cast(dtype)
+        if signal_length >= 2 * kernel_length:
+            full = _overlap_save_linear_convolution(signal, kernel)
+        else:
+            full = fft_linear_convolution(signal, kernel)
+        convolved = full[..., start : start + output_length]
+    else:
+        # Padding that makes the conv produce exactly FULL[start : start + output_length].
+        padding = (kernel_length - 1 - start, start + output_length - signal_length)
+        convolved = direct_convolution(signal, kernel, padding)
+    return convolved.reshape(*output_shape, output_length)
@@ -0,0 +1,63 @@
+"""Pure-tinygrad tests for batched multichannel convolution_1d (no reference libraries)."""
+
+import pytest
+from tinygrad import Tensor
+
+from tinyops._core import assert_close
+from tinyops.ops.signal.convolution_1d import ConvolutionMode, convolution_1d
+from tinyops.ops.signal.convolution_method import ConvolutionMethod
+
+
+def _per_channel_loop(signal: Tensor, kernels: list[Tensor], mode: ConvolutionMode) -> Tensor:
+    batch_size, channel_count, _ = signal.shape
+    rows = [
+        Tensor.stack(
+            *[convolution_1d(signal[item, channel], kernels[channel], mode=mode) for channel in range(channel_count)]
+        )
+        for item in range(batch_size)
+    ]
+    return Tensor.stack(*rows)
+
+
+@pytest.mark.parametrize("method", [ConvolutionMethod.DIRECT, ConvolutionMethod.FFT])
+@pytest.mark.parametrize("mode", list(ConvolutionMode))
+def test_shared_kernel_matches_channel_loop(mode, method):
+    signal = Tensor.randn(2, 3, 16)
+    kernel = Tensor.randn(5)
+    batched = convolution_1d(signal, kernel, mode=mode, method=method)
+    assert_close(batched, _per_channel_loop(signal, [kernel] * 3, mode), atol=1e-4)
+
+
+@pytest.mark.parametrize("method", [ConvolutionMethod.DIRECT, ConvolutionMethod.FFT])
+@pytest.mark.parametrize("mode", list(ConvolutionMode))
+def test_per_channel_kernels_match_channel_loop(mode, method):
+    signal = Tensor.randn(2, 3, 16)
+    kernels = Tensor.randn(3, 4)
+    batched = convolution_1d(signal, kernels, mode=mode, method=method)
+    assert_close(batched, _per_channel_loop(signal, [kernels[channel] for channel in range(3)], mode), atol=1e-4)
+
+
+@pytest.mark.parametrize(("signal_length", "kernel_length"), [(200, 40), (100, 40), (150, 70), (64, 64)])
+def test_fft_blocks_match_direct(signal_length, kernel_length):
+    # Signals twice the kernel go through overlap-save blocks (100 and 40 need blocks grown to hold the carry), the
+    # rest through overlap-add.
+    signal = Tensor.randn(2, 3, signal_length)
+    kernels = Tensor.randn(3, kernel_length)
+    expected = convolution_1d(signal, kernels, method=ConvolutionMethod.DIRECT)
+    assert_close(convolution_1d(signal, kernels, method=ConvolutionMethod.FFT), expected, atol=1e-3)
+
+
+def test_kernel_longer_than_signal_keeps_commutative_lengths():
+    signal = Tensor.randn(1, 2, 3)
+    kernel = Tensor.randn(7)
+    assert convolution_1d(signal, kernel, mode=ConvolutionMode.VALID).shape == (1, 2, 5)
+    assert convolution_1d(signal, kernel, mode=ConvolutionMode.SAME).shape == (1, 2, 7)
+
+
+def test_invalid_shapes_raise():
+    with pytest.raises(ValueError):
+        convolution_1d(Tensor.randn(3, 10), Tensor.randn(3))
+    with pytest.raises(ValueError):
+        convolution_1d(Tensor.randn(2, 3, 10), Tensor.randn(4, 3))
+    with pytest.raises(ValueError):
+        convolution_1d(Tensor.randn(10), Tensor.randn(2, 3))
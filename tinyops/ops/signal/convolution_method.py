@@ -0,0 +1,28 @@
+from enum import Enum
+
+# Shorter-operand length from which AUTO switches to FFT convolution. Below
+# it the direct sliding product does less work than the FFT stages cost
+# (measured on jitted CPU kernels for a 65536-sample signal).
+FFT_CONVOLUTION_CROSSOVER_LENGTH = 64
+
+
+class ConvolutionMethod(Enum):
+    """Algorithm used to evaluate a linear convolution or correlation."""
+
+    DIRECT = "direct"
+    FFT = "fft"
+    AUTO = "auto"
+
+
+def resolve_convolution_method(method: ConvolutionMethod, signal_length: int, kernel_length: int) -> ConvolutionMethod:
+    """Replace AUTO with DIRECT or FFT for the given operand lengths.
+
+    Direct evaluation costs ``O(N * K)`` and FFT overlap-add roughly
+    ``O((N + K) log K)``, so the FFT wins once the shorter operand reaches
+    :data:`FFT_CONVOLUTION_CROSSOVER_LENGTH`.
+    """
+    if method != ConvolutionMethod.AUTO:
+        return method
+    if min(signal_length, kernel_length) >= FFT_CONVOLUTION_CROSSOVER_LENGTH:
+        return ConvolutionMethod.FFT
+    return ConvolutionMethod.DIRECT
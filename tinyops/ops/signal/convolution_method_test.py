@@ -0,0 +1,47 @@
+"""Pure-tinygrad tests for direct/FFT convolution method selection (no reference libraries)."""
+
+import pytest
+from tinygrad import Tensor
+
+from tinyops._core import assert_close
+from tinyops.ops.signal.convolution_1d import ConvolutionMode, convolution_1d
+from tinyops.ops.signal.convolution_method import (
+    FFT_CONVOLUTION_CROSSOVER_LENGTH,
+    ConvolutionMethod,
+    resolve_convolution_method,
+)
+from tinyops.ops.statistics.cross_correlation import CorrelationMode, cross_correlation
+
+
+def test_auto_switches_at_crossover():
+    short = FFT_CONVOLUTION_CROSSOVER_LENGTH - 1
+    long = FFT_CONVOLUTION_CROSSOVER_LENGTH
+    assert resolve_convolution_method(ConvolutionMethod.AUTO, 10_000, short) == ConvolutionMethod.DIRECT
+    assert resolve_convolution_method(ConvolutionMethod.AUTO, 10_000, long) == ConvolutionMethod.FFT
+    assert resolve_convolution_method(ConvolutionMethod.AUTO, long, 10_000) == ConvolutionMethod.FFT
+
+
+def test_explicit_method_is_kept():
+    assert resolve_convolution_method(ConvolutionMethod.DIRECT, 10_000, 10_000) == ConvolutionMethod.DIRECT
+    assert resolve_convolution_method(ConvolutionMethod.FFT, 3, 2) == ConvolutionMethod.FFT
+
+
+@pytest.mark.parametrize("mode", list(ConvolutionMode))
+@pytest.mark.parametrize("signal_length,kernel_length", [(37, 5), (5, 37), (64, 64)])
+def test_convolution_fft_matches_direct(mode, signal_length, kernel_length):
+    signal = Tensor.randn(signal_length)
+    kernel = Tensor.randn(kernel_length)
+    direct = convolution_1d(signal, kernel, mode=mode, method=ConvolutionMethod.DIRECT)
+    fast = convolution_1d(signal, kernel, mode=mode, method=ConvolutionMethod.FFT)
+    assert fast.shape == direct.shape
+    assert_close(fast, direct, atol=1e-4, rtol=1e-4)
+
+
+@pytest.mark.parametrize("mode", list(CorrelationMode))
+def test_correlation_fft_matches_direct(mode):
+    signal = Tensor.randn(41)
+    kernel = Tensor.randn(7)
+    direct = cross_correlation(signal, kernel, mode=mode, method=ConvolutionMethod.DIRECT)
+    fast = cross_correlation(signal, kernel, mode=mode, method=ConvolutionMethod.FFT)
+    assert fast.shape == direct.shape
+    assert_close(fast, direct, atol=1e-4, rtol=1e-4)
@@ -0,0 +1,51 @@
+import math
+from enum import Enum
+
+from tinygrad import Tensor, dtypes
+
+
+class CosineTransformNormalization(Enum):
+    """Scaling of the DCT-II basis."""
+
+    NONE = "none"
+    ORTHONORMAL = "orthonormal"
+
+
+def discrete_cosine_transform_matrix(
+    coefficient_count: int,
+    input_length: int,
+    normalization: CosineTransformNormalization = CosineTransformNormalization.ORTHONORMAL,
+) -> Tensor:
+    """Build the type-II discrete cosine transform as a matrix.
+
+    Row ``k`` is ``cos(pi / N * (n + 1/2) * k)`` over ``n < N``, so
+    ``matrix @ values`` transforms the second-to-last axis of ``values`` and
+    keeps the first *coefficient_count* coefficients. ``ORTHONORMAL`` scales
+    rows to match ``scipy.fft.dct(norm="ortho")``; ``NONE`` matches the
+    unnormalized ``2 * sum`` convention. Same values as
+    ``torchaudio.functional.create_dct`` (transposed).
+
+    Args:
+        coefficient_count: Number of output coefficients ``K``.
+        input_length: Length ``N`` of the transformed axis.
+        normalization: Row scaling.
+
+    Returns:
+        Tensor of shape ``(coefficient_count, input_length)``.
+
+    Raises:
+        ValueError: If either size is not positive.
+    """
+    if coefficient_count < 1 or input_length < 1:
+        raise ValueError(
+            f"coefficient_count and input_length must be positive, got {coefficient_count}, {input_length}"
+        )
+
+    sample_indices = Tensor.arange(input_length, dtype=dtypes.float32).reshape(1, input_length) + 0.5
+    coefficient_indices = Tensor.arange(coefficient_count, dtype=dtypes.float32).reshape(coefficient_count, 1)
+    basis = (sample_indices * coefficient_indices * (math.pi / input_length)).cos()
+
+    if normalization == CosineTransformNormalization.NONE:
+        return basis * 2.0
+    row_scale = (coefficient_indices == 0).where(math.sqrt(1.0 / input_length), math.sqrt(2.0 / input_length))
+    return basis * row_scale
@@ -0,0 +1,22 @@
+"""Pure-tinygrad tests for the DCT-II matrix (no reference libraries)."""
+
+from tinyops.ops.signal.discrete_cosine_transform_matrix import (
+    CosineTransformNormalization,
+    discrete_cosine_transform_matrix,
+)
+
+
+def test_orthonormal_matrix_is_orthogonal():
+    matrix = discrete_cosine_transform_matrix(6, 6)
+    gram = (matrix @ matrix.T).numpy()
+    for row in range(6):
+        for column in range(6):
+            expected = 1.0 if row == column else 0.0
+            assert abs(float(gram[row, column]) - expected) < 1e-5
+
+
+def test_unnormalized_first_row_is_two():
+    matrix = discrete_cosine_transform_matrix(3, 4, CosineTransformNormalization.NONE).numpy()
+    assert matrix.shape == (3, 4)
+    for value in matrix[0]:
+        assert abs(float(value) - 2.0) < 1e-6
@@ -1,63 +1,38 @@
-import math
+from tinygrad import Tensor
 
-from tinygrad import Tensor, dtypes
-
-
-def _cooley_tukey_fft(complex_signal: Tensor) -> Tensor:
-    """Recursive Cooley-Tukey FFT for power-of-two lengths."""
-    sample_count = complex_signal.shape[0]
-    if sample_count <= 1:
-        return complex_signal
-
-    even = _cooley_tukey_fft(complex_signal[0::2])
-    odd = _cooley_tukey_fft(complex_signal[1::2])
-
-    frequency_indices = Tensor.arange(sample_count // 2, dtype=dtypes.float32)
-    angle = -2 * math.pi * frequency_indices / sample_count
-
-    cosine = angle.cos()
-    sine = angle.sin()
-
-    real_part = odd[:, 0] * cosine - odd[:, 1] * sine
-    imaginary_part = odd[:, 0] * sine + odd[:, 1] * cosine
-    twiddle_product = Tensor.stack([real_part, imaginary_part], dim=1)
-
-    return Tensor.cat(even + twiddle_product, even - twiddle_product, dim=0)
+from tinyops.ops.signal.fourier_transform_plan import FourierDirection, fourier_transform_plan
 
 
 def discrete_fourier_transform(complex_signal: Tensor) -> Tensor:
     """Compute the one-dimensional discrete Fourier transform.
 
-    Automatically selects the Cooley-Tukey algorithm for power-of-two
-    input sizes, or falls back to the DFT matrix for arbitrary sizes.
+    Lengths whose prime factors are all in ``{2, 3, 5, 7}`` use an iterative
+    mixed-radix FFT; any other length uses Bluestein's chirp-z algorithm on
+    top of the power-of-two FFT, so cost is O(N log N) for every length.
+    Twiddle tables come from the cached
+    :func:`~tinyops.ops.signal.fourier_transform_plan.fourier_transform_plan`,
+    so repeated calls at one length only add the data-dependent work.
+    Leading axes are batch axes, so many short frames are transformed in a
+    single graph.
 
     Args:
-        complex_signal: Input tensor of shape (N, 2) where the last
-            dimension contains (real, imaginary) parts.
+        complex_signal: Input tensor of shape ``(..., N, 2)`` where the last
+            dimension contains ``(real, imaginary)`` parts.
 
     Returns:
-        DFT result tensor of shape (N, 2).
+        DFT result tensor of shape ``(..., N, 2)``.
+
+    Raises:
+        ValueError: If ``complex_signal`` is not shaped ``(..., N, 2)``.
     """
-    sample_count = complex_signal.shape[0]
+    if complex_signal.ndim < 2 or complex_signal.shape[-1] != 2:
+        raise ValueError(f"complex_signal must have shape (..., N, 2), got {complex_signal.shape}")
+
+    sample_count = complex_signal.shape[-2]
     if sample_count <= 1:
         return complex_signal
 
-    is_power_of_two = (sample_count & (sample_count - 1)) == 0
-    if is_power_of_two:
-        return _cooley_tukey_fft(complex_signal)
-
-    # Fallback: dense DFT matrix multiplication (O(N^2))
-    row_indices = Tensor.arange(sample_count, dtype=dtypes.float32).unsqueeze(1)
-    column_indices = Tensor.arange(sample_count, dtype=dtypes.float32).unsqueeze(0)
-    angle = -2 * math.pi * row_indices * column_indices / sample_count
-
-    weight_real = angle.cos()
-    weight_imaginary = angle.sin()
-
-    input_real = complex_signal[:, 0]
-    input_imaginary = complex_signal[:, 1]
-
-    result_real = weight_real @ input_real - weight_imaginary @ input_imaginary
-    result_imaginary = weight_real @ input_imaginary + weight_imaginary @ input_real
-
-    return Tensor.stack([result_real, result_imaginary], dim=1)
+    plan = fourier_transform_plan(sample_count, FourierDirection.FORWARD, complex_signal.dtype, complex_signal.device)
+    complex_signal = complex_signal.cast(plan.dtype)
+    real, imaginary = plan.execute(complex_signal[..., 0], complex_signal[..., 1])
+    return Tensor.stack([real, imaginary], dim=-1)
@@ -0,0 +1,63 @@
+"""Pure-tinygrad tests for the 1D DFT engine (no reference libraries)."""
+
+from tinygrad import Tensor
+
+from tinyops.ops.signal._fast_fourier_transform import (
+    bit_reversal_permutation,
+    digit_reversal_permutation,
+    small_radix_factorization,
+)
+from tinyops.ops.signal.discrete_fourier_transform import discrete_fourier_transform
+from tinyops.ops.signal.inverse_discrete_fourier_transform import inverse_discrete_fourier_transform
+
+
+def test_bit_reversal_permutation_order():
+    reordered = bit_reversal_permutation(Tensor.arange(8)).tolist()
+    assert reordered == [0, 4, 2, 6, 1, 5, 3, 7]
+
+
+def test_bit_reversal_permutation_keeps_batch_rows():
+    rows = Tensor.arange(8).reshape(2, 4)
+    assert bit_reversal_permutation(rows).tolist() == [[0, 2, 1, 3], [4, 6, 5, 7]]
+
+
+def test_digit_reversal_permutation_mixed_radix():
+    assert digit_reversal_permutation(Tensor.arange(6), (2, 3)).tolist() == [0, 3, 1, 4, 2, 5]
+
+
+def test_small_radix_factorization():
+    assert small_radix_factorization(44100) == (2, 2, 3, 3, 5, 5, 7, 7)
+    assert small_radix_factorization(22) is None
+
+
+def test_impulse_has_flat_spectrum():
+    impulse = Tensor([[1.0, 0.0]] + [[0.0, 0.0]] * 7)
+    spectrum = discrete_fourier_transform(impulse).numpy()
+    for real, imaginary in spectrum:
+        assert abs(float(real) - 1.0) < 1e-5
+        assert abs(float(imaginary)) < 1e-5
+
+
+def test_batched_matches_per_row():
+    rows = [[[float(row + index), float(index % 3)] for index in range(8)] for row in range(3)]
+    batched = discrete_fourier_transform(Tensor(rows)).numpy()
+    assert batched.shape == (3, 8, 2)
+    for row_index, row in enumerate(rows):
+        single = discrete_fourier_transform(Tensor(row)).numpy()
+        for left, right in zip(batched[row_index].flatten(), single.flatten()):
+            assert abs(float(left) - float(right)) < 1e-4
+
+
+def test_batched_roundtrip_non_power_of_two():
+    values = Tensor([[[float(index), -float(index)] for index in range(6)] for _ in range(2)])
+    recovered = inverse_discrete_fourier_transform(discrete_fourier_transform(values)).numpy()
+    for left, right in zip(recovered.flatten(), values.numpy().flatten()):
+        assert abs(float(left) - float(right)) < 1e-3
+
+
+def test_rejects_unpacked_input():
+    try:
+        discrete_fourier_transform(Tensor([1.0, 2.0, 3.0]))
+        raise AssertionError("expected ValueError")
+    except ValueError as error:
+        assert "(..., N, 2)" in str(error)
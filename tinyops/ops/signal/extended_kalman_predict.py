@@ -0,0 +1,35 @@
+from tinygrad import Tensor
+
+
+def extended_kalman_predict(
+    predicted_state: Tensor,
+    covariance: Tensor,
+    transition_jacobian: Tensor,
+    process_noise: Tensor,
+) -> tuple[Tensor, Tensor]:
+    """Propagate a batch of extended Kalman filters through a nonlinear motion model.
+
+    The caller evaluates the motion model ``x' = f(x)`` and its Jacobian
+    ``F = df/dx`` at the current state, as tensors for the whole batch;
+    this op linearizes the covariance as ``P = F P F^T + Q`` in the same
+    lazy graph.
+
+    Args:
+        predicted_state: Motion model output ``f(x)`` of shape ``(..., n)``.
+        covariance: State covariances of shape ``(..., n, n)``.
+        transition_jacobian: Jacobian ``F`` of shape ``(..., n, n)``, one per
+            filter or shared.
+        process_noise: Process noise covariance ``Q`` of shape ``(..., n, n)``.
+
+    Returns:
+        ``(state, covariance)``, the prior for the next update.
+
+    Raises:
+        ValueError: If the Jacobian is not ``(..., n, n)`` for an ``n``-dimensional state.
+    """
+    size = predicted_state.shape[-1]
+    if transition_jacobian.shape[-2:] != (size, size):
+        raise ValueError(f"transition_jacobian must have shape (..., {size}, {size}), got {transition_jacobian.shape}")
+
+    predicted_covariance = transition_jacobian @ covariance @ transition_jacobian.transpose(-1, -2) + process_noise
+    return predicted_state, predicted_covariance
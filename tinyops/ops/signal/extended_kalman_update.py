@@ -0,0 +1,42 @@
+from tinygrad import Tensor
+
+from tinyops.ops.signal._kalman_correction import kalman_correction
+
+
+def extended_kalman_update(
+    state: Tensor,
+    covariance: Tensor,
+    residual: Tensor,
+    measurement_jacobian: Tensor,
+    measurement_noise: Tensor,
+) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+    """Correct a batch of extended Kalman filters with their measurement residuals.
+
+    The caller evaluates the measurement model ``h(x)`` and its Jacobian
+    ``H = dh/dx`` at the prior state and passes the residual ``z - h(x)``
+    (wrapping angles or other manifold residuals as needed). Innovation
+    covariance, gain and Joseph-form covariance update then run for every
+    filter as one lazy graph, with a batched Cholesky solve instead of an
+    explicit inverse.
+
+    Args:
+        state: Prior state means of shape ``(..., n)``.
+        covariance: Prior covariances of shape ``(..., n, n)``.
+        residual: Measurement residuals ``z - h(x)`` of shape ``(..., m)``.
+        measurement_jacobian: Jacobian ``H`` of shape ``(..., m, n)``.
+        measurement_noise: Measurement noise covariance ``R`` of shape ``(..., m, m)``.
+
+    Returns:
+        ``(state, covariance, gain, innovation_covariance)``: the posterior,
+        the ``(..., n, m)`` Kalman gain ``K`` and the ``(..., m, m)``
+        innovation covariance ``S``.
+
+    Raises:
+        ValueError: If the Jacobian does not map the state size to the residual size.
+    """
+    size, measurement_size = state.shape[-1], residual.shape[-1]
+    if measurement_jacobian.shape[-2:] != (measurement_size, size):
+        raise ValueError(
+            f"measurement_jacobian must have shape (..., {measurement_size}, {size}), got {measurement_jacobian.shape}"
+        )
+    return kalman_correction(state, covariance, residual, measurement_jacobian, measurement_noise)
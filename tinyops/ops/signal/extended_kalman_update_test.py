@@ -0,0 +1,56 @@
+"""Pure-tinygrad tests for the batched extended Kalman filter step (no reference libraries)."""
+
+import pytest
+from tinygrad import Tensor
+
+from tinyops._core import assert_close
+from tinyops.ops.signal.extended_kalman_predict import extended_kalman_predict
+from tinyops.ops.signal.extended_kalman_update import extended_kalman_update
+from tinyops.ops.signal.kalman_predict import kalman_predict
+from tinyops.ops.signal.kalman_update import kalman_update
+
+
+def test_linear_models_reduce_to_the_linear_filter():
+    transition = Tensor([[1.0, 0.2], [0.0, 1.0]])
+    measurement_matrix = Tensor([[1.0, 0.5]])
+    process_noise, measurement_noise = Tensor.eye(2) * 0.05, Tensor([[0.3]])
+    state = Tensor([[1.0, -0.5], [0.0, 2.0], [3.0, 0.1]])
+    covariance = Tensor.eye(2).expand(3, 2, 2) * 2.0
+    measurement = Tensor([[1.2], [0.7], [2.5]])
+
+    linear_state, linear_covariance, *_ = kalman_update(
+        *kalman_predict(state, covariance, transition, process_noise),
+        measurement,
+        measurement_matrix,
+        measurement_noise,
+    )
+    prior_state, prior_covariance = extended_kalman_predict(
+        (transition @ state.unsqueeze(-1)).squeeze(-1), covariance, transition, process_noise
+    )
+    residual = measurement - (measurement_matrix @ prior_state.unsqueeze(-1)).squeeze(-1)
+    extended_state, extended_covariance, *_ = extended_kalman_update(
+        prior_state, prior_covariance, residual, measurement_matrix, measurement_noise
+    )
+    assert_close(extended_state, linear_state, atol=1e-6, rtol=1e-6)
+    assert_close(extended_covariance, linear_covariance, atol=1e-6, rtol=1e-6)
+
+
+def test_per_filter_jacobians():
+    state = Tensor([[3.0, 4.0], [6.0, 8.0]])
+    covariance = Tensor.eye(2).expand(2, 2, 2)
+    # Range measurement: each filter has its own Jacobian x / |x|.
+    jacobian = (state / (state * state).sum(axis=-1, keepdim=True).sqrt()).unsqueeze(-2)
+    residual = Tensor([[1.0], [-2.0]])
+    updated_state, updated_covariance, *_ = extended_kalman_update(
+        state, covariance, residual, jacobian, Tensor([[1.0]])
+    )
+    # With P = I and R = 1 the gain is H^T / 2, so each state moves half the residual along its line of sight.
+    assert_close(updated_state, state + jacobian.squeeze(-2) * residual / 2, atol=1e-6, rtol=1e-6)
+    assert updated_covariance.shape == (2, 2, 2)
+
+
+def test_invalid_jacobian_shape():
+    with pytest.raises(ValueError):
+        extended_kalman_update(Tensor.zeros(3), Tensor.eye(3), Tensor.zeros(1), Tensor.zeros(1, 2), Tensor.eye(1))
+    with pytest.raises(ValueError):
+        extended_kalman_predict(Tensor.zeros(3), Tensor.eye(3), Tensor.eye(2), Tensor.eye(3))
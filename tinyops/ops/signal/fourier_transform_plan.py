@@ -0,0 +1,209 @@
+"""Precomputed FFT plans and their bounded module-level cache."""
+
+import math
+from enum import Enum
+
+from tinygrad import Device, Tensor, dtypes
+from tinygrad.dtype import DType
+
+from tinyops.ops._lru_cache import CacheInfo, LeastRecentlyUsedCache
+from tinyops.ops.signal._fast_fourier_transform import (
+    chirp_phase,
+    complex_multiply,
+    mixed_radix_transform,
+    phase_dtype,
+    small_radix_factorization,
+    stage_tables,
+    unit_phasor,
+)
+
+# Each plan keeps its realized tables alive; 128 covers the few (length, direction, dtype, device)
+# combinations a pipeline uses, while a sweep over many lengths cannot pin every table it ever built.
+DEFAULT_PLAN_CACHE_SIZE = 128
+
+
+class FourierDirection(Enum):
+    """Sign of the exponent in the transform kernel ``exp(sign * 2 pi i n k / N)``."""
+
+    FORWARD = -1
+    INVERSE = 1
+
+
+class FourierTransformPlan:
+    """Realized tables for one DFT length, direction, dtype and device.
+
+    Building a plan computes every per-stage twiddle table and small DFT
+    matrix, or for lengths with a prime factor above 7 the Bluestein chirp
+    and the spectrum of its convolution kernel, and realizes them once.
+    :meth:`execute` then only adds the data-dependent work to the graph.
+    Digit reversal is a reshape/permute view, so it needs no stored table.
+    Plans hold no state besides these constant tables; reuse them through
+    :func:`fourier_transform_plan` rather than constructing them directly.
+
+    Args:
+        length: Transform length ``N``.
+        direction: Forward transform, or inverse including the ``1 / N`` scale.
+        dtype: Float dtype of the tables and of the planes passed to :meth:`execute`.
+        device: Device holding the tables.
+
+    Raises:
+        ValueError: If ``length`` is negative or ``dtype`` is not a float dtype.
+    """
+
+    def __init__(
+        self,
+        length: int,
+        direction: FourierDirection = FourierDirection.FORWARD,
+        dtype: DType = dtypes.float32,
+        device: str | None = None,
+    ):
+        if length < 0:
+            raise ValueError(f"length must be non-negative, got {length}")
+        if not dtypes.is_float(dtype):
+            raise ValueError(f"dtype must be a float dtype, got {dtype}")
+
+        self.length = length
+        self.direction = direction
+        self.dtype = dtype
+        self.device = Device.canonicalize(device)
+        self.radices = small_radix_factorization(length) if length > 1 else ()
+        self._stage_tables: tuple[tuple[Tensor, ...], ...] = ()
+        self._bluestein_tables: tuple[Tensor, ...] = ()
+        self._packing_twiddle: tuple[Tensor, Tensor] | None = None
+
+        if self.radices is not None:
+            self._stage_tables = stage_tables(self.radices, direction.value, dtype, self.device)
+            stage_table_tensors = [table for stage in self._stage_tables for table in stage]
+            if stage_table_tensors:
+                Tensor.realize(*stage_table_tensors)
+        else:
+            self._bluestein_tables = self._build_bluestein_tables()
+            Tensor.realize(*self._bluestein_tables)
+
+    def _build_bluestein_tables(self) -> tuple[Tensor, ...]:
+        """Chirp ``w[n] = exp(sign * pi i n^2 / N)`` and the FFT of the kernel ``conj(w[m])``.
+
+        ``nk = (n^2 + k^2 - (k - n)^2) / 2`` turns the DFT into
+        ``X[k] = w[k] * sum_n (x[n] w[n]) conj(w[k - n])``, a linear
+        convolution evaluated with power-of-two FFTs of length ``M >= 2N - 1``.
+        """
+        sign = self.direction.value
+        convolution_length = 1 << (2 * self.length - 2).bit_length()
+
+        indices = Tensor.arange(self.length, dtype=dtypes.int64, device=self.device)
+        chirp_real, chirp_imaginary = unit_phasor(chirp_phase(indices, self.length, self.dtype), self.dtype)
+        chirp_imaginary = chirp_imaginary * sign
+
+        # Kernel b[m] = conj(w[min(m, M - m)]) where that distance is < N, else 0 (circular wrap of b[-n]).
+        positions = Tensor.arange(convolution_length, dtype=dtypes.int64, device=self.device)
+        distance = positions.minimum(convolution_length - positions)
+        in_support = distance < self.length
+        kernel_real, kernel_imaginary = unit_phasor(chirp_phase(distance, self.length, self.dtype), self.dtype)
+        kernel_real = in_support.where(kernel_real, 0.0)
+        kernel_imaginary = in_support.where(kernel_imaginary * -sign, 0.0)
+
+        forward_plan = fourier_transform_plan(convolution_length, FourierDirection.FORWARD, self.dtype, self.device)
+        kernel_spectrum_real, kernel_spectrum_imaginary = forward_plan.execute(kernel_real, kernel_imaginary)
+        return chirp_real, chirp_imaginary, kernel_spectrum_real, kernel_spectrum_imaginary
+
+    def _bluestein_transform(self, real: Tensor, imaginary: Tensor) -> tuple[Tensor, Tensor]:
+        """Unscaled DFT of any length as a chirp-modulated power-of-two convolution."""
+        chirp_real, chirp_imaginary, kernel_spectrum_real, kernel_spectrum_imaginary = self._bluestein_tables
+        convolution_length = kernel_spectrum_real.shape[-1]
+
+        modulated_real, modulated_imaginary = complex_multiply(real, imaginary, chirp_real, chirp_imaginary)
+        padding = (*((None,) * (real.ndim - 1)), (0, convolution_length - self.length))
+        forward_plan = fourier_transform_plan(convolution_length, FourierDirection.FORWARD, self.dtype, self.device)
+        signal_spectrum = forward_plan.execute(modulated_real.pad(padding), modulated_imaginary.pad(padding))
+
+        product = complex_multiply(*signal_spectrum, kernel_spectrum_real, kernel_spectrum_imaginary)
+        inverse_plan = fourier_transform_plan(convolution_length, FourierDirection.INVERSE, self.dtype, self.device)
+        convolved_real, convolved_imaginary = inverse_plan.execute(*product)
+        return complex_multiply(
+            convolved_real[..., : self.length], convolved_imaginary[..., : self.length], chirp_real, chirp_imaginary
+        )
+
+    @property
+    def packing_twiddle(self) -> tuple[Tensor, Tensor]:
+        """``exp(sign * pi i k / N)`` for ``k = 0 .. N`` as realized ``(cos, sin)``.
+
+        These merge the even/odd sub-spectra of a real length-``2N`` signal
+        packed into this length-``N`` transform. Built on first access.
+        """
+        if self._packing_twiddle is None:
+            angle = Tensor.arange(self.length + 1, dtype=phase_dtype(self.dtype), device=self.device)
+            angle = angle * (self.direction.value * math.pi / self.length)
+            self._packing_twiddle = unit_phasor(angle, self.dtype)
+            Tensor.realize(*self._packing_twiddle)
+        return self._packing_twiddle
+
+    def execute(self, real: Tensor, imaginary: Tensor) -> tuple[Tensor, Tensor]:
+        """Transform split planes along their last axis.
+
+        Args:
+            real: Real parts, shape ``(..., N)`` in the plan's dtype and device.
+            imaginary: Imaginary parts, same shape as *real*.
+
+        Returns:
+            ``(real, imaginary)`` of the same shape; inverse plans include the
+            ``1 / N`` normalization.
+        """
+        if self.length <= 1:
+            return real, imaginary
+        if self.radices is not None:
+            real, imaginary = mixed_radix_transform(real, imaginary, self.radices, self._stage_tables)
+        else:
+            real, imaginary = self._bluestein_transform(real, imaginary)
+        if self.direction == FourierDirection.INVERSE:
+            return real / self.length, imaginary / self.length
+        return real, imaginary
+
+
+_plan_cache: LeastRecentlyUsedCache[FourierTransformPlan] = LeastRecentlyUsedCache(DEFAULT_PLAN_CACHE_SIZE)
+
+
+def fourier_transform_plan(
+    length: int,
+    direction: FourierDirection = FourierDirection.FORWARD,
+    dtype: DType = dtypes.float32,
+    device: str | None = None,
+) -> FourierTransformPlan:
+    """Return the cached plan for ``(length, direction, dtype, device)``, building it on a miss.
+
+    Non-float dtypes map to ``float32``. The cache keeps the most recently
+    used plans up to :func:`set_fourier_plan_cache_size` entries.
+
+    Args:
+        length: Transform length ``N``.
+        direction: Forward or inverse transform.
+        dtype: Dtype of the data the plan will transform.
+        device: Device of the data; ``None`` means the default device.
+
+    Returns:
+        A plan whose tables are realized on *device*.
+    """
+    dtype = dtype if dtypes.is_float(dtype) else dtypes.float32
+    key = (length, direction, dtype, Device.canonicalize(device))
+    return _plan_cache.get(key, lambda: FourierTransformPlan(length, direction, dtype, device))
+
+
+def fourier_plan_cache_info() -> CacheInfo:
+    """Hit/miss counters and occupancy of the plan cache."""
+    return _plan_cache.info()
+
+
+def set_fourier_plan_cache_size(maximum_size: int) -> None:
+    """Bound the plan cache to *maximum_size* plans, evicting the least recently used.
+
+    Args:
+        maximum_size: New bound; ``0`` disables caching.
+
+    Raises:
+        ValueError: If ``maximum_size`` is negative.
+    """
+    _plan_cache.resize(maximum_size)
+
+
+def clear_fourier_plan_cache() -> None:
+    """Drop every cached plan and reset the hit/miss counters."""
+    _plan_cache.clear()
@@ -0,0 +1,69 @@
+"""Pure-tinygrad tests for FFT plans and the plan cache (no reference libraries)."""
+
+import math
+
+from tinygrad import Tensor, dtypes
+
+from tinyops.ops.signal.fourier_transform_plan import (
+    DEFAULT_PLAN_CACHE_SIZE,
+    FourierDirection,
+    FourierTransformPlan,
+    clear_fourier_plan_cache,
+    fourier_plan_cache_info,
+    fourier_transform_plan,
+    set_fourier_plan_cache_size,
+)
+
+
+def test_repeated_lookup_hits_cache():
+    clear_fourier_plan_cache()
+    first = fourier_transform_plan(8)
+    second = fourier_transform_plan(8)
+    assert first is second
+    info = fourier_plan_cache_info()
+    assert (info.hits, info.misses, info.current_size) == (1, 1, 1)
+
+
+def test_direction_is_part_of_the_key():
+    clear_fourier_plan_cache()
+    forward = fourier_transform_plan(4, FourierDirection.FORWARD)
+    inverse = fourier_transform_plan(4, FourierDirection.INVERSE)
+    assert forward is not inverse
+    assert fourier_plan_cache_info().misses == 2
+
+
+def test_size_bounds_the_cache():
+    clear_fourier_plan_cache()
+    set_fourier_plan_cache_size(1)
+    try:
+        fourier_transform_plan(2)
+        fourier_transform_plan(4)
+        assert fourier_plan_cache_info() == (0, 2, 1, 1)
+    finally:
+        set_fourier_plan_cache_size(DEFAULT_PLAN_CACHE_SIZE)
+
+
+def test_forward_then_inverse_plan_roundtrip():
+    real = Tensor([[1.0, 2.0, 3.0, 4.0, 5.0, 6.0]])
+    imaginary = Tensor([[0.5, 0.0, -0.5, 0.0, 1.0, 0.0]])
+    spectrum = FourierTransformPlan(6).execute(real, imaginary)
+    recovered_real, recovered_imaginary = FourierTransformPlan(6, FourierDirection.INVERSE).execute(*spectrum)
+    for left, right in zip(recovered_real.numpy().flatten(), real.numpy().flatten()):
+        assert abs(float(left) - float(right)) < 1e-4
+    for left, right in zip(recovered_imaginary.numpy().flatten(), imaginary.numpy().flatten()):
+        assert abs(float(left) - float(right)) < 1e-4
+
+
+def test_float64_plans_keep_float64_accuracy():
+    # Lengths 16, 12 and 11 exercise the radix-2, mixed-radix and Bluestein tables.
+    for length in (16, 12, 11):
+        impulse = Tensor([[0.0, 1.0] + [0.0] * (length - 2)], dtype=dtypes.float64)
+        plan = FourierTransformPlan(length, dtype=dtypes.float64)
+        real, imaginary = plan.execute(impulse, impulse.zeros_like())
+        for index, (value_real, value_imaginary) in enumerate(zip(real.numpy()[0], imaginary.numpy()[0])):
+            assert abs(float(value_real) - math.cos(2 * math.pi * index / length)) < 1e-12
+            assert abs(float(value_imaginary) + math.sin(2 * math.pi * index / length)) < 1e-12
+    twiddle_real, twiddle_imaginary = FourierTransformPlan(6, dtype=dtypes.float64).packing_twiddle
+    for index, (value_real, value_imaginary) in enumerate(zip(twiddle_real.numpy(), twiddle_imaginary.numpy())):
+        assert abs(float(value_real) - math.cos(math.pi * index / 6)) < 1e-12
+        assert abs(float(value_imaginary) + math.sin(math.pi * index / 6)) < 1e-12
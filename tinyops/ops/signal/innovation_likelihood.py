@@ -0,0 +1,43 @@
+import math
+
+from tinygrad import Tensor, dtypes
+
+from tinyops.ops.linear_algebra.cholesky_decomposition import cholesky_decomposition
+from tinyops.ops.linear_algebra.cholesky_solve import cholesky_solve
+from tinyops.ops.linear_algebra.diagonal import diagonal
+
+
+def innovation_likelihood(residual: Tensor, innovation_covariance: Tensor) -> tuple[Tensor, Tensor, Tensor]:
+    """Score a batch of Kalman measurement residuals against their innovation covariance.
+
+    The residual ``y`` of a consistent filter is distributed as ``N(0, S)``.
+    One batched Cholesky factorization of ``S`` gives both the squared
+    Mahalanobis distance ``y^T S^-1 y`` (by a Cholesky solve) and
+    ``log det S`` (twice the log of the factor's diagonal), so no explicit
+    inverse or determinant is formed. The likelihood is floored at the
+    smallest normal number of its dtype instead of underflowing to zero, so
+    it can still be used as a weight (for example to mix filters).
+
+    Args:
+        residual: Residuals ``z - H x`` of shape ``(..., m)``.
+        innovation_covariance: Innovation covariances ``S`` of shape ``(..., m, m)``.
+
+    Returns:
+        ``(log_likelihood, likelihood, mahalanobis_distance)``, each of shape ``(...)``.
+
+    Raises:
+        ValueError: If the covariance is not ``(..., m, m)`` for an ``m``-dimensional residual.
+    """
+    size = residual.shape[-1]
+    if innovation_covariance.shape[-2:] != (size, size):
+        raise ValueError(
+            f"innovation_covariance must have shape (..., {size}, {size}), got {innovation_covariance.shape}"
+        )
+
+    factor = cholesky_decomposition(innovation_covariance)
+    squared_distance = (residual * cholesky_solve(factor, residual)).sum(axis=-1)
+    log_determinant = 2 * diagonal(factor, axis_1=-2, axis_2=-1).log().sum(axis=-1)
+    log_likelihood = -0.5 * (size * math.log(2 * math.pi) + log_determinant + squared_distance)
+    exponent_bits = dtypes.finfo(log_likelihood.dtype)[0]
+    smallest_normal = 2.0 ** (2 - 2 ** (exponent_bits - 1))
+    return log_likelihood, log_likelihood.exp().maximum(smallest_normal), squared_distance.sqrt()
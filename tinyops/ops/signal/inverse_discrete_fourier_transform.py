@@ -1,19 +1,33 @@
 from tinygrad import Tensor
 
-from tinyops.ops.signal._fourier import complex_conjugate
-from tinyops.ops.signal.discrete_fourier_transform import discrete_fourier_transform
+from tinyops.ops.signal.fourier_transform_plan import FourierDirection, fourier_transform_plan
 
 
 def inverse_discrete_fourier_transform(complex_signal: Tensor) -> Tensor:
     """Compute the one-dimensional inverse discrete Fourier transform.
 
+    Uses the cached inverse plan for the signal length, which carries the
+    conjugate twiddles and the ``1 / N`` normalization.
+
     Args:
-        complex_signal: Input tensor of shape (N, 2) where the last
-            dimension contains (real, imaginary) parts.
+        complex_signal: Input tensor of shape ``(..., N, 2)`` where the last
+            dimension contains ``(real, imaginary)`` parts. Leading axes are
+            batch axes.
 
     Returns:
-        Inverse DFT result tensor of shape (N, 2).
+        Inverse DFT result tensor of shape ``(..., N, 2)``.
+
+    Raises:
+        ValueError: If ``complex_signal`` is not shaped ``(..., N, 2)``.
     """
-    sample_count = complex_signal.shape[0]
-    transformed = discrete_fourier_transform(complex_conjugate(complex_signal))
-    return complex_conjugate(transformed) / sample_count
+    if complex_signal.ndim < 2 or complex_signal.shape[-1] != 2:
+        raise ValueError(f"complex_signal must have shape (..., N, 2), got {complex_signal.shape}")
+
+    sample_count = complex_signal.shape[-2]
+    if sample_count <= 1:
+        return complex_signal
+
+    plan = fourier_transform_plan(sample_count, FourierDirection.INVERSE, complex_signal.dtype, complex_signal.device)
+    complex_signal = complex_signal.cast(plan.dtype)
+    real, imaginary = plan.execute(complex_signal[..., 0], complex_signal[..., 1])
+    return Tensor.stack([real, imaginary], dim=-1)
@@ -0,0 +1,68 @@
+"""Inverse short-time Fourier transform by windowed overlap-add."""
+
+from tinygrad import Tensor
+
+from tinyops.ops.signal._short_time_fourier import frame_window, overlap_add, resolve_hop_length
+from tinyops.ops.signal.inverse_real_discrete_fourier_transform import inverse_real_discrete_fourier_transform
+
+# Same threshold torch.istft uses for the nonzero overlap-add (NOLA) check.
+_MINIMUM_WINDOW_ENVELOPE = 1e-11
+
+
+def inverse_short_time_fourier_transform(
+    spectrum: Tensor,
+    frame_length: int,
+    hop_length: int | None = None,
+    window: Tensor | None = None,
+    center: bool = True,
+    length: int | None = None,
+) -> Tensor:
+    """Reconstruct a waveform from its one-sided short-time Fourier transform.
+
+    All frames go through one batched inverse real FFT, are multiplied by
+    the synthesis window, overlap-added, and divided by the overlap-added
+    squared window. Matches ``torch.istft`` for the same arguments.
+
+    Args:
+        spectrum: Tensor of shape ``(..., frame_length // 2 + 1, frames, 2)``
+            as returned by
+            :func:`~tinyops.ops.signal.short_time_fourier_transform.short_time_fourier_transform`.
+        frame_length: FFT size ``n_fft`` used for the forward transform.
+        hop_length: Samples between frame starts. Defaults to
+            ``frame_length // 4``.
+        window: The analysis window passed to the forward transform.
+        center: Whether the forward transform padded half a frame on each
+            side; that padding is trimmed.
+        length: Output length. ``None`` keeps every reconstructed sample;
+            otherwise the output is truncated or zero-padded to *length*.
+
+    Returns:
+        Real tensor of shape ``(..., time)``. Samples where the window
+        envelope vanishes are zero.
+
+    Raises:
+        ValueError: If *spectrum* is not shaped ``(..., frame_length // 2 + 1,
+            frames, 2)`` or lengths are not positive.
+    """
+    hop_length = resolve_hop_length(frame_length, hop_length)
+    bin_count = frame_length // 2 + 1
+    if spectrum.ndim < 3 or spectrum.shape[-1] != 2 or spectrum.shape[-3] != bin_count:
+        raise ValueError(f"spectrum must have shape (..., {bin_count}, frames, 2), got {spectrum.shape}")
+    frame_window_values = frame_window(window, frame_length)
+
+    frames = inverse_real_discrete_fourier_transform(spectrum.transpose(-3, -2), length=frame_length)
+    frame_count = frames.shape[-2]
+    signal = overlap_add(frames * frame_window_values, hop_length)
+    squared_window = (frame_window_values * frame_window_values).expand(frame_count, frame_length)
+    envelope = overlap_add(squared_window, hop_length)
+    signal = (envelope > _MINIMUM_WINDOW_ENVELOPE).where(signal / envelope, 0.0)
+
+    start = frame_length // 2 if center else 0
+    if length is None:
+        stop = signal.shape[-1] - start
+    else:
+        stop = start + length
+    if stop > signal.shape[-1]:
+        batch_padding = (None,) * (signal.ndim - 1)
+        signal = signal.pad((*batch_padding, (0, stop - signal.shape[-1])))
+    return signal[..., start:stop]
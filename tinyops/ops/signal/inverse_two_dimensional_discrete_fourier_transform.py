@@ -11,19 +11,20 @@ from tinyops.ops.signal.inverse_discrete_fourier_transform import (
 def inverse_two_dimensional_discrete_fourier_transform(complex_spectrum: Tensor) -> Tensor:
     """Compute the inverse two-dimensional discrete Fourier transform.
 
-    Separable implementation: one-dimensional inverse DFT along width, then
-    height. Matches ``numpy.fft.ifft2`` for complex arrays packed as
-    real/imag pairs.
+    Separable implementation: one batched one-dimensional inverse DFT over
+    all rows, then one over all columns. Matches ``numpy.fft.ifft2`` (last
+    two axes) for complex arrays packed as real/imag pairs.
 
     Args:
-        complex_spectrum: Spectrum tensor of shape ``(H, W, 2)`` where the
-            last dimension contains ``(real, imaginary)`` parts.
+        complex_spectrum: Spectrum tensor of shape ``(..., H, W, 2)`` where
+            the last dimension contains ``(real, imaginary)`` parts and
+            leading axes are batch axes.
 
     Returns:
-        Inverse DFT result tensor of shape ``(H, W, 2)``.
+        Inverse DFT result tensor of shape ``(..., H, W, 2)``.
 
     Raises:
-        ValueError: If ``complex_spectrum`` is not shaped ``(H, W, 2)``.
+        ValueError: If ``complex_spectrum`` is not shaped ``(..., H, W, 2)``.
     """
     return separable_two_dimensional_transform(
         complex_spectrum,
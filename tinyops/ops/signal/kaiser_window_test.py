@@ -1,6 +1,15 @@
 """Pure-tinygrad tests for the Kaiser window (no reference libraries)."""
 
-from tinyops.ops.signal.kaiser_window import _modified_bessel_i0, kaiser_window
+import math
+
+from tinygrad import Tensor
+
+from tinyops.ops.signal._modified_bessel import scaled_modified_bessel_i0
+from tinyops.ops.signal.kaiser_window import kaiser_window
+
+
+def _i0(argument: float) -> float:
+    return float(scaled_modified_bessel_i0(Tensor([argument])).numpy()[0]) * math.exp(abs(argument))
 
 
 def test_empty_and_single():
@@ -25,12 +34,29 @@ def test_odd_length_peak_and_symmetry():
         assert abs(float(left) - float(right)) < 1e-6
 
 
+def test_periodic_drops_last_sample_of_longer_symmetric_window():
+    periodic = kaiser_window(8, 6.0, symmetric=False).numpy()
+    symmetric = kaiser_window(9, 6.0).numpy()
+    assert periodic.shape == (8,)
+    for left, right in zip(periodic, symmetric[:-1]):
+        assert abs(float(left) - float(right)) < 1e-6
+
+
+def test_large_beta_stays_finite():
+    window = kaiser_window(16, 200.0).numpy()
+    assert all(math.isfinite(float(value)) for value in window)
+    assert float(window.max()) <= 1.0 + 1e-5
+
+
 def test_i0_at_zero_and_positive():
-    assert abs(_modified_bessel_i0(0.0) - 1.0) < 1e-12
+    assert abs(_i0(0.0) - 1.0) < 1e-6
     # I0 is even and > 1 for |x| > 0
-    assert _modified_bessel_i0(1.0) > 1.0
-    assert abs(_modified_bessel_i0(1.0) - _modified_bessel_i0(-1.0)) < 1e-12
+    assert _i0(1.0) > 1.0
+    assert abs(_i0(1.0) - _i0(-1.0)) < 1e-6
+    # Known value I0(1) = 1.2660658777...
+    assert abs(_i0(1.0) - 1.2660658777520082) < 1e-5
     # Domain split continuity around 8
-    near = _modified_bessel_i0(7.9)
-    far = _modified_bessel_i0(8.1)
+    near = _i0(7.9)
+    far = _i0(8.1)
     assert near > 1.0 and far > near
+    assert abs(_i0(8.0 - 1e-4) - _i0(8.0 + 1e-4)) / _i0(8.0) < 1e-3
@@ -0,0 +1,50 @@
+from tinygrad import Tensor
+
+
+def kalman_predict(
+    state: Tensor,
+    covariance: Tensor,
+    transition: Tensor,
+    process_noise: Tensor,
+    control_matrix: Tensor | None = None,
+    control_input: Tensor | None = None,
+    fading_memory: float = 1.0,
+) -> tuple[Tensor, Tensor]:
+    """Propagate a batch of linear Kalman filters one step forward.
+
+    Computes ``x = F x + B u`` and ``P = alpha^2 F P F^T + Q`` for every
+    filter in the batch as one lazy graph; the caller owns the state and
+    decides when to realize (typically once per frame, after the update).
+
+    Args:
+        state: State means of shape ``(..., n)``.
+        covariance: State covariances of shape ``(..., n, n)``.
+        transition: State transition ``F`` of shape ``(..., n, n)``, usually
+            ``(n, n)`` and shared by every filter.
+        process_noise: Process noise covariance ``Q`` of shape ``(..., n, n)``.
+        control_matrix: Control input model ``B`` of shape ``(..., n, u)``.
+        control_input: Control vector ``u`` of shape ``(..., u)``; applied only
+            together with *control_matrix*.
+        fading_memory: Fading memory factor ``alpha``. The propagated
+            covariance is scaled by ``alpha ** 2`` before ``Q`` is added, so
+            values above 1 weight recent measurements more.
+
+    Returns:
+        ``(state, covariance)``, the prior for the next update.
+
+    Raises:
+        ValueError: If the state and covariance shapes disagree, or only one
+            of *control_matrix* and *control_input* is given.
+    """
+    size = state.shape[-1]
+    if covariance.shape[-2:] != (size, size):
+        raise ValueError(f"covariance must have shape (..., {size}, {size}), got {covariance.shape}")
+    if (control_matrix is None) != (control_input is None):
+        raise ValueError("control_matrix and control_input must be given together")
+
+    predicted_state = (transition @ state.unsqueeze(-1)).squeeze(-1)
+    if control_matrix is not None:
+        predicted_state = predicted_state + (control_matrix @ control_input.unsqueeze(-1)).squeeze(-1)
+    propagated_covariance = transition @ covariance @ transition.transpose(-1, -2)
+    predicted_covariance = fading_memory**2 * propagated_covariance + process_noise
+    return predicted_state, predicted_covariance
@@ -0,0 +1,46 @@
+from tinygrad import Tensor
+
+from tinyops.ops.signal._kalman_correction import kalman_correction
+
+
+def kalman_update(
+    state: Tensor,
+    covariance: Tensor,
+    measurement: Tensor,
+    measurement_matrix: Tensor,
+    measurement_noise: Tensor,
+) -> tuple[Tensor, Tensor, Tensor, Tensor, Tensor]:
+    """Correct a batch of linear Kalman filters with one measurement each.
+
+    The gain ``K = P H^T S^-1`` comes from a batched Cholesky solve against
+    the innovation covariance ``S = H P H^T + R`` rather than an explicit
+    inverse, and the covariance uses the Joseph form
+    ``(I - K H) P (I - K H)^T + K R K^T``, which stays symmetric positive
+    semi-definite under rounding. All filters are updated in one lazy graph.
+
+    Args:
+        state: Prior state means of shape ``(..., n)``.
+        covariance: Prior covariances of shape ``(..., n, n)``.
+        measurement: Measurements ``z`` of shape ``(..., m)``.
+        measurement_matrix: Measurement model ``H`` of shape ``(..., m, n)``.
+        measurement_noise: Measurement noise covariance ``R`` of shape ``(..., m, m)``.
+
+    Returns:
+        ``(state, covariance, gain, innovation_covariance, residual)``: the
+        posterior, the ``(..., n, m)`` Kalman gain ``K``, the ``(..., m, m)``
+        innovation covariance ``S`` and the ``(..., m)`` residual
+        ``z - H x``, which :func:`~tinyops.ops.signal.innovation_likelihood.innovation_likelihood`
+        scores against ``S``.
+
+    Raises:
+        ValueError: If the measurement model does not map the state size to
+            the measurement size.
+    """
+    size, measurement_size = state.shape[-1], measurement.shape[-1]
+    if measurement_matrix.shape[-2:] != (measurement_size, size):
+        raise ValueError(
+            f"measurement_matrix must have shape (..., {measurement_size}, {size}), got {measurement_matrix.shape}"
+        )
+
+    residual = measurement - (measurement_matrix @ state.unsqueeze(-1)).squeeze(-1)
+    return *kalman_correction(state, covariance, residual, measurement_matrix, measurement_noise), residual
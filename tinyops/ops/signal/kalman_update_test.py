@@ -0,0 +1,79 @@
+"""Pure-tinygrad tests for batched Kalman predict/update, scoring and smoothing (no reference libraries)."""
+
+import math
+
+import pytest
+from tinygrad import Tensor
+
+from tinyops._core import assert_close
+from tinyops.ops.signal.innovation_likelihood import innovation_likelihood
+from tinyops.ops.signal.kalman_predict import kalman_predict
+from tinyops.ops.signal.kalman_update import kalman_update
+from tinyops.ops.signal.rauch_tung_striebel_smoother import rauch_tung_striebel_smoother
+
+
+def test_scalar_filters_match_closed_form():
+    prior_state = Tensor([[1.0], [-2.0], [0.5]])
+    prior_variance = Tensor([[[2.0]], [[0.5]], [[4.0]]])
+    measurement = Tensor([[3.0], [0.0], [0.5]])
+    noise_variance = 1.5
+    state, covariance, gain, innovation_variance, residual = kalman_update(
+        prior_state, prior_variance, measurement, Tensor([[1.0]]), Tensor([[noise_variance]])
+    )
+    expected_gain = prior_variance[..., 0] / (prior_variance[..., 0] + noise_variance)
+    assert_close(state, prior_state + expected_gain * (measurement - prior_state), atol=1e-6, rtol=1e-6)
+    assert_close(covariance[..., 0], (1 - expected_gain) * prior_variance[..., 0], atol=1e-6, rtol=1e-6)
+    assert_close(gain[..., 0], expected_gain, atol=1e-6, rtol=1e-6)
+    assert_close(innovation_variance[..., 0], prior_variance[..., 0] + noise_variance, atol=1e-6, rtol=1e-6)
+    assert_close(residual, measurement - prior_state, atol=1e-6, rtol=1e-6)
+
+
+def test_predict_then_update_keeps_covariance_symmetric():
+    transition = Tensor([[1.0, 0.1, 0.0], [0.0, 1.0, 0.1], [0.0, 0.0, 1.0]])
+    state = Tensor([[0.0, 1.0, 0.5], [2.0, -1.0, 0.0]])
+    covariance = Tensor.eye(3).expand(2, 3, 3) * 3.0
+    state, covariance = kalman_predict(state, covariance, transition, Tensor.eye(3) * 0.01)
+    state, covariance, *_ = kalman_update(
+        state, covariance, Tensor([[0.3, 1.1], [1.9, -0.8]]), Tensor.eye(2, 3), Tensor.eye(2) * 0.2
+    )
+    assert state.shape == (2, 3)
+    assert_close(covariance, covariance.transpose(-1, -2), atol=1e-6, rtol=1e-6)
+
+
+def test_fading_memory_scales_propagated_covariance():
+    _, covariance = kalman_predict(
+        Tensor.zeros(2), Tensor.eye(2) * 2.0, Tensor.eye(2), Tensor.eye(2), fading_memory=1.5
+    )
+    assert_close(covariance, Tensor.eye(2) * (2.0 * 1.5**2 + 1.0), atol=1e-6, rtol=1e-6)
+
+
+def test_scalar_innovation_likelihood_matches_closed_form():
+    residual, variance = Tensor([[1.5], [-0.5]]), Tensor([[[2.0]], [[0.25]]])
+    log_likelihood, likelihood, mahalanobis_distance = innovation_likelihood(residual, variance)
+    variance_values, residual_values = variance[..., 0, 0], residual[..., 0]
+    expected = -0.5 * (math.log(2 * math.pi) + variance_values.log() + residual_values**2 / variance_values)
+    assert_close(log_likelihood, expected, atol=1e-6, rtol=1e-6)
+    assert_close(likelihood, expected.exp(), atol=1e-6, rtol=1e-6)
+    assert_close(mahalanobis_distance, residual_values.abs() / variance_values.sqrt(), atol=1e-6, rtol=1e-6)
+
+
+def test_smoother_of_static_state_averages_measurements():
+    # A constant scalar state without process noise: after filtering, every smoothed estimate is the full average.
+    states, covariances = Tensor([[1.0], [1.5], [2.0]]), Tensor([[[1.0]], [[0.5]], [[1.0 / 3]]])
+    identity = Tensor.eye(1).expand(3, 1, 1)
+    smoothed_states, smoothed_covariances, gains, _ = rauch_tung_striebel_smoother(
+        states, covariances, identity, identity * 0
+    )
+    assert_close(smoothed_states, Tensor.full((3, 1), 2.0), atol=1e-6, rtol=1e-6)
+    assert_close(smoothed_covariances, Tensor.full((3, 1, 1), 1.0 / 3), atol=1e-6, rtol=1e-6)
+    assert_close(gains[-1], Tensor.zeros(1, 1), atol=0)
+
+
+def test_invalid_measurement_matrix():
+    with pytest.raises(ValueError):
+        kalman_update(Tensor.zeros(3), Tensor.eye(3), Tensor.zeros(2), Tensor.eye(3), Tensor.eye(2))
+
+
+def test_control_requires_both_arguments():
+    with pytest.raises(ValueError):
+        kalman_predict(Tensor.zeros(2), Tensor.eye(2), Tensor.eye(2), Tensor.eye(2), control_matrix=Tensor.eye(2))
@@ -0,0 +1,85 @@
+from tinygrad import Tensor, dtypes
+from tinygrad.dtype import least_upper_dtype
+
+from tinyops.ops.signal._linear_recurrence import linear_recurrence_scan
+
+
+def linear_filter(
+    signal: Tensor,
+    numerator: Tensor,
+    denominator: Tensor,
+    initial_state: Tensor | None = None,
+) -> tuple[Tensor, Tensor]:
+    """Filter a signal with a rational transfer function ``B(z) / A(z)`` (FIR or IIR).
+
+    Evaluates the transposed direct form II difference equation
+    ``a[0] y[n] = sum_k b[k] x[n - k] - sum_{k >= 1} a[k] y[n - k]``
+    without a per-sample loop: its delay-line state follows the affine
+    recurrence ``z[n] = C z[n - 1] + g x[n]`` with the companion matrix
+    ``C`` of ``A``, which is solved by a parallel prefix scan of depth
+    ``O(log N)``. Leading axes are independent channels. The filter runs
+    in the promoted dtype of its inputs when that is a float dtype (so
+    float64 stays float64) and in ``float32`` otherwise.
+
+    Args:
+        signal: Input of shape ``(..., N)``.
+        numerator: Feedforward coefficients ``b`` of shape ``(..., Kb)``.
+        denominator: Feedback coefficients ``a`` of shape ``(..., Ka)``;
+            ``a[0]`` must be nonzero and both are divided by it. Leading
+            axes of the coefficients broadcast against those of *signal*,
+            so channels may share one filter or each have their own.
+        initial_state: Delay-line state of shape ``(..., order)`` with
+            ``order = max(Kb, Ka) - 1``. ``None`` starts at rest.
+
+    Returns:
+        ``(filtered, final_state)``: the output of shape ``(..., N)`` and
+        the delay-line state after the last sample, which continues the
+        filter on the next block. An empty signal leaves the state as it
+        was.
+
+    Raises:
+        ValueError: If a coefficient vector is empty or *initial_state*
+            does not have ``order`` entries.
+    """
+    if numerator.ndim < 1 or denominator.ndim < 1 or numerator.shape[-1] == 0 or denominator.shape[-1] == 0:
+        raise ValueError("numerator and denominator must have at least one coefficient")
+    order = max(numerator.shape[-1], denominator.shape[-1]) - 1
+    if initial_state is not None and initial_state.shape[-1:] != (order,):
+        raise ValueError(f"initial_state must have shape (..., {order}), got {initial_state.shape}")
+
+    dtype = least_upper_dtype(
+        *(tensor.dtype for tensor in (signal, numerator, denominator, initial_state) if tensor is not None)
+    )
+    dtype = dtype if dtypes.is_float(dtype) else dtypes.float32
+    numerator = numerator.cast(dtype).pad(((None,) * (numerator.ndim - 1)) + ((0, order + 1 - numerator.shape[-1]),))
+    denominator = denominator.cast(dtype).pad(
+        ((None,) * (denominator.ndim - 1)) + ((0, order + 1 - denominator.shape[-1]),)
+    )
+    leading = denominator[..., :1]
+    numerator, denominator = numerator / leading, denominator / leading
+    direct_gain = numerator[..., :1]
+    signal = signal.cast(dtype)
+    if order == 0:
+        return signal * direct_gain, (signal[..., :1] * direct_gain)[..., :0]
+
+    feedback = denominator[..., 1:]
+    # Companion matrix: z[n][i] = z[n - 1][i + 1] - a[i + 1] * y[n], with y[n] = b[0] x[n] + z[n - 1][0].
+    shift = Tensor.eye(order + 1, order, dtype=dtype, device=signal.device)[1:]
+    first_state = Tensor.eye(order, dtype=dtype, device=signal.device)[:1]
+    transition = shift - feedback.unsqueeze(-1) * first_state
+    input_gain = numerator[..., 1:] - feedback * direct_gain
+    inputs = signal.unsqueeze(-1) * input_gain.unsqueeze(-2)
+    rest = Tensor.zeros(*inputs.shape[:-2], order, dtype=dtype, device=signal.device)
+    if signal.shape[-1] == 0:
+        # Nothing to filter: the output is empty and the delay line is left as it was.
+        return signal * direct_gain, rest if initial_state is None else rest + initial_state.cast(dtype)
+    if initial_state is None:
+        initial_state = rest
+    else:
+        initial_state = initial_state.cast(dtype)
+        # Folding the initial state into the first input keeps the scan starting from rest.
+        carried = (transition @ initial_state.unsqueeze(-1)).squeeze(-1).unsqueeze(-2)
+        inputs = inputs + carried.pad(((None,) * (carried.ndim - 2)) + ((0, signal.shape[-1] - 1), None))
+    states = linear_recurrence_scan(transition, inputs)
+    previous_first_state = initial_state[..., :1].cat(states[..., :-1, 0], dim=-1)
+    return signal * direct_gain + previous_first_state, states[..., -1, :]
@@ -0,0 +1,90 @@
+"""Pure-tinygrad tests for scan-based IIR filtering (no reference libraries)."""
+
+import pytest
+from tinygrad import Tensor, dtypes
+
+from tinyops._core import assert_close
+from tinyops.ops.signal.convolution_1d import convolution_1d
+from tinyops.ops.signal.linear_filter import linear_filter
+from tinyops.ops.signal.second_order_sections_filter import second_order_sections_filter
+
+_SIGNAL = Tensor([[0.5, -1.0, 2.0, 0.25, -0.75, 1.5, 0.0, 1.0, -2.0, 0.5, 0.3, -0.1, 0.8]])
+
+
+def _sequential_filter(signal: list[float], numerator: list[float], denominator: list[float]) -> list[float]:
+    """Direct-form difference equation evaluated one sample at a time."""
+    output: list[float] = []
+    for index in range(len(signal)):
+        value = sum(b * signal[index - k] for k, b in enumerate(numerator) if index - k >= 0)
+        value -= sum(a * output[index - k] for k, a in enumerate(denominator[1:], 1) if index - k >= 0)
+        output.append(value / denominator[0])
+    return output
+
+
+def test_matches_difference_equation():
+    numerator, denominator = [0.2, 0.4, 0.2], [1.0, -0.5, 0.3, -0.1]
+    result, _ = linear_filter(_SIGNAL, Tensor(numerator), Tensor(denominator))
+    expected = _sequential_filter(_SIGNAL[0].tolist(), numerator, denominator)
+    assert_close(result[0], Tensor(expected), atol=1e-5, rtol=1e-5)
+
+
+def test_keeps_float64_and_promotes_integers():
+    numerator, denominator = [0.2, 0.4, 0.2], [1.0, -0.5, 0.3, -0.1]
+    result, final_state = linear_filter(
+        _SIGNAL.cast(dtypes.float64), Tensor(numerator, dtype=dtypes.float64), Tensor(denominator, dtype=dtypes.float64)
+    )
+    assert result.dtype == final_state.dtype == dtypes.float64
+    expected = _sequential_filter(_SIGNAL[0].tolist(), numerator, denominator)
+    assert_close(result[0], Tensor(expected, dtype=dtypes.float64), atol=1e-12, rtol=1e-12)
+    result, _ = linear_filter(Tensor([[1, 2, 3]]), Tensor([1, 1]), Tensor([1]))
+    assert result.dtype == dtypes.float32
+    assert_close(result, Tensor([[1.0, 3.0, 5.0]]), atol=0)
+
+
+def test_fir_matches_convolution():
+    kernel = Tensor([1.0, -0.5, 0.25])
+    result, _ = linear_filter(_SIGNAL, kernel, Tensor([1.0]))
+    expected = convolution_1d(_SIGNAL[0], kernel)[: _SIGNAL.shape[-1]]
+    assert_close(result[0], expected, atol=1e-6, rtol=1e-6)
+
+
+def test_final_state_continues_the_next_block():
+    numerator, denominator = Tensor([0.3, 0.1]), Tensor([1.0, -0.7, 0.2])
+    whole, _ = linear_filter(_SIGNAL, numerator, denominator)
+    first, state = linear_filter(_SIGNAL[:, :6], numerator, denominator)
+    second, _ = linear_filter(_SIGNAL[:, 6:], numerator, denominator, state)
+    assert_close(first.cat(second, dim=-1), whole, atol=1e-6, rtol=1e-6)
+
+
+def test_per_channel_coefficients():
+    signal = _SIGNAL.cat(_SIGNAL * 2, dim=0)
+    numerator, denominator = Tensor([[1.0, 0.0], [0.5, 0.5]]), Tensor([[1.0, -0.9], [1.0, 0.4]])
+    result, _ = linear_filter(signal, numerator, denominator)
+    for channel in range(2):
+        expected = _sequential_filter(
+            signal[channel].tolist(), numerator[channel].tolist(), denominator[channel].tolist()
+        )
+        assert_close(result[channel], Tensor(expected), atol=1e-5, rtol=1e-5)
+
+
+def test_sections_match_expanded_filter():
+    sections = Tensor([[0.2, 0.4, 0.2, 1.0, -0.5, 0.3], [1.0, -1.0, 0.0, 1.0, 0.1, 0.0]])
+    result, final_state = second_order_sections_filter(_SIGNAL, sections)
+    # (0.2 + 0.4z + 0.2z^2)(1 - z) over (1 - 0.5z + 0.3z^2)(1 + 0.1z), in powers of z^-1.
+    expected, _ = linear_filter(_SIGNAL, Tensor([0.2, 0.2, -0.2, -0.2]), Tensor([1.0, -0.4, 0.25, 0.03]))
+    assert_close(result, expected, atol=1e-5, rtol=1e-5)
+    assert final_state.shape == (2, 1, 2)
+
+
+def test_empty_signal_keeps_the_state():
+    result, final_state = linear_filter(Tensor.zeros(2, 0), Tensor([1.0, 0.5]), Tensor([1.0, -0.3]))
+    assert result.shape == (2, 0)
+    assert_close(final_state, Tensor.zeros(2, 1), atol=0)
+    state = Tensor([[0.25], [-1.0]])
+    _, final_state = linear_filter(Tensor.zeros(2, 0), Tensor([1.0, 0.5]), Tensor([1.0, -0.3]), state)
+    assert_close(final_state, state, atol=0)
+
+
+def test_invalid_initial_state():
+    with pytest.raises(ValueError):
+        linear_filter(_SIGNAL, Tensor([1.0, 0.5]), Tensor([1.0, -0.5, 0.1]), Tensor.zeros(1, 3))
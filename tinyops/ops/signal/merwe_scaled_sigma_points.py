@@ -18,9 +18,7 @@ def _compute_weights(
 
     rest_weights = Tensor.full((2 * dimension,), weight_rest, dtype=dtype, device=device)
     mean_weight_center_tensor = Tensor([mean_weight_center], dtype=dtype, device=device)
-    covariance_weight_center_tensor = Tensor(
-        [covariance_weight_center], dtype=dtype, device=device
-    )
+    covariance_weight_center_tensor = Tensor([covariance_weight_center], dtype=dtype, device=device)
 
     mean_weights = Tensor.cat(mean_weight_center_tensor, rest_weights, dim=0)
     covariance_weights = Tensor.cat(covariance_weight_center_tensor, rest_weights, dim=0)
@@ -37,9 +35,14 @@ def merwe_scaled_sigma_points(
 ) -> tuple[Tensor, Tensor, Tensor]:
     """Compute Merwe Scaled Sigma Points for the Unscented Kalman Filter.
 
+    A batch of filters is handled in one call: every covariance is
+    factored by a single batched Cholesky, with no per-filter or
+    per-column realization.
+
     Args:
-        state_mean: Mean vector of the state distribution, shape (n,).
-        covariance: Covariance matrix, shape (n, n).
+        state_mean: Mean vector of the state distribution, shape (n,), or
+            (B, n) for a batch of B filters.
+        covariance: Covariance matrix, shape (n, n), or (B, n, n).
         spread: Controls sigma point spread around the mean (alpha).
         prior_knowledge: Incorporates distribution knowledge (beta).
             For Gaussian distributions, 2 is optimal.
@@ -47,24 +50,21 @@ def merwe_scaled_sigma_points(
 
     Returns:
         A tuple of (sigma_points, mean_weights, covariance_weights):
-            - sigma_points: Shape (2n+1, n).
+            - sigma_points: Shape (2n+1, n), or (B, 2n+1, n).
             - mean_weights: Shape (2n+1,).
             - covariance_weights: Shape (2n+1,).
     """
-    dimension = state_mean.shape[0]
-
-    if state_mean.ndim == 2 and state_mean.shape[1] == 1:
+    if covariance.ndim == 2 and state_mean.ndim == 2 and state_mean.shape[1] == 1:
         state_mean = state_mean.squeeze(1)
+    dimension = state_mean.shape[-1]
 
     lambda_parameter = spread**2 * (dimension + secondary_scaling) - dimension
     scaled_covariance = covariance * (lambda_parameter + dimension)
-    lower_triangular = cholesky_decomposition(scaled_covariance)
-    upper_triangular = lower_triangular.T
-
-    sigma_plus = state_mean + upper_triangular
-    sigma_minus = state_mean - upper_triangular
+    # Rows of the upper factor are the offsets of the sigma points from the mean.
+    upper_triangular = cholesky_decomposition(scaled_covariance).transpose(-1, -2)
 
-    sigma_points = Tensor.cat(state_mean.unsqueeze(0), sigma_plus, sigma_minus, dim=0)
+    center = state_mean.unsqueeze(-2)
+    sigma_points = Tensor.cat(center, center + upper_triangular, center - upper_triangular, dim=-2)
 
     mean_weights, covariance_weights = _compute_weights(
         dimension, lambda_parameter, spread, prior_knowledge, state_mean.dtype, state_mean.device
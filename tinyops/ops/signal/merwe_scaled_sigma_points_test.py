@@ -0,0 +1,30 @@
+"""Pure-tinygrad tests for batched sigma points and the unscented transform (no reference libraries)."""
+
+from tinygrad import Tensor
+
+from tinyops._core import assert_close
+from tinyops.ops.signal._unscented_transform import unscented_transform
+from tinyops.ops.signal.merwe_scaled_sigma_points import merwe_scaled_sigma_points
+
+_MEANS = Tensor([[0.5, -1.0, 2.0], [1.0, 0.0, -0.5]])
+_COVARIANCES = Tensor(
+    [
+        [[2.0, 0.3, 0.1], [0.3, 1.0, -0.2], [0.1, -0.2, 0.5]],
+        [[1.0, 0.0, 0.4], [0.0, 3.0, 0.0], [0.4, 0.0, 1.0]],
+    ]
+)
+
+
+def test_batch_matches_single_filter_calls():
+    points, _, _ = merwe_scaled_sigma_points(_MEANS, _COVARIANCES, 0.5, 2.0, 1.0)
+    assert points.shape == (2, 7, 3)
+    for index in range(2):
+        expected, _, _ = merwe_scaled_sigma_points(_MEANS[index], _COVARIANCES[index], 0.5, 2.0, 1.0)
+        assert_close(points[index], expected, atol=1e-5, rtol=1e-5)
+
+
+def test_unscented_transform_round_trips_the_distribution():
+    points, mean_weights, covariance_weights = merwe_scaled_sigma_points(_MEANS, _COVARIANCES, 0.5, 2.0, 1.0)
+    mean, covariance = unscented_transform(points, mean_weights, covariance_weights)
+    assert_close(mean, _MEANS, atol=1e-5, rtol=1e-5)
+    assert_close(covariance, _COVARIANCES, atol=1e-4, rtol=1e-4)
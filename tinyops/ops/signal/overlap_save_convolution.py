@@ -0,0 +1,123 @@
+from tinygrad import Tensor
+from tinygrad.dtype import least_upper_dtype, least_upper_float
+
+from tinyops.ops.signal._direct_convolution import direct_convolution
+from tinyops.ops.signal._fast_fourier_transform import complex_multiply
+from tinyops.ops.signal._real_fourier_transform import real_forward_transform, real_inverse_transform
+from tinyops.ops.signal.convolution_method import ConvolutionMethod, resolve_convolution_method
+
+
+def _transform_length(block_length: int, kernel_length: int) -> int:
+    """Power of two that holds the carry and block, ``L + K - 1`` samples."""
+    return 1 << (block_length + kernel_length - 2).bit_length()
+
+
+def _kernel_spectrum(kernel: Tensor, transform_length: int) -> tuple[Tensor, Tensor]:
+    kernel = kernel.cast(least_upper_float(kernel.dtype))
+    kernel = kernel.pad((*((None,) * (kernel.ndim - 1)), (0, transform_length - kernel.shape[-1])))
+    return real_forward_transform(kernel)
+
+
+def overlap_save_kernel_spectrum(kernel: Tensor, block_length: int) -> tuple[Tensor, Tensor]:
+    """Realized kernel spectrum for :func:`overlap_save_convolution` on blocks of *block_length* samples.
+
+    The kernel of a stream rarely changes, so computing its spectrum once
+    and passing it as ``kernel_spectrum`` leaves each block with one
+    forward and one inverse FFT instead of two forward and one inverse.
+
+    Args:
+        kernel: Filter taps of shape ``(K,)`` or ``(..., K)``.
+        block_length: Number of new samples ``L`` per block.
+
+    Returns:
+        ``(real, imaginary)`` of shape ``(..., N // 2 + 1)`` in the kernel's
+        float dtype, where ``N`` is the power of two at or above ``L + K - 1``.
+
+    Raises:
+        ValueError: If the kernel is empty or *block_length* is not positive.
+    """
+    if kernel.shape[-1] == 0 or block_length <= 0:
+        raise ValueError(f"kernel cannot be empty and block_length must be positive, got {block_length}")
+    real, imaginary = _kernel_spectrum(kernel, _transform_length(block_length, kernel.shape[-1]))
+    return real.contiguous().realize(), imaginary.contiguous().realize()
+
+
+def overlap_save_convolution(
+    block: Tensor,
+    kernel: Tensor,
+    carry: Tensor,
+    method: ConvolutionMethod = ConvolutionMethod.AUTO,
+    kernel_spectrum: tuple[Tensor, Tensor] | None = None,
+) -> tuple[Tensor, Tensor]:
+    """Causally filter one block of a stream, given the input history carried from the previous block.
+
+    Output sample ``n`` of the block is ``sum_k kernel[k] * x[n - k]``, where
+    samples before the block come from *carry*, the last ``K - 1`` inputs
+    of the stream so far. Only those samples are kept between calls, so
+    every block costs the same as filtering ``L + K - 1`` samples, and all
+    shapes are fixed for a fixed block size: wrapped in ``TinyJit``, every
+    block replays the same kernels. The function is pure; keep the carry
+    in a caller-owned tensor (zeros at the start of the stream) and
+    ``assign`` the returned one after realizing both outputs.
+
+    ``FFT`` is overlap-save: the carry and block are transformed together
+    with one real FFT of the next power of two, multiplied by the kernel
+    spectrum, and the ``K - 1`` wrapped-around samples are discarded. The
+    kernel spectrum is recomputed on every call unless it is passed in from
+    :func:`overlap_save_kernel_spectrum`. ``DIRECT`` is a valid-mode
+    sliding product over the same window. Both run in the promoted float
+    dtype of the block, carry and kernel (``float32`` for integers), and the
+    new carry keeps it.
+
+    Args:
+        block: New input samples of shape ``(..., L)``.
+        kernel: Filter taps of shape ``(K,)`` shared by every channel, or
+            ``(..., K)`` with the leading shape of *block* for one kernel
+            per channel.
+        carry: The previous ``K - 1`` input samples, shape ``(..., K - 1)``.
+        method: Evaluation algorithm. ``AUTO`` picks ``FFT`` once the kernel
+            is at least
+            :data:`~tinyops.ops.signal.convolution_method.FFT_CONVOLUTION_CROSSOVER_LENGTH`
+            long.
+        kernel_spectrum: Spectrum of *kernel* from
+            :func:`overlap_save_kernel_spectrum` for this block length. Only
+            the ``FFT`` method reads it.
+
+    Returns:
+        ``(output, new_carry)`` of shapes ``(..., L)`` and ``(..., K - 1)``.
+
+    Raises:
+        ValueError: If the block or kernel is empty, or the kernel, carry or
+            kernel spectrum shape does not match the block.
+    """
+    block_length, kernel_length = block.shape[-1], kernel.shape[-1]
+    if block_length == 0 or kernel_length == 0:
+        raise ValueError("block and kernel cannot be empty")
+    if kernel.ndim > 1 and kernel.shape[:-1] != block.shape[:-1]:
+        raise ValueError(f"kernel must have shape (K,) or {(*block.shape[:-1], kernel_length)}, got {kernel.shape}")
+    if carry.shape != (*block.shape[:-1], kernel_length - 1):
+        raise ValueError(f"carry must have shape {(*block.shape[:-1], kernel_length - 1)}, got {carry.shape}")
+
+    dtype = least_upper_float(least_upper_dtype(block.dtype, carry.dtype, kernel.dtype))
+    window = carry.cast(dtype).cat(block.cast(dtype), dim=-1)
+    window_length = window.shape[-1]
+    new_carry = window[..., block_length:]
+
+    if resolve_convolution_method(method, window_length, kernel_length) == ConvolutionMethod.FFT:
+        transform_length = _transform_length(block_length, kernel_length)
+        if kernel_spectrum is None:
+            kernel_spectrum = _kernel_spectrum(kernel.cast(dtype), transform_length)
+        elif kernel_spectrum[0].shape[-1] != transform_length // 2 + 1:
+            raise ValueError(
+                f"kernel_spectrum must have {transform_length // 2 + 1} bins for blocks of {block_length} samples, "
+                f"got {kernel_spectrum[0].shape[-1]}"
+            )
+        window = window.pad((*((None,) * (window.ndim - 1)), (0, transform_length - window_length)))
+        product_real, product_imaginary = complex_multiply(*real_forward_transform(window), *kernel_spectrum)
+        # Circular wrap-around only reaches the first K - 1 samples, which belong to the carry.
+        circular = real_inverse_transform(product_real, product_imaginary, transform_length)
+        return circular[..., kernel_length - 1 : window_length], new_carry
+
+    channels = window.reshape(1, -1, window_length)
+    output = direct_convolution(channels, kernel.reshape(-1, kernel_length), (0, 0))
+    return output.reshape(*block.shape[:-1], block_length), new_carry
@@ -0,0 +1,78 @@
+"""Pure-tinygrad tests for streaming overlap-save convolution (no reference libraries)."""
+
+import pytest
+from tinygrad import Tensor, dtypes
+
+from tinyops._core import assert_close
+from tinyops.ops.signal.convolution_1d import convolution_1d
+from tinyops.ops.signal.convolution_method import ConvolutionMethod
+from tinyops.ops.signal.overlap_save_convolution import overlap_save_convolution, overlap_save_kernel_spectrum
+
+_BLOCK_LENGTH = 16
+_BLOCK_COUNT = 5
+
+
+def _stream(
+    signal: Tensor, kernel: Tensor, method: ConvolutionMethod, kernel_spectrum: tuple[Tensor, Tensor] | None = None
+) -> Tensor:
+    carry = Tensor.zeros(*signal.shape[:-1], kernel.shape[-1] - 1)
+    outputs = []
+    for start in range(0, signal.shape[-1], _BLOCK_LENGTH):
+        block = signal[..., start : start + _BLOCK_LENGTH]
+        output, carry = overlap_save_convolution(block, kernel, carry, method, kernel_spectrum)
+        outputs.append(output)
+    return Tensor.cat(*outputs, dim=-1)
+
+
+@pytest.mark.parametrize("method", [ConvolutionMethod.DIRECT, ConvolutionMethod.FFT])
+@pytest.mark.parametrize("kernel_length", [1, 5, 40])
+def test_blocks_match_causal_convolution(method, kernel_length):
+    signal = (Tensor.arange(_BLOCK_LENGTH * _BLOCK_COUNT) * 0.37).sin()
+    kernel = (Tensor.arange(kernel_length) * 0.9).cos()
+    expected = convolution_1d(signal, kernel)[: signal.shape[-1]]
+    assert_close(_stream(signal, kernel, method), expected, atol=1e-4, rtol=1e-4)
+
+
+@pytest.mark.parametrize("method", [ConvolutionMethod.DIRECT, ConvolutionMethod.FFT])
+def test_per_channel_kernels(method):
+    signal = (Tensor.arange(2 * _BLOCK_LENGTH * _BLOCK_COUNT).reshape(2, -1) * 0.21).sin()
+    kernel = Tensor([[1.0, -0.5, 0.25], [0.1, 0.2, 0.3]])
+    result = _stream(signal, kernel, method)
+    for channel in range(2):
+        expected = convolution_1d(signal[channel], kernel[channel])[: signal.shape[-1]]
+        assert_close(result[channel], expected, atol=1e-4, rtol=1e-4)
+
+
+@pytest.mark.parametrize("method", [ConvolutionMethod.DIRECT, ConvolutionMethod.FFT])
+def test_float64_stream_keeps_dtype(method):
+    signal = (Tensor.arange(_BLOCK_LENGTH * _BLOCK_COUNT, dtype=dtypes.float64) * 0.37).sin()
+    kernel = (Tensor.arange(40, dtype=dtypes.float64) * 0.9).cos()
+    carry = Tensor.zeros(39, dtype=dtypes.float64)
+    output, carry = overlap_save_convolution(signal[:_BLOCK_LENGTH], kernel, carry, method)
+    assert output.dtype == carry.dtype == dtypes.float64
+    expected = convolution_1d(signal, kernel, method=ConvolutionMethod.DIRECT)[: signal.shape[-1]]
+    assert_close(_stream(signal, kernel, method), expected, atol=1e-12, rtol=1e-12)
+
+
+def test_invalid_carry_shape():
+    with pytest.raises(ValueError):
+        overlap_save_convolution(Tensor.zeros(16), Tensor.ones(4), Tensor.zeros(4))
+
+
+@pytest.mark.parametrize("kernel_length", [5, 40])
+def test_precomputed_kernel_spectrum(kernel_length):
+    signal = (Tensor.arange(2 * _BLOCK_LENGTH * _BLOCK_COUNT).reshape(2, -1) * 0.29).sin()
+    kernel = (Tensor.arange(kernel_length) * 0.6).cos()
+    kernel_spectrum = overlap_save_kernel_spectrum(kernel, _BLOCK_LENGTH)
+    expected = _stream(signal, kernel, ConvolutionMethod.FFT)
+    assert_close(_stream(signal, kernel, ConvolutionMethod.FFT, kernel_spectrum), expected, atol=1e-5, rtol=1e-5)
+
+
+def test_kernel_spectrum_for_another_block_length():
+    kernel = Tensor.ones(4)
+    with pytest.raises(ValueError):
+        overlap_save_convolution(
+            Tensor.zeros(16), kernel, Tensor.zeros(3), ConvolutionMethod.FFT, overlap_save_kernel_spectrum(kernel, 64)
+        )
+    with pytest.raises(ValueError):
+        overlap_save_kernel_spectrum(kernel, 0)
@@ -0,0 +1,68 @@
+from tinygrad import Tensor
+
+from tinyops.ops.linear_algebra.cholesky_decomposition import cholesky_decomposition
+from tinyops.ops.linear_algebra.cholesky_solve import cholesky_solve
+
+
+def rauch_tung_striebel_smoother(
+    states: Tensor,
+    covariances: Tensor,
+    transitions: Tensor,
+    process_noises: Tensor,
+) -> tuple[Tensor, Tensor, Tensor, Tensor]:
+    """Smooth a batch of linear Kalman filter runs backwards in time.
+
+    Starting from the last filtered estimate, each step ``k`` re-predicts
+    ``P_p = F P_k F^T + Q`` with the model of step ``k + 1``, forms the
+    smoother gain ``K = P_k F^T P_p^-1`` by a batched Cholesky solve and
+    corrects ``x_k`` and ``P_k`` with the already smoothed step ``k + 1``.
+    The recursion is sequential in time but covers every filter of the
+    batch at once; each step is realized, so the graph stays one step deep
+    however long the run is.
+
+    Args:
+        states: Filtered state means of shape ``(steps, ..., n)``.
+        covariances: Filtered covariances of shape ``(steps, ..., n, n)``.
+        transitions: State transition ``F`` of every step, shape ``(steps, ..., n, n)``.
+        process_noises: Process noise covariance ``Q`` of every step, shape ``(steps, ..., n, n)``.
+
+    Returns:
+        ``(states, covariances, gains, predicted_covariances)`` with the
+        shapes of the inputs (``gains`` and ``predicted_covariances`` like
+        *covariances*). The last step keeps its filtered estimate, a zero
+        gain and its filtered covariance as the prediction.
+
+    Raises:
+        ValueError: If the states and covariances disagree in length or size.
+    """
+    step_count, size = states.shape[0], states.shape[-1]
+    if covariances.shape[0] != step_count:
+        raise ValueError(
+            f"states and covariances must have the same length, got {step_count} and {covariances.shape[0]}"
+        )
+    if covariances.shape[-2:] != (size, size):
+        raise ValueError(f"covariances must have shape (steps, ..., {size}, {size}), got {covariances.shape}")
+
+    smoothed_state, smoothed_covariance = states[-1], covariances[-1]
+    smoothed_states, smoothed_covariances = [smoothed_state], [smoothed_covariance]
+    gains, predicted_covariances = [smoothed_covariance.zeros_like()], [smoothed_covariance]
+    for step in range(step_count - 2, -1, -1):
+        transition, state, covariance = transitions[step + 1], states[step], covariances[step]
+        # P_k F^T is the transpose of F P_k because the covariance is symmetric.
+        propagated = transition @ covariance
+        predicted_covariance = propagated @ transition.transpose(-1, -2) + process_noises[step + 1]
+        gain = cholesky_solve(cholesky_decomposition(predicted_covariance), propagated).transpose(-1, -2)
+        predicted_state = (transition @ state.unsqueeze(-1)).squeeze(-1)
+        smoothed_state = state + (gain @ (smoothed_state - predicted_state).unsqueeze(-1)).squeeze(-1)
+        smoothed_covariance = covariance + gain @ (smoothed_covariance - predicted_covariance) @ gain.transpose(-1, -2)
+        Tensor.realize(smoothed_state, smoothed_covariance, gain, predicted_covariance)
+        smoothed_states.append(smoothed_state)
+        smoothed_covariances.append(smoothed_covariance)
+        gains.append(gain)
+        predicted_covariances.append(predicted_covariance)
+    return (
+        Tensor.stack(*reversed(smoothed_states)),
+        Tensor.stack(*reversed(smoothed_covariances)),
+        Tensor.stack(*reversed(gains)),
+        Tensor.stack(*reversed(predicted_covariances)),
+    )
@@ -2,35 +2,36 @@
 
 from tinygrad import Tensor, dtypes
 
-from tinyops.ops.signal.discrete_fourier_transform import discrete_fourier_transform
+from tinyops.ops.signal._real_fourier_transform import real_forward_transform
 
 
 def real_discrete_fourier_transform(real_signal: Tensor) -> Tensor:
-    """Compute the 1D DFT of a real-valued signal.
+    """Compute the 1D DFT of a real-valued signal along its last axis.
 
     Only the non-negative frequency bins are returned. For a length-``N``
     input this is ``N // 2 + 1`` complex bins, matching ``numpy.fft.rfft``.
+    Even lengths run a single complex FFT of length ``N / 2`` over the
+    packed even/odd samples instead of a zero-imaginary length-``N`` FFT.
+    Leading axes are batch axes, so ``(batch, frames, N)`` inputs are
+    transformed in one graph.
 
     Args:
-        real_signal: Real input tensor of shape ``(N,)``.
+        real_signal: Real input tensor of shape ``(..., N)``.
 
     Returns:
-        Spectrum tensor of shape ``(N // 2 + 1, 2)`` where the last axis is
-        ``(real, imaginary)``.
+        Spectrum tensor of shape ``(..., N // 2 + 1, 2)`` where the last axis
+        is ``(real, imaginary)``.
 
     Raises:
-        ValueError: If ``real_signal`` is not one-dimensional.
+        ValueError: If ``real_signal`` is zero-dimensional.
     """
-    if real_signal.ndim != 1:
-        raise ValueError(f"real_signal must be 1-D, got shape {real_signal.shape}")
+    if real_signal.ndim == 0:
+        raise ValueError(f"real_signal must be at least 1-D, got shape {real_signal.shape}")
 
-    sample_count = real_signal.shape[0]
+    batch_shape = real_signal.shape[:-1]
+    sample_count = real_signal.shape[-1]
     if sample_count == 0:
-        return Tensor.zeros(0, 2, dtype=dtypes.float32)
-
-    real_part = real_signal.cast(dtypes.float32)
-    imaginary_part = Tensor.zeros(sample_count, dtype=dtypes.float32)
-    complex_signal = Tensor.stack([real_part, imaginary_part], dim=1)
-    full_spectrum = discrete_fourier_transform(complex_signal)
-    non_negative_bin_count = sample_count // 2 + 1
-    return full_spectrum[:non_negative_bin_count]
+        return Tensor.zeros(*batch_shape, 0, 2, dtype=dtypes.float32)
+
+    real_part, imaginary_part = real_forward_transform(real_signal.cast(dtypes.float32))
+    return Tensor.stack([real_part, imaginary_part], dim=-1)
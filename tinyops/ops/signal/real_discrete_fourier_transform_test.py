@@ -47,9 +47,23 @@ def test_default_length_assumes_even():
         assert abs(float(left) - float(right)) < 1e-3
 
 
-def test_rejects_non_1d_input():
+def test_batched_frames_match_single_frames():
+    frames = [[[float((batch + 1) * index - frame) for index in range(6)] for frame in range(3)] for batch in range(2)]
+    spectrum = real_discrete_fourier_transform(Tensor(frames))
+    assert spectrum.shape == (2, 3, 4, 2)
+    spectrum_values = spectrum.numpy()
+    single_values = real_discrete_fourier_transform(Tensor(frames[1][2])).numpy()
+    for left, right in zip(spectrum_values[1, 2].flatten(), single_values.flatten()):
+        assert abs(float(left) - float(right)) < 1e-4
+    recovered = inverse_real_discrete_fourier_transform(spectrum).numpy()
+    assert recovered.shape == (2, 3, 6)
+    for left, right in zip(recovered.flatten(), Tensor(frames).numpy().flatten()):
+        assert abs(float(left) - float(right)) < 1e-3
+
+
+def test_rejects_scalar_input():
     try:
-        real_discrete_fourier_transform(Tensor([[1.0, 2.0], [3.0, 4.0]]))
+        real_discrete_fourier_transform(Tensor(1.0))
         raise AssertionError("expected ValueError")
     except ValueError as error:
         assert "1-D" in str(error)
@@ -0,0 +1,55 @@
+from tinygrad import Tensor
+
+from tinyops.ops.signal.linear_filter import linear_filter
+
+# Coefficients per section: three feedforward ``b`` followed by three feedback ``a``.
+SECOND_ORDER_SECTION_COEFFICIENT_COUNT = 6
+
+
+def second_order_sections_filter(
+    signal: Tensor,
+    sections: Tensor,
+    initial_state: Tensor | None = None,
+) -> tuple[Tensor, Tensor]:
+    """Filter a signal through a cascade of second-order IIR sections (biquads).
+
+    Each section runs :func:`~tinyops.ops.signal.linear_filter.linear_filter`
+    on the previous section's output, so the graph depth is
+    ``sections * O(log N)``. Factoring a high-order filter into biquads
+    keeps every recurrence well conditioned, which matters more in float32
+    than in direct form; prefer this over a single high-order
+    ``linear_filter`` for sharp or narrow-band designs.
+
+    Args:
+        signal: Input of shape ``(..., N)``.
+        sections: Section coefficients ``[b0, b1, b2, a0, a1, a2]`` of shape
+            ``(..., sections, 6)``; leading axes broadcast against those of
+            *signal*.
+        initial_state: Per-section delay-line state of shape
+            ``(sections, ..., 2)``. ``None`` starts every section at rest.
+
+    Returns:
+        ``(filtered, final_state)`` with shapes ``(..., N)`` and
+        ``(sections, ..., 2)``.
+
+    Raises:
+        ValueError: If *sections* does not have 6 coefficients per section
+            or *initial_state* does not have one state per section.
+    """
+    if sections.ndim < 2 or sections.shape[-1] != SECOND_ORDER_SECTION_COEFFICIENT_COUNT:
+        raise ValueError(f"sections must have shape (..., sections, 6), got {sections.shape}")
+    section_count = sections.shape[-2]
+    if initial_state is not None and initial_state.shape[0] != section_count:
+        raise ValueError(f"initial_state must have {section_count} sections, got shape {initial_state.shape}")
+
+    final_states = []
+    for section in range(section_count):
+        coefficients = sections[..., section, :]
+        signal, final_state = linear_filter(
+            signal,
+            coefficients[..., :3],
+            coefficients[..., 3:],
+            None if initial_state is None else initial_state[section],
+        )
+        final_states.append(final_state)
+    return signal, Tensor.stack(*final_states)
@@ -0,0 +1,71 @@
+"""Short-time Fourier transform over strided frames."""
+
+from enum import Enum
+
+from tinygrad import Tensor, dtypes
+
+from tinyops.ops.signal._short_time_fourier import frame_window, resolve_hop_length
+from tinyops.ops.signal.real_discrete_fourier_transform import real_discrete_fourier_transform
+
+
+class FramePaddingMode(Enum):
+    """How a waveform is extended by half a frame on each side when centering frames."""
+
+    CONSTANT = "constant"
+    REFLECT = "reflect"
+
+
+def short_time_fourier_transform(
+    waveform: Tensor,
+    frame_length: int,
+    hop_length: int | None = None,
+    window: Tensor | None = None,
+    center: bool = True,
+    padding_mode: FramePaddingMode = FramePaddingMode.REFLECT,
+) -> Tensor:
+    """Compute the one-sided short-time Fourier transform of a real waveform.
+
+    Frames are a strided ``unfold`` view of the (optionally padded)
+    waveform, so framing adds no copies. All frames are windowed and go
+    through a single batched real FFT, so the kernel count does not grow
+    with the number of frames. Matches ``torch.stft(..., onesided=True)``.
+
+    Args:
+        waveform: Real tensor of shape ``(..., time)``.
+        frame_length: FFT size ``n_fft`` and length of each frame.
+        hop_length: Samples between frame starts. Defaults to
+            ``frame_length // 4``.
+        window: 1-D window of at most ``frame_length`` samples, centered in
+            the frame. ``None`` means a rectangular window.
+        center: If True, pad ``frame_length // 2`` samples on both sides so
+            frame ``t`` is centered at sample ``t * hop_length``.
+        padding_mode: Padding used when *center* is True.
+
+    Returns:
+        Tensor of shape ``(..., frame_length // 2 + 1, frames, 2)`` where the
+        last axis is ``(real, imaginary)``.
+
+    Raises:
+        ValueError: If the waveform is zero-dimensional, lengths are not
+            positive, the window does not fit the frame, reflect padding is
+            wider than the waveform, or the waveform is shorter than a frame.
+    """
+    if waveform.ndim == 0:
+        raise ValueError(f"waveform must be at least 1-D, got shape {waveform.shape}")
+    hop_length = resolve_hop_length(frame_length, hop_length)
+    frame_window_values = frame_window(window, frame_length)
+
+    waveform = waveform.cast(dtypes.float32)
+    if center:
+        padding = frame_length // 2
+        if padding_mode == FramePaddingMode.REFLECT and padding >= waveform.shape[-1]:
+            raise ValueError(
+                f"reflect padding of {padding} samples needs a longer waveform, got {waveform.shape[-1]} samples"
+            )
+        batch_padding = (None,) * (waveform.ndim - 1)
+        waveform = waveform.pad((*batch_padding, (padding, padding)), mode=padding_mode.value)
+    if waveform.shape[-1] < frame_length:
+        raise ValueError(f"waveform has {waveform.shape[-1]} samples, fewer than frame_length={frame_length}")
+
+    frames = waveform.unfold(-1, frame_length, hop_length) * frame_window_values
+    return real_discrete_fourier_transform(frames).transpose(-3, -2)
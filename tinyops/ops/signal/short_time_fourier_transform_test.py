@@ -0,0 +1,50 @@
+"""Pure-tinygrad tests for the STFT and its inverse (no reference libraries)."""
+
+from tinygrad import Tensor
+
+from tinyops.ops.signal.hanning_window import hanning_window
+from tinyops.ops.signal.inverse_short_time_fourier_transform import inverse_short_time_fourier_transform
+from tinyops.ops.signal.short_time_fourier_transform import FramePaddingMode, short_time_fourier_transform
+
+
+def test_output_layout_is_frequency_then_frames():
+    spectrum = short_time_fourier_transform(Tensor.zeros(2, 40), frame_length=16, hop_length=4)
+    assert spectrum.shape == (2, 9, 11, 2)
+
+
+def test_constant_signal_has_only_dc_energy():
+    spectrum = short_time_fourier_transform(
+        Tensor.ones(32), frame_length=8, hop_length=8, center=False, padding_mode=FramePaddingMode.CONSTANT
+    ).numpy()
+    assert spectrum.shape == (5, 4, 2)
+    for frame_index in range(4):
+        assert abs(float(spectrum[0, frame_index, 0]) - 8.0) < 1e-4
+        for bin_index in range(1, 5):
+            assert abs(float(spectrum[bin_index, frame_index, 0])) < 1e-4
+            assert abs(float(spectrum[bin_index, frame_index, 1])) < 1e-4
+
+
+def test_inverse_recovers_waveform():
+    waveform = Tensor([[float((index * 7) % 11) - 5.0 for index in range(48)]])
+    window = hanning_window(16, symmetric=False)
+    spectrum = short_time_fourier_transform(waveform, frame_length=16, hop_length=4, window=window)
+    recovered = inverse_short_time_fourier_transform(spectrum, frame_length=16, hop_length=4, window=window, length=48)
+    assert recovered.shape == (1, 48)
+    for left, right in zip(recovered.numpy().flatten(), waveform.numpy().flatten()):
+        assert abs(float(left) - float(right)) < 1e-3
+
+
+def test_rejects_window_longer_than_frame():
+    try:
+        short_time_fourier_transform(Tensor.zeros(32), frame_length=8, window=Tensor.ones(9))
+        raise AssertionError("expected ValueError")
+    except ValueError as error:
+        assert "window" in str(error)
+
+
+def test_rejects_reflect_padding_wider_than_waveform():
+    try:
+        short_time_fourier_transform(Tensor.zeros(4), frame_length=16)
+        raise AssertionError("expected ValueError")
+    except ValueError as error:
+        assert "reflect" in str(error)
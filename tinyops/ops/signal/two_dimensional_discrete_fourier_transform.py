@@ -9,17 +9,19 @@ from tinyops.ops.signal.discrete_fourier_transform import discrete_fourier_trans
 def two_dimensional_discrete_fourier_transform(complex_image: Tensor) -> Tensor:
     """Compute the two-dimensional discrete Fourier transform.
 
-    Separable implementation: one-dimensional DFT along width, then height.
-    Matches ``numpy.fft.fft2`` for complex arrays packed as real/imag pairs.
+    Separable implementation: one batched one-dimensional DFT over all rows,
+    then one over all columns. Matches ``numpy.fft.fft2`` (last two axes) for
+    complex arrays packed as real/imag pairs.
 
     Args:
-        complex_image: Input tensor of shape ``(H, W, 2)`` where the last
-            dimension contains ``(real, imaginary)`` parts.
+        complex_image: Input tensor of shape ``(..., H, W, 2)`` where the
+            last dimension contains ``(real, imaginary)`` parts and leading
+            axes are batch axes.
 
     Returns:
-        DFT result tensor of shape ``(H, W, 2)``.
+        DFT result tensor of shape ``(..., H, W, 2)``.
 
     Raises:
-        ValueError: If ``complex_image`` is not shaped ``(H, W, 2)``.
+        ValueError: If ``complex_image`` is not shaped ``(..., H, W, 2)``.
     """
     return separable_two_dimensional_transform(complex_image, discrete_fourier_transform)
@@ -55,6 +55,19 @@ def test_roundtrip_small_shapes():
                 assert abs(float(recovered_values[row_index, column_index, 1])) < 1e-3
 
 
+def test_batched_images_match_single_images():
+    images = [
+        [[[float(image + row * 3 + column), float(column - row)] for column in range(3)] for row in range(2)]
+        for image in range(2)
+    ]
+    batched = two_dimensional_discrete_fourier_transform(Tensor(images)).numpy()
+    assert batched.shape == (2, 2, 3, 2)
+    for image_index, image in enumerate(images):
+        single = two_dimensional_discrete_fourier_transform(Tensor(image)).numpy()
+        for left, right in zip(batched[image_index].flatten(), single.flatten()):
+            assert abs(float(left) - float(right)) < 1e-4
+
+
 def test_rejects_wrong_rank():
     try:
         two_dimensional_discrete_fourier_transform(Tensor([[1.0, 0.0], [2.0, 0.0]]))
@@ -0,0 +1,108 @@
+"""Realized analysis windows shared by every caller with the same configuration."""
+
+from enum import Enum
+
+from tinygrad import Device, Tensor, dtypes
+from tinygrad.dtype import DType
+
+from tinyops.ops._lru_cache import CacheInfo, LeastRecentlyUsedCache
+from tinyops.ops.signal.blackman_window import blackman_window
+from tinyops.ops.signal.hamming_window import hamming_window
+from tinyops.ops.signal.hanning_window import hanning_window
+from tinyops.ops.signal.kaiser_window import kaiser_window
+
+# A window is at most a few thousand samples, so even a full cache stays small; the bound only
+# matters when window configurations are swept, e.g. over Kaiser betas in a filter design loop.
+DEFAULT_WINDOW_CACHE_SIZE = 128
+
+
+class WindowKind(Enum):
+    """Window families available from :func:`realized_window`."""
+
+    HANN = "hann"
+    HAMMING = "hamming"
+    BLACKMAN = "blackman"
+    KAISER = "kaiser"
+
+
+_COSINE_SUM_WINDOWS = {
+    WindowKind.HANN: hanning_window,
+    WindowKind.HAMMING: hamming_window,
+    WindowKind.BLACKMAN: blackman_window,
+}
+
+_window_cache: LeastRecentlyUsedCache[Tensor] = LeastRecentlyUsedCache(DEFAULT_WINDOW_CACHE_SIZE)
+
+
+def _build_window(
+    kind: WindowKind,
+    length: int,
+    symmetric: bool,
+    beta: float | None,
+    dtype: DType,
+    device: str,
+) -> Tensor:
+    if kind == WindowKind.KAISER:
+        window = kaiser_window(length, beta, symmetric=symmetric)
+    else:
+        window = _COSINE_SUM_WINDOWS[kind](length, symmetric=symmetric)
+    return window.to(device).cast(dtype).realize()
+
+
+def realized_window(
+    kind: WindowKind,
+    length: int,
+    symmetric: bool = True,
+    beta: float | None = None,
+    dtype: DType = dtypes.float32,
+    device: str | None = None,
+) -> Tensor:
+    """Return the realized window for this configuration, building it on the first request.
+
+    Windows are cached by ``(kind, length, beta, symmetric, dtype, device)``
+    so repeated STFT and filter-design calls reuse one buffer instead of
+    rebuilding the window graph. Treat the result as read-only.
+
+    Args:
+        kind: Window family.
+        length: Number of points in the window.
+        symmetric: If True, a symmetric window for filter design; if False,
+            a periodic window for spectral analysis.
+        beta: Kaiser shape parameter; required for ``WindowKind.KAISER`` and
+            must be None otherwise.
+        dtype: Dtype of the returned window.
+        device: Device of the returned window; ``None`` means the default device.
+
+    Returns:
+        Realized tensor of shape ``(length,)`` (empty if ``length < 1``).
+
+    Raises:
+        ValueError: If ``beta`` is missing for a Kaiser window or given for
+            another kind.
+    """
+    if (kind == WindowKind.KAISER) != (beta is not None):
+        raise ValueError(f"beta is required for a Kaiser window and not accepted for {kind}, got {beta}")
+    key = (kind, length, symmetric, None if beta is None else float(beta), dtype, Device.canonicalize(device))
+    return _window_cache.get(key, lambda: _build_window(*key))
+
+
+def window_cache_info() -> CacheInfo:
+    """Hit/miss counters and occupancy of the window cache."""
+    return _window_cache.info()
+
+
+def set_window_cache_size(maximum_size: int) -> None:
+    """Bound the window cache to *maximum_size* windows, evicting the least recently used.
+
+    Args:
+        maximum_size: New bound; ``0`` disables caching.
+
+    Raises:
+        ValueError: If ``maximum_size`` is negative.
+    """
+    _window_cache.resize(maximum_size)
+
+
+def clear_window_cache() -> None:
+    """Drop every cached window and reset the hit/miss counters."""
+    _window_cache.clear()
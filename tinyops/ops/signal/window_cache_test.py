@@ -0,0 +1,59 @@
+"""Pure-tinygrad tests for the shared window cache (no reference libraries)."""
+
+import pytest
+from tinygrad import dtypes
+
+from tinyops._core import assert_close
+from tinyops.ops.signal.hanning_window import hanning_window
+from tinyops.ops.signal.kaiser_window import kaiser_window
+from tinyops.ops.signal.window_cache import (
+    DEFAULT_WINDOW_CACHE_SIZE,
+    WindowKind,
+    clear_window_cache,
+    realized_window,
+    set_window_cache_size,
+    window_cache_info,
+)
+
+
+def test_repeated_requests_share_one_buffer():
+    clear_window_cache()
+    first = realized_window(WindowKind.HANN, 400, symmetric=False)
+    second = realized_window(WindowKind.HANN, 400, symmetric=False)
+    assert first is second
+    info = window_cache_info()
+    assert (info.hits, info.misses, info.current_size) == (1, 1, 1)
+
+
+def test_configuration_is_part_of_the_key():
+    clear_window_cache()
+    periodic = realized_window(WindowKind.HANN, 16, symmetric=False)
+    symmetric = realized_window(WindowKind.HANN, 16)
+    half = realized_window(WindowKind.HANN, 16, dtype=dtypes.float16)
+    assert periodic is not symmetric
+    assert half.dtype == dtypes.float16
+    assert realized_window(WindowKind.KAISER, 16, beta=5.0) is not realized_window(WindowKind.KAISER, 16, beta=6.0)
+    assert window_cache_info().current_size == 5
+    assert_close(periodic, hanning_window(16, symmetric=False))
+
+
+def test_kaiser_matches_kaiser_window():
+    assert_close(realized_window(WindowKind.KAISER, 33, beta=8.6), kaiser_window(33, 8.6))
+
+
+def test_beta_only_for_kaiser():
+    with pytest.raises(ValueError):
+        realized_window(WindowKind.KAISER, 16)
+    with pytest.raises(ValueError):
+        realized_window(WindowKind.HAMMING, 16, beta=5.0)
+
+
+def test_size_bounds_the_cache():
+    clear_window_cache()
+    set_window_cache_size(1)
+    try:
+        realized_window(WindowKind.HANN, 8)
+        realized_window(WindowKind.HAMMING, 8)
+        assert window_cache_info() == (0, 2, 1, 1)
+    finally:
+        set_window_cache_size(DEFAULT_WINDOW_CACHE_SIZE)
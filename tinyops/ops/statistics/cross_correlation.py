@@ -1,6 +1,10 @@
 from enum import Enum
 
 from tinygrad import Tensor
+from tinygrad.dtype import least_upper_dtype, least_upper_float
+
+from tinyops.ops.signal._fft_convolution import fft_linear_convolution
+from tinyops.ops.signal.convolution_method import ConvolutionMethod, resolve_convolution_method
 
 
 class CorrelationMode(Enum):
@@ -11,65 +15,107 @@ class CorrelationMode(Enum):
     FULL = "full"
 
 
-def _pad_signal_for_correlation(
-    signal: Tensor,
-    kernel_length: int,
-    mode: CorrelationMode,
-) -> tuple[Tensor, int]:
-    """Return (padded_signal, output_length) for the given correlation mode."""
-    signal_length = signal.shape[0]
+def _correlation_padding(kernel_length: int, mode: CorrelationMode) -> tuple[int, int]:
+    """Left/right zero padding of the signal that yields *mode*'s output.
 
+    SAME keeps the output centred like ``numpy.correlate``: the extra
+    sample for even kernels goes on the left.
+    """
     if mode == CorrelationMode.VALID:
-        if signal_length < kernel_length:
-            return signal, 0
-        return signal, signal_length - kernel_length + 1
-
+        return 0, 0
     if mode == CorrelationMode.SAME:
-        pad_left = (kernel_length - 1) // 2
-        pad_right = kernel_length - 1 - pad_left
-        padded_signal = Tensor.cat(Tensor.zeros(pad_left), signal, Tensor.zeros(pad_right))
-        return padded_signal, signal_length
-
+        return kernel_length // 2, (kernel_length - 1) // 2
     if mode == CorrelationMode.FULL:
-        padding = kernel_length - 1
-        padded_signal = Tensor.cat(Tensor.zeros(padding), signal, Tensor.zeros(padding))
-        return padded_signal, signal_length + kernel_length - 1
-
+        return kernel_length - 1, kernel_length - 1
     raise ValueError(f"Unknown mode: {mode}")
 
 
-def _sliding_dot_products(padded_signal: Tensor, kernel: Tensor, output_length: int) -> Tensor:
-    """Dot-product each contiguous window of *kernel* length with *kernel*."""
-    if output_length <= 0:
-        return Tensor([])
+def _batch_signal_and_kernel(signal: Tensor, kernel: Tensor) -> tuple[Tensor, Tensor, bool]:
+    """Return (signal, kernel, per_row_kernel) with *signal* as ``(B, N)`` and *kernel* as ``(B or 1, K)``."""
+    if signal.ndim not in (1, 2):
+        raise ValueError(f"signal must have shape (N,) or (B, N), got {signal.shape}")
+    if kernel.ndim not in (1, 2):
+        raise ValueError(f"kernel must have shape (K,) or (B, K), got {kernel.shape}")
+    if kernel.ndim == 2 and signal.ndim == 1:
+        raise ValueError("a batch of kernels needs a batch of signals")
 
-    kernel_length = kernel.shape[0]
-    segments = [(padded_signal[i : i + kernel_length] * kernel).sum() for i in range(output_length)]
-    if not segments:
-        return Tensor([])
-    return Tensor.stack(segments)
+    signal = signal.unsqueeze(0) if signal.ndim == 1 else signal
+    kernel = kernel.unsqueeze(0) if kernel.ndim == 1 else kernel
+    if kernel.shape[0] not in (1, signal.shape[0]):
+        raise ValueError(f"kernel batch {kernel.shape[0]} does not match signal batch {signal.shape[0]}")
+    return signal, kernel, kernel.shape[0] > 1
+
+
+def _sliding_dot_products(
+    signal: Tensor,
+    kernel: Tensor,
+    padding: tuple[int, int],
+    per_row_kernel: bool,
+) -> Tensor:
+    """Dot products of every *kernel*-length window of the padded *signal* as one ``conv2d``.
+
+    A shared kernel treats the rows as the conv batch; per-row kernels treat
+    them as channels of a grouped (depthwise) conv so row ``b`` only sees
+    kernel ``b``.
+    """
+    batch_size, signal_length = signal.shape
+    kernel_length = kernel.shape[-1]
+    if per_row_kernel:
+        windows = signal.reshape(1, batch_size, 1, signal_length)
+        weights = kernel.reshape(batch_size, 1, 1, kernel_length)
+        correlation = windows.conv2d(weights, groups=batch_size, padding=(*padding, 0, 0))
+    else:
+        windows = signal.reshape(batch_size, 1, 1, signal_length)
+        weights = kernel.reshape(1, 1, 1, kernel_length)
+        correlation = windows.conv2d(weights, padding=(*padding, 0, 0))
+    return correlation.reshape(batch_size, -1)
 
 
 def cross_correlation(
     signal: Tensor,
     kernel: Tensor,
     mode: CorrelationMode = CorrelationMode.VALID,
+    method: ConvolutionMethod = ConvolutionMethod.AUTO,
 ) -> Tensor:
-    """Cross-correlation of two 1-dimensional sequences.
+    """Cross-correlation of 1-dimensional sequences, optionally batched.
+
+    ``DIRECT`` evaluates every output lag in a single ``conv2d``; ``FFT``
+    evaluates the full correlation as a convolution with the reversed
+    kernel using overlap-add FFTs, then slices the requested mode. The FFT
+    runs in the promoted float dtype of the inputs (``float32`` for
+    integers), so float64 stays float64 at every length.
 
     Args:
-        signal: First 1D input tensor.
-        kernel: Second 1D input tensor.
+        signal: Input of shape ``(N,)`` or a batch of shape ``(B, N)``.
+        kernel: Kernel of shape ``(K,)``, shared by every row, or ``(B, K)``
+            with one kernel per row of a batched *signal*.
         mode: Output size mode (VALID, SAME, or FULL).
+        method: Evaluation algorithm. ``AUTO`` picks ``FFT`` once both
+            inputs are at least
+            :data:`~tinyops.ops.signal.convolution_method.FFT_CONVOLUTION_CROSSOVER_LENGTH`
+            long.
 
     Returns:
-        Cross-correlation result tensor.
+        Cross-correlation result of shape ``(L,)``, or ``(B, L)`` for a
+        batched *signal*.
 
     Raises:
-        ValueError: If inputs are not 1D.
+        ValueError: If the input shapes are not 1D/2D or their batch sizes
+            differ.
     """
-    if signal.ndim != 1 or kernel.ndim != 1:
-        raise ValueError("signal and kernel must be 1-dimensional")
-
-    padded_signal, output_length = _pad_signal_for_correlation(signal, kernel.shape[0], mode)
-    return _sliding_dot_products(padded_signal, kernel, output_length)
+    batch_shape = signal.shape[:-1]
+    signal, kernel, per_row_kernel = _batch_signal_and_kernel(signal, kernel)
+    signal_length, kernel_length = signal.shape[-1], kernel.shape[-1]
+    pad_left, pad_right = _correlation_padding(kernel_length, mode)
+    output_length = max(signal_length + pad_left + pad_right - kernel_length + 1, 0)
+
+    if output_length == 0 or signal_length == 0 or kernel_length == 0:
+        correlation = Tensor.zeros(signal.shape[0], output_length, dtype=signal.dtype, device=signal.device)
+    elif resolve_convolution_method(method, signal_length, kernel_length) == ConvolutionMethod.FFT:
+        dtype = least_upper_float(least_upper_dtype(signal.dtype, kernel.dtype))
+        full = fft_linear_convolution(signal.cast(dtype), kernel.cast(dtype).flip(-1))
+        start = kernel_length - 1 - pad_left
+        correlation = full[:, start : start + output_length]
+    else:
+        correlation = _sliding_dot_products(signal, kernel, (pad_left, pad_right), per_row_kernel)
+    return correlation.reshape(*batch_shape, output_length)
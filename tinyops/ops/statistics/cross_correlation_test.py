@@ -0,0 +1,45 @@
+"""Pure-tinygrad tests for batched cross-correlation (no reference libraries)."""
+
+import pytest
+from tinygrad import Tensor
+
+from tinyops._core import assert_close
+from tinyops.ops.statistics.cross_correlation import CorrelationMode, cross_correlation
+
+
+@pytest.mark.parametrize("mode", list(CorrelationMode))
+def test_shared_kernel_matches_rows(mode):
+    signals = Tensor.randn(3, 20)
+    kernel = Tensor.randn(4)
+    batched = cross_correlation(signals, kernel, mode=mode)
+    rows = Tensor.stack(*[cross_correlation(signals[row], kernel, mode=mode) for row in range(3)])
+    assert_close(batched, rows, atol=1e-5)
+
+
+@pytest.mark.parametrize("mode", list(CorrelationMode))
+def test_per_row_kernels_match_rows(mode):
+    signals = Tensor.randn(3, 20)
+    kernels = Tensor.randn(3, 5)
+    batched = cross_correlation(signals, kernels, mode=mode)
+    rows = Tensor.stack(*[cross_correlation(signals[row], kernels[row], mode=mode) for row in range(3)])
+    assert_close(batched, rows, atol=1e-5)
+
+
+def test_direct_path_is_one_kernel():
+    signals = Tensor.randn(4, 64).realize()
+    kernel = Tensor.randn(6).realize()
+    assert len(cross_correlation(signals, kernel, mode=CorrelationMode.SAME).schedule()) == 1
+
+
+def test_even_kernel_same_mode_is_centred_like_full():
+    signal = Tensor([0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+    kernel = Tensor([1.0, 2.0, 3.0, 4.0])
+    full = cross_correlation(signal, kernel, mode=CorrelationMode.FULL)
+    assert_close(cross_correlation(signal, kernel, mode=CorrelationMode.SAME), full[1:7])
+
+
+def test_mismatched_batches_raise():
+    with pytest.raises(ValueError):
+        cross_correlation(Tensor.randn(3, 10), Tensor.randn(2, 4))
+    with pytest.raises(ValueError):
+        cross_correlation(Tensor.randn(10), Tensor.randn(2, 4))